@@ -1,6 +1,6 @@
 from .advanced import Intersection, Projection
 from .calculus import Derivate, Integrate
-from .curves import Curve
+from .curves import Curve, CurveBatch
 from .functions import Function
 from .knotspace import GeneratorKnotVector, KnotVector
 
@@ -8,7 +8,6 @@ from typing import Any, Tuple
 import numpy as np
 
 from compmec.nurbs import heavy
-from compmec.nurbs.calculus import Derivate
 from compmec.nurbs.curves import Curve
 
 
@@ -20,7 +19,7 @@ class Projection:
 
     @staticmethod
     def __newton_point_on_curve(
-        point: Tuple[float], curves: Tuple[Curve], initparam: float
+        point: Tuple[float], curve: Curve, initparam: float
     ) -> float:
         """
         Returns the parameter ui from newton's iteration
@@ -29,12 +28,11 @@ class Projection:
 
         """
         tolerance1 = 1e-6
-        umin, umax = curves[0].knotvector.limits
+        umin, umax = curve.knotvector.limits
         niter = 0
         while True:
-            bezui = curves[0](initparam) - point
-            dbezui = curves[1](initparam)
-            ddbezui = curves[2](initparam)
+            bezui, dbezui, ddbezui = curve.derivatives(initparam, 2)
+            bezui = bezui - point
             upper = np.inner(dbezui, bezui)
             lower = np.inner(ddbezui, bezui)
             lower += np.inner(dbezui, dbezui)
@@ -54,13 +52,10 @@ class Projection:
         bezier(t*) is the near point
         """
         umin, umax = bezier.knotvector.limits
-        curves = [bezier]
-        curves.append(Derivate(curves[0]))
-        curves.append(Derivate(curves[1]))
         tparams = np.linspace(umin, umax, 5)
         tvalues = set()
         for tparam in tparams:
-            newt = Projection.__newton_point_on_curve(point, curves, tparam)
+            newt = Projection.__newton_point_on_curve(point, bezier, tparam)
             tvalues |= set(newt)
         return tuple(tvalues)
 
@@ -187,8 +182,8 @@ class Intersection:
     @staticmethod
     def __newton_bcurve_and_bcurve(
         pair: Tuple[float],
-        curvesa: Tuple[Curve],
-        curvesb: Tuple[Curve],
+        curvea: Curve,
+        curveb: Curve,
         limits: Tuple[float],
     ):
         """
@@ -200,12 +195,9 @@ class Intersection:
         tmin, tmax = limits[0]
         umin, umax = limits[1]
         for _ in range(10):
-            diff = curvesa[0].eval(pair[0])
-            dati = curvesa[1].eval(pair[0])
-            ddati = curvesa[2].eval(pair[0])
-            diff -= curvesb[0].eval(pair[1])
-            dbuj = curvesb[1].eval(pair[1])
-            ddbuj = curvesb[2].eval(pair[1])
+            diff, dati, ddati = curvea.derivatives(pair[0], 2)
+            buj, dbuj, ddbuj = curveb.derivatives(pair[1], 2)
+            diff = diff - buj
             grad = np.array([np.inner(dati, diff), -np.inner(dbuj, diff)])
             ggrad = np.zeros((2, 2), dtype="float64")
             ggrad[0, 0] = np.inner(ddati, diff)
@@ -253,12 +245,6 @@ class Intersection:
         if not Intersection._inse_retangle(beziera.ctrlpoints, bezierb.ctrlpoints):
             return tuple()
 
-        curvesa = [beziera]
-        curvesa.append(Derivate(curvesa[0]))
-        curvesa.append(Derivate(curvesa[1]))
-        curvesb = [bezierb]
-        curvesb.append(Derivate(curvesb[0]))
-        curvesb.append(Derivate(curvesb[1]))
         dega, degb = beziera.degree, bezierb.degree
         nsma, nsmb = dega + 1, degb + 1  # Number of samples
         uamin, uamax = beziera.knotvector.limits
@@ -274,7 +260,7 @@ class Intersection:
                 # Newton's iteration
                 pair = np.array((nodea, nodeb), dtype="float64")
                 pair = Intersection.__newton_bcurve_and_bcurve(
-                    pair, curvesa, curvesb, limits
+                    pair, beziera, bezierb, limits
                 )
                 if len(pair) != 0:
                     pairs |= set((pair,))
@@ -282,7 +268,7 @@ class Intersection:
             return tuple()
         pairs = tuple(pairs)
         pairs = Intersection.filter_pairs(pairs)
-        pairs = Intersection.pairs_min_distance(pairs, curvesa[0], curvesb[0])
+        pairs = Intersection.pairs_min_distance(pairs, beziera, bezierb)
         return heavy.totuple(pairs)
 
     @staticmethod
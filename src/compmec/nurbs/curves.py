@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from copy import copy
 from fractions import Fraction
-from typing import Any, Callable, Optional, Tuple, Union
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 import numpy as np
 
@@ -28,10 +30,325 @@ def norm(object: Union[float, Tuple[float]], L: int = 0) -> float:
         return abs(object)
 
 
+def weight_points(weights: Tuple[float], ctrlpoints: Tuple[Any]) -> np.ndarray:
+    """
+    Multiplies each control point by its weight, giving the numerators
+    of the homogeneous coordinates. The points can be numbers, tuples,
+    arrays or any object that accepts the multiplication by a scalar
+    """
+    points = np.asarray(ctrlpoints)
+    weights = np.asarray(weights)
+    return weights.reshape((-1,) + (1,) * (points.ndim - 1)) * points
+
+
+def verify_weights(
+    knotvector: heavy.ImmutableKnotVector, weights: Tuple[float]
+) -> Tuple[float]:
+    """
+    Verifies if the weights are numbers whose denominator function
+    has no roots, giving them as a tuple. Raises ValueError if not
+    """
+    try:
+        weights = tuple(weights)
+        for weight in weights:
+            float(weight)
+    except TypeError:
+        msg = f"Weights must be a vector of floats, received {weights}"
+        raise ValueError(msg)
+    # Verify if there's roots. Weights with the same sign don't
+    # have roots, since the curve is a convex combination of them
+    floats = np.array(weights, dtype="float64")
+    samesign = np.all(floats > 0) or np.all(floats < 0)
+    roots = () if samesign else heavy.find_roots(knotvector, weights)
+    if roots:
+        error_msg = f"Zero division at nodes {roots}"
+        raise ValueError(error_msg)
+    return weights
+
+
+CHUNK_SIZE = 4096  # Default number of nodes by chunk of iter_eval
+
+
+def iter_chunks(
+    nodes: Iterable[float], chunk_size: int = CHUNK_SIZE
+) -> Iterator[Union[np.ndarray, Tuple[float]]]:
+    """
+    Splits the nodes in chunks of at most chunk_size nodes.
+    A 1D view of a numpy array gives slices, any other iterable
+    is consumed lazily, giving tuples
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f"chunk_size = {chunk_size}")
+    if isinstance(nodes, np.ndarray):
+        nodes = nodes.reshape(-1)
+        for start in range(0, len(nodes), chunk_size):
+            yield nodes[start : start + chunk_size]
+        return
+    iterator = iter(nodes)
+    while True:
+        chunk = tuple(islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+class CompiledCurve:
+    """Frozen evaluator of a curve, made by ``Curve.compile``
+
+    It stores, for each interval between two consecutive knots,
+    the polynomial of the curve with the control points already
+    multiplied by the basis functions' coefficients.
+    A rational curve keeps the numerator and the denominator.
+
+    It does not follow the changes made on the original curve,
+    call ``Curve.compile`` again to get an updated evaluator.
+
+    Example use
+    -----------
+
+    >>> from compmec.nurbs import Curve
+    >>> curve = Curve([0, 0, 0.5, 1, 1], [1, 2, -3])
+    >>> evaluator = curve.compile()
+    >>> evaluator(0.2)
+    1.4
+    >>> evaluator([0, 0.5, 1])
+    (1.0, 2.0, -3.0)
+
+    """
+
+    __slots__ = ("__knotvector", "__numerator", "__denominator")
+
+    def __init__(
+        self,
+        knotvector: KnotVector,
+        ctrlpoints: Tuple[Any],
+        weights: Optional[Tuple[float]] = None,
+    ):
+        knotvector = heavy.ImmutableKnotVector(knotvector)
+        if weights is None:
+            numerator = heavy.piecewise_coefficients(knotvector, ctrlpoints)
+            denominator = None
+        else:
+            ctrlpoints = weight_points(weights, ctrlpoints)
+            numerator = heavy.piecewise_coefficients(knotvector, ctrlpoints)
+            denominator = heavy.piecewise_coefficients(knotvector, weights)
+        self.__knotvector = knotvector
+        self.__numerator = numerator
+        self.__denominator = denominator
+
+    def __call__(self, nodes: Union[float, Tuple[float]]) -> Union[Any, Tuple[Any]]:
+        return self.eval(nodes)
+
+    @property
+    def knotvector(self) -> heavy.ImmutableKnotVector:
+        """The knotvector used to compile the curve"""
+        return self.__knotvector
+
+    def eval(
+        self,
+        nodes: Union[float, Tuple[float]],
+        out: Optional[np.ndarray] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Union[Any, Tuple[Any]]:
+        """Point evaluation function, same as ``Curve.eval``
+
+        If ``workers`` or ``executor`` are given and the knots, the nodes
+        and the control points are floats, the nodes are evaluated
+        by chunks in many processes, see ``heavy.parallel_piecewise``
+
+        :param nodes: The nodes to evaluates
+        :type nodes: float | tuple[float]
+        :param out: Array of shape ``(len(nodes), *pointshape)`` to store the result
+        :type out: None | numpy.ndarray(, optional)
+        :param workers: The number of processes, or the CPUs if ``None``.
+            The nodes are split in ``4 * workers`` chunks, defaults to ``None``
+        :type workers: None | int(, optional)
+        :param executor: A pool of processes, defaults to ``None``
+        :type executor: None | concurrent.futures.Executor(, optional)
+        :raises ValueError: If at least node is outside ``[umin, umax]``
+        :return: The point computed by using the stored polynomials
+        :rtype: Any | tuple[Any] | numpy.ndarray
+        """
+        onevalue = False
+        if not isinstance(nodes, np.ndarray) or nodes.ndim != 1:
+            try:
+                nodes = tuple(nodes)
+            except TypeError:
+                nodes = (nodes,)
+                onevalue = True
+        if (workers is None and executor is None) or not self.__isfloat(nodes):
+            result = self.__eval(nodes)
+        else:
+            numer, denom = self.__numerator, self.__denominator
+            result = heavy.parallel_piecewise(
+                self.__knotvector, numer, denom, nodes, workers, executor
+            )
+        if out is not None:
+            out[:] = result
+            return out
+        return result[0] if onevalue else tuple(result)
+
+    def __isfloat(self, nodes: Tuple[float]) -> bool:
+        """
+        Tells if the evaluation can be made only with float64 arrays
+        """
+        for coefs in (self.__numerator, self.__denominator):
+            if coefs is not None and coefs.dtype.kind not in "iuf":
+                return False
+        return heavy.is_float(self.__knotvector, nodes)
+
+    def __eval(self, nodes: Tuple[float]) -> np.ndarray:
+        """
+        Private method to evaluate the curve at given 1D array of nodes
+        result.shape = (len(nodes), *pointshape)
+        """
+        location = heavy.locate_nodes(self.__knotvector, nodes)
+        result = heavy.piecewise_horner(self.__numerator, location)
+        if self.__denominator is not None:
+            denoms = heavy.piecewise_horner(self.__denominator, location)
+            result = result / denoms.reshape((-1,) + (1,) * (result.ndim - 1))
+        return result
+
+    def iter_eval(
+        self, nodes: Iterable[float], chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[np.ndarray]:
+        """Evaluates the curve by chunks, same as ``Curve.iter_eval``
+
+        :param nodes: The nodes to evaluate, any iterable of numbers
+        :type nodes: Iterable[float]
+        :param chunk_size: The maximum number of nodes by chunk, defaults to ``4096``
+        :type chunk_size: int(, optional)
+        :raises ValueError: If at least node is outside ``[umin, umax]``
+        :return: Generator of arrays of shape ``(nchunk, *pointshape)``
+        :rtype: Iterator[numpy.ndarray]
+        """
+        for chunk in iter_chunks(nodes, chunk_size):
+            yield self.__eval(chunk)
+
+    def __forward(
+        self, starts: np.ndarray, steps: np.ndarray, counts: np.ndarray
+    ) -> np.ndarray:
+        """
+        Private method to evaluate the curve at uniform nodes on each
+        interval by forward differences, see ``heavy.forward_differences``
+        result.shape = (sum(counts), *pointshape)
+        """
+        result = heavy.forward_differences(self.__numerator, starts, steps, counts)
+        if self.__denominator is not None:
+            denoms = heavy.forward_differences(
+                self.__denominator, starts, steps, counts
+            )
+            result = result / denoms.reshape((-1,) + (1,) * (result.ndim - 1))
+        return result
+
+    def eval_grid(self, umin: float, umax: float, npts: int) -> np.ndarray:
+        """Evaluates the curve at equally spaced nodes, same as
+        ``Curve.eval_grid``
+
+        :param umin: The first node
+        :type umin: float
+        :param umax: The last node
+        :type umax: float
+        :param npts: The number of nodes
+        :type npts: int
+        :raises ValueError: If the nodes are outside ``[knots[0], knots[-1]]``
+        :return: The array of shape ``(npts, *pointshape)``
+        :rtype: numpy.ndarray
+        """
+        if not isinstance(npts, int) or npts < 1:
+            raise ValueError(f"npts = {npts}")
+        if umax < umin:  # Decreasing nodes: evaluates the increasing ones
+            return np.flip(self.eval_grid(umax, umin, npts), axis=0)
+        knots = np.array(self.__knotvector.knots, dtype="float64")
+        umin, umax = float(umin), float(umax)
+        if umin < knots[0] or knots[-1] < umax:
+            raise ValueError("Nodes outside the knotvector limits")
+        if npts == 1 or umin == umax:
+            return np.array(self.__eval(np.full(npts, umin)), dtype="float64")
+        # The node n = umin + n * step is in the interval z if
+        # firsts[z] <= n < firsts[z+1], found without searching the nodes
+        step = (umax - umin) / (npts - 1)
+        firsts = np.ceil((knots[1:-1] - umin) / step).astype("int64")
+        firsts = np.concatenate(([0], np.clip(firsts, 0, npts), [npts]))
+        lengths = knots[1:] - knots[:-1]
+        starts = (umin + firsts[:-1] * step - knots[:-1]) / lengths
+        return self.__forward(starts, step / lengths, np.diff(firsts))
+
+    def eval_uniform(self, npts_per_span: int) -> Tuple[np.ndarray]:
+        """Evaluates the curve at equally spaced nodes inside each
+        interval, same as ``Curve.eval_uniform``
+
+        :param npts_per_span: The number of nodes by interval
+        :type npts_per_span: int
+        :return: The pair ``(nodes, points)`` of arrays
+        :rtype: tuple[numpy.ndarray]
+        """
+        if not isinstance(npts_per_span, int) or npts_per_span < 1:
+            raise ValueError(f"npts_per_span = {npts_per_span}")
+        knots = np.array(self.__knotvector.knots, dtype="float64")
+        nsegs = len(knots) - 1
+        starts = np.zeros(nsegs, dtype="float64")
+        steps = np.full(nsegs, 1 / npts_per_span, dtype="float64")
+        counts = np.full(nsegs, npts_per_span, dtype="int64")
+        points = self.__forward(starts, steps, counts)
+        points = np.concatenate((points, self.__eval(knots[-1:])))
+        shifnodes = np.arange(npts_per_span) / npts_per_span
+        lengths = knots[1:] - knots[:-1]
+        nodes = knots[:-1, None] + lengths[:, None] * shifnodes
+        nodes = np.concatenate((nodes.reshape(-1), knots[-1:]))
+        return nodes, points
+
+    def derivatives(
+        self, nodes: Union[float, Tuple[float]], times: int = 1
+    ) -> Tuple[Union[Any, Tuple[Any]]]:
+        """Evaluates the curve and its first derivatives, same as
+        ``Curve.derivatives``
+
+        :param nodes: The nodes to evaluates
+        :type nodes: float | tuple[float]
+        :param times: The maximum order of derivative, defaults to ``1``
+        :type times: int(, optional)
+        :raises ValueError: If at least node is outside ``[umin, umax]``
+        :return: The values ``(C, C', ..., C^(times))`` at the nodes
+        :rtype: tuple[Any] | tuple[tuple[Any]]
+        """
+        if not isinstance(times, int) or times < 0:
+            raise ValueError(f"times = {times}")
+        try:
+            nodes = tuple(nodes)
+            onevalue = False
+        except TypeError:
+            nodes = (nodes,)
+            onevalue = True
+        location = heavy.locate_nodes(self.__knotvector, nodes)
+        results = [
+            heavy.piecewise_horner(self.__numerator, location, k)
+            for k in range(times + 1)
+        ]
+        if self.__denominator is not None:
+            # Leibniz rule on A = w * C gives
+            # C^(k) = (A^(k) - sum_{i=1}^{k} binom(k, i) * w^(i) * C^(k-i)) / w
+            shape = (-1,) + (1,) * (results[0].ndim - 1)
+            denoms = [
+                heavy.piecewise_horner(self.__denominator, location, k).reshape(shape)
+                for k in range(times + 1)
+            ]
+            for k in range(times + 1):
+                for i in range(1, k + 1):
+                    comb = heavy.Math.comb(k, i)
+                    results[k] = results[k] - comb * denoms[i] * results[k - i]
+                results[k] = results[k] / denoms[0]
+        if onevalue:
+            return tuple(result[0] for result in results)
+        return tuple(tuple(result) for result in results)
+
+
 class BaseCurve(Intface_BaseCurve):
     def __init__(self, knotvector: KnotVector):
         self.__ctrlpoints = None
         self.__weights = None
+        self.__compiled = None
         self.__knotvector = KnotVector(knotvector)
 
     def __call__(self, nodes: np.ndarray) -> np.ndarray:
@@ -77,11 +394,11 @@ class BaseCurve(Intface_BaseCurve):
         if self.knotvector.limits != other.knotvector.limits:
             raise ValueError
         if self.weights is None and other.weights is None:
-            vecta, vectb = tuple(self.knotvector), tuple(other.knotvector)
+            vecta, vectb = self.knotvector.internal, other.knotvector.internal
             matra, matrb = heavy.MathOperations.add_spline_curve(vecta, vectb)
             curve = Curve(self.knotvector | other.knotvector)
-            ctrlpoints = np.array(matra) @ self.ctrlpoints
-            ctrlpoints += np.array(matrb) @ other.ctrlpoints
+            ctrlpoints = matra @ self.ctrlpoints
+            ctrlpoints += matrb @ other.ctrlpoints
             curve.ctrlpoints = ctrlpoints
             return curve
         numa, dena = self.fraction()
@@ -107,7 +424,7 @@ class BaseCurve(Intface_BaseCurve):
         if self.knotvector.limits != other.knotvector.limits:
             raise ValueError
         if self.weights is None and other.weights is None:
-            vecta, vectb = tuple(self.knotvector), tuple(other.knotvector)
+            vecta, vectb = self.knotvector.internal, other.knotvector.internal
             vectmul = heavy.MathOperations.knotvector_mul(vecta, vectb)
             matrix3d = heavy.MathOperations.mul_spline_curve(vecta, vectb)
             ctrlpoints = np.tensordot(
@@ -138,7 +455,7 @@ class BaseCurve(Intface_BaseCurve):
         if self.knotvector.limits != other.knotvector.limits:
             raise ValueError
         if self.weights is None and other.weights is None:
-            vecta, vectb = tuple(self.knotvector), tuple(other.knotvector)
+            vecta, vectb = self.knotvector.internal, other.knotvector.internal
             vectmul = heavy.MathOperations.knotvector_mul(vecta, vectb)
             matrix3d = heavy.MathOperations.mul_spline_curve(vecta, vectb)
             matrix2d = [
@@ -181,8 +498,8 @@ class BaseCurve(Intface_BaseCurve):
             vectorc = tuple(copyse.knotvector | copyot.knotvector)
             transctrlpts = heavy.Operations.matrix_transformation(vectora, vectorc)
             transweights = heavy.Operations.matrix_transformation(vectorb, vectorc)
-            weights = np.dot(transweights, copyot.ctrlpoints)
-            ctrlpts = np.dot(transctrlpts, copyse.ctrlpoints)
+            weights = transweights @ copyot.ctrlpoints
+            ctrlpts = transctrlpts @ copyse.ctrlpoints
             ctrlpts = [pti / wi for pti, wi in zip(ctrlpts, weights)]
             return self.__class__(vectorc, ctrlpts, weights)
 
@@ -375,26 +692,15 @@ class BaseCurve(Intface_BaseCurve):
 
     @weights.setter
     def weights(self, value: Tuple[float]):
+        self.__compiled = None
         if value is None:
             self.__weights = None
             return
-        try:
-            value = tuple(value)
-            for val in value:
-                float(val)
-        except TypeError:
-            msg = f"Weights must be a vector of floats, received {value}"
-            raise ValueError(msg)
-        # Verify if there's roots
-        vector = tuple(self.knotvector)
-        roots = heavy.find_roots(vector, value)
-        if roots:
-            error_msg = f"Zero division at nodes {roots}"
-            raise ValueError(error_msg)
-        self.__weights = tuple(value)
+        self.__weights = verify_weights(self.knotvector.internal, value)
 
     @ctrlpoints.setter
     def ctrlpoints(self, newpoints: np.ndarray):
+        self.__compiled = None
         if newpoints is None:
             self.__ctrlpoints = None
             return
@@ -404,11 +710,11 @@ class BaseCurve(Intface_BaseCurve):
             iter(newpoints)
         except Exception:
             raise TypeError
+        knots = {type(knot): knot for knot in self.knotvector.knots}.values()
         for point in newpoints:  # Verify if operations are valid for each node
-            for knot in self.knotvector.knots:
+            for knot in knots:  # One knot of each type is enough
                 knot * point
-            for otherpoint in newpoints:
-                point + otherpoint  # Verify if we can sum every point, same type
+            point + newpoints[0]  # Verify if we can sum every point, same type
 
         if len(newpoints) != self.npts:
             error_msg = f"The number of control points ({len(newpoints)}) must be "
@@ -466,10 +772,46 @@ class BaseCurve(Intface_BaseCurve):
         ctrlpoints = [copy(point) for point in self.ctrlpoints]
         numerator = self.__class__(copy(self.knotvector))
         denominator = self.__class__(copy(self.knotvector))
-        numerator.ctrlpoints = [wi * pt for wi, pt in zip(self.weights, ctrlpoints)]
+        numerator.ctrlpoints = weight_points(self.weights, ctrlpoints)
         denominator.ctrlpoints = self.weights
         return numerator, denominator
 
+    def compile(self) -> CompiledCurve:
+        """Gives a frozen evaluator of the curve
+
+        The polynomial of each interval is computed only once, with the
+        control points already multiplied by the basis coefficients.
+        Then each evaluation only needs to find the interval
+        and to apply horner's method: useful to evaluate
+        the same curve many times.
+
+        The evaluator is kept while the knotvector, the control
+        points and the weights are not changed
+
+        :raises ValueError: If there are no control points
+        :return: The compiled evaluator
+        :rtype: CompiledCurve
+
+        Example use
+        -----------
+
+        >>> from compmec.nurbs import Curve
+        >>> curve = Curve([0, 0, 0.5, 1, 1], [1, 2, -3])
+        >>> evaluator = curve.compile()
+        >>> evaluator([0, 0.2, 0.5, 1])
+        (1.0, 1.4, 2.0, -3.0)
+
+        """
+        if self.ctrlpoints is None:
+            error_msg = "Cannot compile: There are no control points"
+            raise ValueError(error_msg)
+        compiled = self.__compiled
+        vector = self.knotvector.internal
+        if compiled is None or compiled.knotvector is not vector:
+            compiled = CompiledCurve(vector, self.ctrlpoints, self.weights)
+            self.__compiled = compiled
+        return compiled
+
     def update(
         self,
         newknotvector: KnotVector,
@@ -515,12 +857,19 @@ class BaseCurve(Intface_BaseCurve):
         self.ctrlpoints = temp_curve.ctrlpoints
         self.weights = temp_curve.weights
 
-    def apply(self, newknotvector: KnotVector, matrix: Tuple[Tuple[float]]):
+    def apply(
+        self,
+        newknotvector: KnotVector,
+        matrix: Union[heavy.SparseMatrix, Tuple[Tuple[float]]],
+    ):
         """Applies the linear transformation for every control point
 
         new ctrlpoints = matrix @ old ctrlpoints
         new weights = matrix @ old weights
 
+        A dense matrix is converted into a ``heavy.SparseMatrix``,
+        such the cost is proportional to the number of non-zero values
+
         Example use
         -----------
 
@@ -540,27 +889,21 @@ class BaseCurve(Intface_BaseCurve):
         if oldctrlpoints is None and oldweights is None:
             self.knotvector = newknotvector
             return
+        if not isinstance(matrix, heavy.SparseMatrix):
+            matrix = heavy.SparseMatrix.from_dense(matrix)
         self.ctrlpoints = None
         self.weights = None
         self.knotvector = newknotvector
         if oldweights is None:
-            self.ctrlpoints = np.dot(matrix, oldctrlpoints)
+            self.ctrlpoints = matrix @ oldctrlpoints
             return
-        newweights = np.dot(matrix, oldweights)
+        newweights = matrix @ oldweights
         self.weights = newweights
-
         if oldctrlpoints is not None:
-            oldctrlpoints = list(oldctrlpoints)
-            for i, weight in enumerate(oldweights):
-                oldctrlpoints[i] *= weight
-            newctrlpoints = []
-            for i, line in enumerate(matrix):
-                newctrlpoints.append(0 * oldctrlpoints[0])
-                for j, point in enumerate(oldctrlpoints):
-                    newpoint = line[j] * point
-                    newpoint /= self.weights[i]
-                    newctrlpoints[i] += newpoint
-            self.ctrlpoints = newctrlpoints
+            points = weight_points(oldweights, oldctrlpoints)
+            numers = matrix @ points
+            newweights = newweights.reshape((-1,) + (1,) * (numers.ndim - 1))
+            self.ctrlpoints = numers / newweights
 
 
 class Curve(BaseCurve):
@@ -591,32 +934,77 @@ class Curve(BaseCurve):
         msg += "]\n"
         return msg
 
-    def __eval(self, nodes: Tuple[float]) -> Tuple[Any]:
+    def __eval(
+        self, nodes: Tuple[float], assume_sorted: bool = False, check: bool = True
+    ) -> Tuple[Any]:
         """
         Private method to evaluate points in the curve
         """
-        vector = tuple(self.knotvector)
-        nodes = tuple(nodes)
-        degree = int(self.knotvector.degree)
+        vector = self.knotvector.internal
+        degree = vector.degree
+        eval = heavy.eval_spline_banded
+        spans, values = eval(vector, nodes, degree, assume_sorted, check)
         if self.weights is None:
-            eval = heavy.eval_spline_nodes
-            matrix = eval(vector, nodes, degree)
-        else:
-            eval = heavy.eval_rational_nodes
-            weights = tuple(self.weights)
-            matrix = eval(vector, weights, nodes, degree)
-        result = np.moveaxis(matrix, 0, -1) @ self.ctrlpoints
-        return tuple(result)
-
-    def eval(self, nodes: Union[float, Tuple[float]]) -> Union[Any, Tuple[Any]]:
+            return tuple(heavy.banded_dot(spans, values, self.ctrlpoints))
+        # Homogeneous coordinates: C(u) = A(u) / w(u)
+        weights = self.weights
+        points = weight_points(weights, self.ctrlpoints)
+        numers = heavy.banded_dot(spans, values, points)
+        denoms = heavy.banded_dot(spans, values, weights)
+        denoms = denoms.reshape((-1,) + (1,) * (numers.ndim - 1))
+        return tuple(numers / denoms)
+
+    def eval(
+        self,
+        nodes: Union[float, Tuple[float]],
+        out: Optional[np.ndarray] = None,
+        assume_sorted: bool = False,
+        check: bool = True,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Union[Any, Tuple[Any]]:
         """Point evaluation function
 
+        If ``out`` is given, the nodes can be any iterable. They are
+        evaluated chunk by chunk with the same ``assume_sorted`` and
+        ``check`` flags, the points are written inside ``out`` and
+        ``out`` is returned. See ``iter_eval``
+
+        If ``assume_sorted`` is ``True``, the nodes must be in increasing
+        order: the spans are found by one sweep over the knotvector and
+        only the first and the last nodes are verified
+
+        If ``check`` is ``False``, the nodes are not verified and the
+        internal knotvector is used directly: it's a faster path for
+        trusted nodes, but a node outside ``[umin, umax]`` gives
+        undefined results instead of raising an error
+
+        If ``workers`` or ``executor`` are given, the nodes are split in
+        chunks, evaluated by many processes using the polynomials
+        from ``compile``. The polynomials, the nodes and the results are
+        exchanged by shared memory, so it's used only if the knots, the
+        nodes and the control points are floats. Else, the evaluation is
+        made as usual. Without ``executor``, the pool of ``workers``
+        processes is kept to be reused by the next evaluations
+
         :param nodes: The nodes to evaluates
         :type nodes: float | tuple[float]
+        :param out: Array of shape ``(len(nodes), *pointshape)`` to store the result
+        :type out: None | numpy.ndarray(, optional)
+        :param assume_sorted: If the nodes are sorted, defaults to ``False``
+        :type assume_sorted: bool(, optional)
+        :param check: If the nodes must be verified, defaults to ``True``
+        :type check: bool(, optional)
+        :param workers: The number of processes, or the CPUs if ``None``.
+            The nodes are split in ``4 * workers`` chunks, defaults to ``None``
+        :type workers: None | int(, optional)
+        :param executor: A pool of processes, like ``ProcessPoolExecutor``
+        :type executor: None | concurrent.futures.Executor(, optional)
         :raises TypeError: If ``nodes`` is not a number or a list of numbers
         :raises ValueError: If at least node is outside ``[umin, umax]``
+        :raises ValueError: If ``out`` has not the same length as ``nodes``
         :return: The point computed by using control points
-        :rtype: Any | tuple[Any]
+        :rtype: Any | tuple[Any] | numpy.ndarray
 
         Example use
         -----------
@@ -637,16 +1025,168 @@ class Curve(BaseCurve):
         if self.ctrlpoints is None:
             error_msg = "Cannot evaluate: There are no control points"
             raise ValueError(error_msg)
-        try:
-            nodes = tuple(nodes)
-            onevalue = False
-        except TypeError:
-            nodes = (nodes,)
-            onevalue = True
-        self.knotvector.valid(nodes)
-        result = self.__eval(nodes)
+        if workers is not None or executor is not None:
+            compiled = self.compile()
+            return compiled.eval(nodes, out, workers, executor)
+        if out is not None:
+            return self.__eval_out(nodes, out, assume_sorted, check)
+        onevalue = False
+        if not isinstance(nodes, np.ndarray) or nodes.ndim != 1:
+            try:
+                nodes = tuple(nodes)
+            except TypeError:
+                nodes = (nodes,)
+                onevalue = True
+        if check and not assume_sorted:
+            self.knotvector.valid(nodes)
+        result = self.__eval(nodes, assume_sorted, check)
         return result[0] if onevalue else result
 
+    def __eval_out(
+        self, nodes: Iterable[float], out: np.ndarray, assume_sorted: bool, check: bool
+    ) -> np.ndarray:
+        """
+        Private method of ``eval`` which evaluates any iterable of nodes
+        by chunks of bounded size, writing the points inside ``out``
+        """
+        start = 0
+        for chunk in iter_chunks(nodes):
+            stop = start + len(chunk)
+            if len(out) < stop:
+                raise ValueError(f"Invalid out length: {len(out)} < {stop} nodes")
+            out[start:stop] = self.__eval(chunk, assume_sorted, check)
+            start = stop
+        if start != len(out):
+            raise ValueError(f"Invalid out length: {len(out)} != {start} nodes")
+        return out
+
+    def iter_eval(
+        self, nodes: Iterable[float], chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[np.ndarray]:
+        """Evaluates the curve by chunks of nodes
+
+        It's a generator which evaluates at most ``chunk_size`` nodes
+        at a time, therefore it uses bounded memory for any long
+        sequence of nodes, like generators or numpy memmaps.
+        The interval search and the polynomials from ``compile``
+        are shared by all the chunks
+
+        :param nodes: The nodes to evaluate, any iterable of numbers
+        :type nodes: Iterable[float]
+        :param chunk_size: The maximum number of nodes by chunk, defaults to ``4096``
+        :type chunk_size: int(, optional)
+        :raises ValueError: If there are no control points
+        :raises ValueError: If at least node is outside ``[umin, umax]``
+        :return: Generator of arrays of shape ``(nchunk, *pointshape)``
+        :rtype: Iterator[numpy.ndarray]
+
+        Example use
+        -----------
+
+        >>> import numpy as np
+        >>> from compmec.nurbs import Curve
+        >>> curve = Curve([0, 0, 0.5, 1, 1], [1, 2, -3])
+        >>> nodes = np.linspace(0, 1, 5)
+        >>> for points in curve.iter_eval(nodes, chunk_size=2):
+        ...     print(points)
+        [1.  1.5]
+        [ 2.  -0.5]
+        [-3.]
+        >>> out = np.empty(5)
+        >>> curve.eval(nodes, out=out)
+        array([ 1. ,  1.5,  2. , -0.5, -3. ])
+
+        """
+        return self.compile().iter_eval(nodes, chunk_size)
+
+    def eval_grid(self, umin: float, umax: float, npts: int) -> np.ndarray:
+        """Evaluates the curve at ``npts`` equally spaced nodes
+
+        The nodes are the same as ``numpy.linspace(umin, umax, npts)``,
+        decreasing if ``umax < umin``.
+        Inside each interval the polynomial from ``compile`` is stepped
+        by forward differences, spending ``degree`` additions by node.
+        The differences are computed again periodically to bound the
+        accumulation of floating-point errors. The result is float
+
+        :param umin: The first node
+        :type umin: float
+        :param umax: The last node
+        :type umax: float
+        :param npts: The number of nodes
+        :type npts: int
+        :raises ValueError: If there are no control points
+        :raises ValueError: If the nodes are outside ``[knots[0], knots[-1]]``
+        :return: The array of shape ``(npts, *pointshape)``
+        :rtype: numpy.ndarray
+
+        Example use
+        -----------
+
+        >>> from compmec.nurbs import Curve
+        >>> curve = Curve([0, 0, 0.5, 1, 1], [1, 2, -3])
+        >>> curve.eval_grid(0, 1, 5)
+        array([ 1. ,  1.5,  2. , -0.5, -3. ])
+
+        """
+        return self.compile().eval_grid(umin, umax, npts)
+
+    def eval_uniform(self, npts_per_span: int) -> Tuple[np.ndarray]:
+        """Evaluates the curve at ``npts_per_span`` equally spaced nodes
+        inside each interval between consecutive knots, plus the last knot
+
+        Like ``eval_grid``, it uses forward differences
+
+        :param npts_per_span: The number of nodes by interval
+        :type npts_per_span: int
+        :raises ValueError: If there are no control points
+        :return: The pair ``(nodes, points)`` of arrays
+        :rtype: tuple[numpy.ndarray]
+
+        Example use
+        -----------
+
+        >>> from compmec.nurbs import Curve
+        >>> curve = Curve([0, 0, 0.5, 1, 1], [1, 2, -3])
+        >>> nodes, points = curve.eval_uniform(2)
+        >>> nodes
+        array([0.  , 0.25, 0.5 , 0.75, 1.  ])
+        >>> points
+        array([ 1. ,  1.5,  2. , -0.5, -3. ])
+
+        """
+        return self.compile().eval_uniform(npts_per_span)
+
+    def derivatives(
+        self, nodes: Union[float, Tuple[float]], times: int = 1
+    ) -> Tuple[Union[Any, Tuple[Any]]]:
+        """Evaluates the curve and its first derivatives at once
+
+        It uses only one search of the intervals and the polynomials
+        stored by ``compile``, without building derivative curves
+
+        :param nodes: The nodes to evaluates
+        :type nodes: float | tuple[float]
+        :param times: The maximum order of derivative, defaults to ``1``
+        :type times: int(, optional)
+        :raises ValueError: If there are no control points
+        :raises ValueError: If at least node is outside ``[umin, umax]``
+        :return: The values ``(C, C', ..., C^(times))`` at the nodes
+        :rtype: tuple[Any] | tuple[tuple[Any]]
+
+        Example use
+        -----------
+
+        >>> from compmec.nurbs import Curve
+        >>> curve = Curve([0, 0, 0, 1, 1, 1], [1, 2, -3])
+        >>> curve.derivatives(0.5, 2)
+        (0.5, -4.0, -12.0)
+        >>> curve.derivatives([0, 1], 1)
+        ((1.0, -3.0), (2.0, -10.0))
+
+        """
+        return self.compile().derivatives(nodes, times)
+
     def knot_insert(self, nodes: Tuple[float]) -> None:
         """Insert given nodes inside knotvector
 
@@ -667,13 +1207,175 @@ class Curve(BaseCurve):
 
         """
         nodes = tuple(nodes)
-        oldvector = tuple(self.knotvector)
+        oldvector = self.knotvector.internal
         newvector = tuple(self.knotvector + nodes)
         if self.ctrlpoints is None and self.weights is None:
             self.knotvector = newvector
+            return
+        if heavy.is_float(oldvector, nodes) and self.__knot_refine(newvector, nodes):
+            return
         matrix = heavy.Operations.knot_insert(oldvector, nodes)
         self.apply(newvector, matrix)
 
+    def __homogeneous(self) -> Optional[np.ndarray]:
+        """
+        Gives the float array of shape (npts, ndim) of the flattened
+        control points, with the weights as last column if rational:
+            [w_i * P_i, w_i]
+        Returns None if the control points cannot be converted into floats
+        """
+        haspoints = self.ctrlpoints is not None
+        try:
+            points = self.ctrlpoints if haspoints else np.zeros((self.npts, 0))
+            points = np.array(points, dtype="float64")
+        except (TypeError, ValueError):
+            return None
+        homogeneous = points.reshape((self.npts, -1))
+        if self.weights is not None:
+            weights = np.array(self.weights, dtype="float64").reshape((-1, 1))
+            homogeneous = np.concatenate((homogeneous * weights, weights), axis=1)
+        return homogeneous
+
+    def __set_homogeneous(self, newvector: Tuple[float], homogeneous: np.ndarray):
+        """
+        Sets the new knotvector and the control points and weights
+        from the array given by ``__homogeneous``
+        """
+        pointshape = None
+        if self.ctrlpoints is not None:
+            pointshape = np.shape(self.ctrlpoints[0])
+        rational = self.weights is not None
+        self.ctrlpoints = None
+        self.weights = None
+        self.knotvector = newvector
+        if rational:
+            weights = homogeneous[:, -1]
+            homogeneous = homogeneous[:, :-1] / weights[:, np.newaxis]
+            self.weights = weights
+        if pointshape is not None:
+            self.ctrlpoints = homogeneous.reshape((-1,) + pointshape)
+
+    def __homogeneous_tolerance(self, homogeneous: np.ndarray, tolerance: float):
+        """
+        Converts the tolerance of the curve into the tolerance of the
+        homogeneous control points, like in the NURBS book
+        """
+        if self.weights is None:
+            return tolerance
+        weights = homogeneous[:, -1:]
+        points = homogeneous[:, :-1] / weights
+        maxnorm = np.max(np.linalg.norm(points, axis=1), initial=0)
+        return tolerance * np.min(weights) / (1 + maxnorm)
+
+    def __knot_refine(self, newvector: Tuple[float], nodes: Tuple[float]) -> bool:
+        """
+        Inserts the nodes by updating directly the float control points
+        and weights, see ``heavy.Operations.knot_refine``.
+        Rational curves are refined in homogeneous coordinates.
+        Returns True, or None without changing the curve if the
+        control points cannot be converted into floats
+        """
+        homogeneous = self.__homogeneous()
+        if homogeneous is None:
+            return None
+        vector = self.knotvector.internal
+        homogeneous = heavy.Operations.knot_refine(vector, homogeneous, nodes)
+        self.__set_homogeneous(newvector, homogeneous)
+        return True
+
+    def __knot_remove(
+        self, nodes: Tuple[float], tolerance: float, force: bool = True
+    ) -> Optional[int]:
+        """
+        Removes the nodes by changing only the affected control points,
+        see ``heavy.Operations.knot_remove_local``.
+        If ``force``, raises ValueError if some node cannot be removed
+        all the asked times, else it removes as many times as possible.
+        Returns the number of removed knots, or None, without changing
+        the curve, if the control points cannot be converted into floats
+        """
+        homogeneous = self.__homogeneous()
+        if homogeneous is None:
+            return None
+        homtolerance = self.__homogeneous_tolerance(homogeneous, tolerance)
+        vector, total = list(self.knotvector), 0
+        counts = {}
+        for node in nodes:
+            counts[node] = counts.get(node, 0) + 1
+        for node, times in sorted(counts.items()):
+            removed, homogeneous, error = heavy.Operations.knot_remove_local(
+                vector, homogeneous, node, times, homtolerance
+            )
+            if force and removed < times:
+                error_msg = f"Cannot remove the knot {node} {times} times "
+                error_msg += f"with tolerance {tolerance}"
+                raise ValueError(error_msg)
+            for _ in range(removed):
+                vector.remove(node)
+            total += removed
+        if total:
+            self.__set_homogeneous(vector, homogeneous)
+        return total
+
+    def __knot_clean(self, nodes: Tuple[float], tolerance: float) -> Optional[int]:
+        """
+        Removes the float nodes as many times as possible with
+        ``__knot_remove``, by passes until nothing is removed, since
+        removing a knot may allow removing others.
+        Returns 0, or None if the control points cannot be converted into floats
+        """
+        removed = True
+        while removed:
+            vector = self.knotvector.internal
+            removable = []
+            for node in nodes:
+                if vector.valid(node):
+                    removable += vector.mult(node) * [node]
+            removed = self.__knot_remove(tuple(removable), tolerance, False)
+        return removed
+
+    def __degree_decrease(self, times: int, tolerance: float) -> bool:
+        """
+        Decreases the degree by reducing each bezier segment of the float
+        control points and weights, see
+        ``heavy.Operations.degree_decrease_local``, whose error bound
+        rejects a curve that cannot be reduced without fitting it.
+        Raises ValueError if the bound is bigger than the tolerance.
+        Returns False, without changing the curve, if the curve is exact,
+        unclamped, discontinuous, if the final degree is zero or if
+        the reduced weights are not positive
+        """
+        if self.ctrlpoints is None:
+            return False
+        vector = self.knotvector.internal
+        degree, mults = vector.degree, vector.mults
+        weights = () if self.weights is None else self.weights
+        if not heavy.is_float(vector, weights, np.ravel(self.ctrlpoints)):
+            return False
+        if degree - times < 1 or mults[0] != degree + 1 or mults[-1] != degree + 1:
+            return False
+        if any(mult > degree for mult in mults[1:-1]):
+            return False
+        homogeneous = self.__homogeneous()
+        if homogeneous is None:
+            return False
+        homtolerance = self.__homogeneous_tolerance(homogeneous, tolerance)
+        error = 0
+        for _ in range(times):
+            homogeneous, newerror = heavy.Operations.degree_decrease_local(
+                vector, homogeneous, homtolerance - error
+            )
+            error += newerror
+            if homogeneous is None:
+                error_msg = "Cannot decrease degree cause the error bound "
+                error_msg += f"is bigger than the tolerance {tolerance}"
+                raise ValueError(error_msg)
+            vector -= vector.knots
+        if self.weights is not None and not np.all(homogeneous[:, -1] > 0):
+            return False
+        self.__set_homogeneous(vector, homogeneous)
+        return True
+
     def knot_remove(self, nodes: Tuple[float], tolerance: float = 1e-9) -> None:
         """Remove given nodes from knotvector
 
@@ -707,6 +1409,14 @@ class Curve(BaseCurve):
         for node in nodes:
             float(node)
         newknotvec = self.knotvector - tuple(nodes)
+        vector = self.knotvector.internal
+        local = tolerance and self.ctrlpoints is not None
+        if (
+            local
+            and heavy.is_float(vector, nodes)
+            and self.__knot_remove(nodes, tolerance) is not None
+        ):
+            return
         knots = newknotvec.knots if newknotvec.degree != 0 else None
         self.update(newknotvec, tolerance, knots)
 
@@ -751,8 +1461,16 @@ class Curve(BaseCurve):
         float(tolerance)
         assert tolerance >= 0
         if nodes is None:
-            nodes = self.knotvector.knots
+            nodes = self.knotvector
         nodes = tuple(set(nodes) - set(self.knotvector.limits))
+        vector = self.knotvector.internal
+        local = tolerance and self.ctrlpoints is not None
+        if (
+            local
+            and heavy.is_float(vector, nodes)
+            and self.__knot_clean(nodes, tolerance) is not None
+        ):
+            return
         for knot in nodes:
             try:
                 while True:
@@ -788,7 +1506,7 @@ class Curve(BaseCurve):
         nodes = self.knotvector.knots
         newnodes = times * nodes
         newvector = self.knotvector + newnodes
-        oldvector = tuple(self.knotvector)
+        oldvector = self.knotvector.internal
         matrix = heavy.Operations.degree_increase(oldvector, times)
         self.apply(newvector, matrix)
 
@@ -802,6 +1520,7 @@ class Curve(BaseCurve):
         :param tolerance: Tolerance to remove knots, defaults to ``1``
         :type tolerance: float(, optional)
         :raises AssertionError: If ``times`` is not a integer >= 0
+        :raises ValueError: If the error is bigger than ``tolerance``
 
         Example use
         -----------
@@ -825,6 +1544,8 @@ class Curve(BaseCurve):
         if tolerance is not None:
             float(tolerance)
             assert tolerance >= 0
+        if tolerance and self.__degree_decrease(times, tolerance):
+            return
         newknotvec = copy(self.knotvector)
         newknotvec.degree -= times
         knots = newknotvec.knots if newknotvec.degree != 0 else None
@@ -896,7 +1617,7 @@ class Curve(BaseCurve):
         if self.weights is None:
             return
         # Try to reduce to spline
-        knotvector = tuple(self.knotvector)
+        knotvector = self.knotvector.internal
         weights = tuple(self.weights)
         ctrlpoints = tuple(self.ctrlpoints)
         mattrans, materror = heavy.LeastSquare.func2func(
@@ -942,18 +1663,80 @@ class Curve(BaseCurve):
             nodes = self.knotvector.knots
         nodes = tuple(nodes)
         newvectors = self.knotvector.split(nodes)
-        vector = tuple(self.knotvector)
+        vector = self.knotvector.internal
         matrices = heavy.Operations.split_curve(vector, nodes)
+        ctrlpoints = np.asarray(self.ctrlpoints)
         newcurves = []
         for newvector, matrix in zip(newvectors, matrices):
-            matrix = np.array(matrix)
             newcurve = Curve(newvector)
-            newcurve.ctrlpoints = np.dot(matrix, self.ctrlpoints)
+            newcurve.ctrlpoints = matrix @ ctrlpoints
             if self.weights is not None:
-                newcurve.weights = np.dot(matrix, self.weights)
+                newcurve.weights = matrix @ self.weights
             newcurves.append(newcurve)
         return tuple(newcurves)
 
+    def tessellate(self, tolerance: float = 1e-3) -> Tuple[Tuple[float], Tuple[Any]]:
+        """Transforms the curve into a polyline within given tolerance
+
+        The curve is decomposed into bezier segments, and each one is
+        subdivided only until its control polygon is flat: all the
+        control points are at a distance lower than ``tolerance`` from the
+        chord. Therefore the polyline deviates at most ``tolerance``
+        from the curve, with few points at the flat regions.
+
+        The distance is measured in the space of the control points
+
+        :param tolerance: The maximum chordal deviation, defaults to ``1e-3``
+        :type tolerance: float(, optional)
+        :raises ValueError: If there are no control points
+        :raises ValueError: If ``tolerance`` is not positive
+        :raises ValueError: If a segment is not flat after 32 subdivisions,
+            like for a tolerance below the floating-point precision
+        :return: The pair ``(nodes, points)`` of the polyline vertices
+        :rtype: tuple[tuple[float], tuple[Any]]
+
+        Example use
+        -----------
+
+        >>> from compmec.nurbs import Curve
+        >>> curve = Curve([0, 0, 0.5, 1, 1], [(0, 0), (1, 1), (2, 0)])
+        >>> nodes, points = curve.tessellate(0.1)
+        >>> nodes
+        (0, 0.5, 1)
+        >>> curve = Curve([0, 0, 0, 1, 1, 1], [(0, 0), (1, 1), (2, 0)])
+        >>> nodes, points = curve.tessellate(0.1)
+        >>> nodes
+        (0, 0.25, 0.5, 0.75, 1)
+
+        """
+        if self.ctrlpoints is None:
+            error_msg = "Cannot tessellate: There are no control points"
+            raise ValueError(error_msg)
+        if not float(tolerance) > 0:
+            raise ValueError(f"Tolerance must be positive, received {tolerance}")
+        knots = self.knotvector.knots
+        vector = self.knotvector.internal
+        matrices = heavy.Operations.split_curve(vector, knots)
+        ctrlpoints = np.array(self.ctrlpoints, dtype="float64")
+        weights = None
+        if self.weights is not None:
+            weights = np.array(self.weights, dtype="float64")
+            shape = (-1,) + (1,) * (ctrlpoints.ndim - 1)
+            ctrlpoints = ctrlpoints * weights.reshape(shape)
+        nodes = []
+        for umin, umax, matrix in zip(knots[:-1], knots[1:], matrices):
+            points = np.array(matrix @ ctrlpoints, dtype="float64")
+            bezweights = None
+            if weights is not None:
+                bezweights = np.array(matrix @ weights, dtype="float64")
+                points = points / bezweights.reshape(shape)
+            params = heavy.bezier_flat_params(points, bezweights, tolerance)
+            nodes.append(umin)
+            nodes += [umin + (umax - umin) * param for param in params[1:-1]]
+        nodes.append(knots[-1])
+        nodes = tuple(nodes)
+        return nodes, self.eval(nodes)
+
     def fit_curve(self, other: Curve, nodes: Tuple[float] = None) -> float:
         """Finds the control points such this curve keeps as near as
         possible to ``other``
@@ -988,7 +1771,7 @@ class Curve(BaseCurve):
 
         """
         assert isinstance(other, self.__class__)
-        vectora, vectorb = tuple(self.knotvector), tuple(other.knotvector)
+        vectora, vectorb = self.knotvector.internal, other.knotvector.internal
         if self.weights is None and other.weights is None:
             lstsq = heavy.LeastSquare.spline2spline
             transmat, materror = lstsq(vectorb, vectora, nodes)
@@ -1108,7 +1891,7 @@ class Curve(BaseCurve):
                 funcnodes = heavy.NodeSample.chebyshev
             nodes_0to1 = funcnodes(len(points))
             nodes = tuple(umin + (umax - umin) * node for node in nodes_0to1)
-        knotvector = tuple(self.knotvector)
+        knotvector = self.knotvector.internal
         nodes = tuple(nodes)
         weights = None if self.weights is None else tuple(self.weights)
         matrix = fitfunc(knotvector, nodes, weights)
@@ -1128,3 +1911,235 @@ class Curve(BaseCurve):
         if callable(param):
             return self.fit_function(param, nodes)
         return self.fit_points(param, nodes)
+
+
+class CurveBatch:
+    """Group of curves which share the same knotvector and weights
+
+    The control points are stored in one array of shape
+    ``(ncurves, npts, *pointshape)``, such the basis functions are
+    computed only once to evaluate all the curves at the same nodes.
+    The knot insertion and the degree increase apply the same
+    transformation matrix to all the curves.
+
+    Example use
+    -----------
+
+    >>> import numpy as np
+    >>> from compmec.nurbs import CurveBatch
+    >>> ctrlpoints = [[1, 2, -3], [0, 1, 0]]
+    >>> batch = CurveBatch([0, 0, 0.5, 1, 1], ctrlpoints)
+    >>> len(batch)
+    2
+    >>> batch([0, 0.5, 1])
+    array([[ 1.,  2., -3.],
+           [ 0.,  1.,  0.]])
+    >>> batch[0]([0, 0.5, 1])
+    (1.0, 2.0, -3.0)
+
+    """
+
+    def __init__(
+        self,
+        knotvector: KnotVector,
+        ctrlpoints: np.ndarray,
+        weights: Optional[Tuple[float]] = None,
+    ):
+        self.__knotvector = KnotVector(knotvector)
+        self.__weights = None
+        self.ctrlpoints = ctrlpoints
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return len(self.__ctrlpoints)
+
+    def __getitem__(self, index: int) -> Curve:
+        ctrlpoints = tuple(self.__ctrlpoints[index])
+        return Curve(copy(self.knotvector), ctrlpoints, self.weights)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __call__(self, nodes: Union[float, Tuple[float]]) -> np.ndarray:
+        return self.eval(nodes)
+
+    @staticmethod
+    def stack(curves: Tuple[Curve]) -> CurveBatch:
+        """Builds a batch from curves with the same knotvector and weights
+
+        :param curves: The curves to be grouped
+        :type curves: tuple[Curve]
+        :raises ValueError: If the curves don't share knotvector and weights
+        :return: The batch of curves
+        :rtype: CurveBatch
+        """
+        curves = tuple(curves)
+        if len(curves) == 0:
+            raise ValueError("Cannot stack an empty group of curves")
+        knotvector, weights = curves[0].knotvector, curves[0].weights
+        for curve in curves:
+            if curve.knotvector != knotvector or curve.weights != weights:
+                error_msg = "All curves must have the same knotvector and weights"
+                raise ValueError(error_msg)
+        ctrlpoints = [curve.ctrlpoints for curve in curves]
+        return CurveBatch(copy(knotvector), ctrlpoints, weights)
+
+    @property
+    def knotvector(self) -> KnotVector:
+        """The knotvector shared by all the curves
+
+        :getter: Returns the knotvector
+        :type: KnotVector
+        """
+        return self.__knotvector
+
+    @property
+    def degree(self) -> int:
+        """Polynomial degree of the curves
+
+        :getter: Returns the degree
+        :type: int
+        """
+        return self.knotvector.degree
+
+    @property
+    def npts(self) -> int:
+        """Number of control points of each curve
+
+        :getter: Returns the number of control points
+        :type: int
+        """
+        return self.knotvector.npts
+
+    @property
+    def weights(self) -> Union[Tuple[float], None]:
+        """Weights shared by all the curves
+
+        :getter: Returns the weights, or None if the curves are splines
+        :setter: Sets the weights
+        :type: None | tuple[float]
+        """
+        return self.__weights
+
+    @property
+    def ctrlpoints(self) -> np.ndarray:
+        """Control points of all the curves
+
+        :getter: Returns the array of shape ``(ncurves, npts, *pointshape)``
+        :setter: Sets the control points
+        :type: numpy.ndarray
+        """
+        return self.__ctrlpoints
+
+    @weights.setter
+    def weights(self, value: Union[Tuple[float], None]):
+        if value is None:
+            self.__weights = None
+            return
+        value = tuple(value)
+        if len(value) != self.npts:
+            error_msg = f"Weights shape invalid! {len(value)} != {self.npts}"
+            raise ValueError(error_msg)
+        self.__weights = verify_weights(self.knotvector.internal, value)
+
+    @ctrlpoints.setter
+    def ctrlpoints(self, value: np.ndarray):
+        value = np.array(value)
+        if value.ndim < 2 or value.shape[1] != self.npts:
+            error_msg = f"Control points must have shape (ncurves, {self.npts}, ...)"
+            error_msg += f", received {value.shape}"
+            raise ValueError(error_msg)
+        self.__ctrlpoints = value
+
+    def eval(self, nodes: Union[float, Tuple[float]]) -> np.ndarray:
+        """Evaluates all the curves at the same nodes
+
+        The basis functions are computed only once, followed by one
+        contraction with the control points of all the curves
+
+        :param nodes: The nodes to evaluate
+        :type nodes: float | tuple[float]
+        :raises ValueError: If at least node is outside ``[umin, umax]``
+        :return: The array of shape ``(ncurves, len(nodes), *pointshape)``,
+            or ``(ncurves, *pointshape)`` if ``nodes`` is a single number
+        :rtype: numpy.ndarray
+        """
+        try:
+            nodes = tuple(nodes)
+            onevalue = False
+        except TypeError:
+            nodes = (nodes,)
+            onevalue = True
+        vector = self.knotvector.internal
+        spans, values = heavy.eval_spline_banded(vector, nodes, vector.degree)
+        points = np.moveaxis(self.__ctrlpoints, 0, 1)
+        if self.weights is None:
+            result = heavy.banded_dot(spans, values, points)
+        else:  # Homogeneous coordinates: C(u) = A(u) / w(u)
+            weights = np.array(self.weights)
+            weights = weights.reshape((-1,) + (1,) * (points.ndim - 1))
+            result = heavy.banded_dot(spans, values, weights * points)
+            result = result / heavy.banded_dot(spans, values, weights)
+        result = np.moveaxis(result, 0, 1)
+        return result[:, 0] if onevalue else result
+
+    def apply(
+        self,
+        newknotvector: KnotVector,
+        matrix: Union[heavy.SparseMatrix, Tuple[Tuple[float]]],
+    ):
+        """Applies the same linear transformation to all the curves
+
+        new ctrlpoints = matrix @ old ctrlpoints
+        new weights = matrix @ old weights
+
+        :param newknotvector: The knotvector after the transformation
+        :type newknotvector: KnotVector
+        :param matrix: The transformation matrix of shape ``(newnpts, npts)``
+        :type matrix: heavy.SparseMatrix | tuple[tuple[float]]
+        """
+        if not isinstance(matrix, heavy.SparseMatrix):
+            matrix = heavy.SparseMatrix.from_dense(matrix)
+        points = np.moveaxis(self.__ctrlpoints, 0, 1)
+        if self.weights is None:
+            newpoints = matrix @ points
+            newweights = None
+        else:
+            shape = (-1,) + (1,) * (points.ndim - 1)
+            weights = np.array(self.weights).reshape(shape)
+            newweights = matrix @ self.weights
+            newpoints = matrix @ (weights * points)
+            newpoints = newpoints / newweights.reshape(shape)
+        self.__weights = None
+        self.__knotvector = KnotVector(newknotvector)
+        self.ctrlpoints = np.moveaxis(newpoints, 1, 0)
+        self.weights = newweights
+
+    def knot_insert(self, nodes: Tuple[float]):
+        """Inserts the given nodes inside the knotvector of all the curves
+
+        :param nodes: The nodes to be inserted
+        :type nodes: tuple[float]
+        :raises ValueError: If it's not possible to insert the knots
+        """
+        nodes = tuple(nodes)
+        oldvector = self.knotvector.internal
+        newvector = tuple(self.knotvector + nodes)
+        matrix = heavy.Operations.knot_insert(oldvector, nodes)
+        self.apply(newvector, matrix)
+
+    def degree_increase(self, times: Optional[int] = 1):
+        """Increases the degree of all the curves by an amount ``times``
+
+        :param times: The number of times to increase, defaults to ``1``
+        :type times: int(, optional)
+        :raises ValueError: If ``times`` is not a positive integer
+        """
+        if not isinstance(times, int) or times <= 0:
+            raise ValueError
+        nodes = self.knotvector.knots
+        newvector = self.knotvector + times * nodes
+        oldvector = self.knotvector.internal
+        matrix = heavy.Operations.degree_increase(oldvector, times)
+        self.apply(newvector, matrix)
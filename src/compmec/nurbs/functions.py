@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from copy import copy
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
@@ -29,8 +30,13 @@ class BaseFunction(Intface_BaseFunction):
     def __ne__(self, other: Intface_BaseFunction) -> bool:
         return not self.__eq__(other)
 
-    def __call__(self, nodes: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
-        return self.eval(nodes)
+    def __call__(
+        self,
+        nodes: Union[float, np.ndarray],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Union[float, np.ndarray]:
+        return self.eval(nodes, workers, executor)
 
     @property
     def knotvector(self) -> KnotVector:
@@ -175,79 +181,96 @@ class BaseFunction(Intface_BaseFunction):
 
 class FunctionEvaluator(Intface_Evaluator):
     def __init__(self, func: BaseFunction, i: Union[int, slice], j: int):
-        vector = func.knotvector
-        self.__knotvector = vector
+        self.__knotvector = func.knotvector
         self.__weights = func.weights
         self.__first_index = i
         self.__second_index = j
-        self.__matrix = heavy.BasisFunction.speval_matrix(vector.internal, j)
-        self.__knots = vector.knots
-        self.__spans = vector.span(vector.knots)
 
-    def __compute_vector_spline(self, node: float, span: int) -> np.ndarray:
-        """
-        Given a 'u' float, it returns the vector with all Spline Basis Functions:
-        compute_vector(u, span) = [N_{0j}(u), N_{1j}(u), ..., N_{npts-1,j}(u)]
-        """
-        npts = self.__knotvector.npts
-        result = [0 * node] * npts
-        z = self.__spans.index(span)
-        denom = self.__knots[z + 1] - self.__knots[z]
-        shifnode = (node - self.__knots[z]) / denom
-        for y in range(self.__second_index + 1):
-            i = y + span - self.__second_index
-            for k in range(self.__second_index, -1, -1):
-                result[i] *= shifnode
-                result[i] += self.__matrix[z][y][k]
-        return result
-
-    def __compute_vector(self, node: float, span: int) -> np.ndarray:
+    def __compute_banded(self, nodes: Tuple[float]) -> Tuple[np.ndarray]:
         """
-        Given a 'u' float, it returns the vector with all BasicFunctions:
-        compute_vector(u, span) = [F_{0j}(u), F_{1j}(u), ..., F_{npts-1,j}(u)]
+        Computes the compact representation (spans, values) of
+        the matrix of basis functions, see ``heavy.eval_spline_banded``
+        values.shape = (len(nodes), j+1)
         """
-        result = self.__compute_vector_spline(node, span)
+        vector = self.__knotvector.internal
+        degree = self.__second_index
         if self.__weights is None:
-            return result
-        return self.__weights * result / np.inner(self.__weights, result)
+            return heavy.eval_spline_banded(vector, nodes, degree)
+        weights = self.__weights
+        return heavy.eval_rational_banded(vector, weights, nodes, degree)
 
     def __compute_matrix(
-        self, nodes: Tuple[float], spans: Tuple[int]
+        self, nodes: Tuple[float], spans: Tuple[int], values: np.ndarray
     ) -> Tuple[Tuple[float]]:
         """
-        Receives an 1D array of nodes, and returns a 2D array.
+        Receives an 1D array of nodes and its banded values,
+        and returns only the requested lines of the 2D array.
         nodes.shape = (len(nodes), )
         result.shape = (npts, len(nodes))
         """
-        nodes = tuple(nodes)
         npts = self.__knotvector.npts
-        matrix = np.empty((npts, len(nodes)), dtype="object")
-        for j, (nodej, spanj) in enumerate(zip(nodes, spans)):
-            values = self.__compute_vector(nodej, spanj)
-            for i in range(npts):
-                matrix[i][j] = values[i]
-        matrix = matrix.tolist()
-        for i, line in enumerate(matrix):
-            matrix[i] = tuple(line)
-        return tuple(matrix)
+        lines = range(npts)[self.__first_index]
+        lines = (lines,) if isinstance(lines, int) else lines
+        values = values.tolist()
+        matrix = {}
+        for i in lines:
+            matrix[i] = [0 * node for node in nodes]
+        degree = self.__second_index
+        for j, span in enumerate(spans):
+            for y, value in enumerate(values[j]):
+                i = y + span - degree
+                if i in matrix:
+                    matrix[i][j] = value
+        return tuple(tuple(matrix[i]) for i in lines)
 
     def __eval(self, nodes: Tuple[float]) -> Tuple[Tuple[float]]:
         """
         Private and unprotected method of eval
         """
         nodes = tuple(nodes)
-        spans = self.__knotvector.span(nodes)
-        matrix = self.__compute_matrix(nodes, spans)
-        return matrix
+        spans, values = self.__compute_banded(nodes)
+        return self.__compute_matrix(nodes, spans, values)
+
+    def __eval_parallel(
+        self, nodes: Tuple[float], workers: int, executor: Executor
+    ) -> Tuple[Tuple[float]]:
+        """
+        Evaluates the basis functions in many processes. Each interval
+        sends only the coefficients of its (j+1) non-zero functions, and
+        the workers give back the banded values, see ``heavy.parallel_piecewise``.
+        Works only with floats
+        """
+        vector = self.__knotvector.internal
+        degree = self.__second_index
+        matrix3d = heavy.BasisFunction.speval_matrix(vector, degree)
+        numerator = np.transpose(np.array(matrix3d, dtype="float64"), (0, 2, 1))
+        denominator = None
+        if self.__weights is not None:
+            weights = np.array(self.__weights, dtype="float64")
+            indexs = np.array(vector.spans)[:, np.newaxis] + np.arange(-degree, 1)
+            numerator = numerator * weights[indexs][:, np.newaxis, :]
+            denominator = np.sum(numerator, axis=2)
+        values = heavy.parallel_piecewise(
+            vector, numerator, denominator, nodes, workers, executor
+        )
+        segments, _, _ = heavy.locate_nodes(vector, nodes)
+        spans = np.array(vector.spans, dtype="int64")[segments]
+        return self.__compute_matrix(nodes, spans, values)
 
     def eval(
-        self, nodes: Union[float, Tuple[float]]
+        self,
+        nodes: Union[float, Tuple[float]],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> Union[float, Tuple[float], Tuple[Tuple[float]]]:
         """
         If i is integer, u is float -> float
         If i is integer, u is Tuple[float], ndim = k -> np.ndarray, ndim = k
         If i is slice, u is float -> Tuple[float]
         if i is slice, u is Tuple[float], ndim = k -> Tuple[Tuple[float]], ndim = k+1
+
+        If ``workers`` or ``executor`` are given and the knots, the nodes
+        and the weights are floats, the nodes are evaluated in many processes
         """
         singlenode = True
         try:
@@ -255,16 +278,26 @@ class FunctionEvaluator(Intface_Evaluator):
             singlenode = False
         except TypeError:
             nodes = (nodes,)
-        matrix = self.__eval(nodes)
+        parallel = workers is not None or executor is not None
+        weights = () if self.__weights is None else self.__weights
+        vector = self.__knotvector.internal
+        if parallel and heavy.is_float(vector, nodes, weights):
+            matrix = self.__eval_parallel(nodes, workers, executor)
+        else:
+            matrix = self.__eval(nodes)
         if singlenode:
             matrix = tuple([ri[0] for ri in matrix])
-        result = matrix[self.__first_index]
-        return result
+        if isinstance(self.__first_index, int):
+            return matrix[0]
+        return matrix
 
     def __call__(
-        self, nodes: Union[float, Tuple[float]]
+        self,
+        nodes: Union[float, Tuple[float]],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> Union[float, Tuple[float], Tuple[Tuple[float]]]:
-        return self.eval(nodes)
+        return self.eval(nodes, workers, executor)
 
 
 class IndexableFunction(BaseFunction):
@@ -302,10 +335,21 @@ class IndexableFunction(BaseFunction):
         self.__valid_second_index(j)
         return FunctionEvaluator(self, i, j)
 
-    def eval(self, nodes: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
-        """Evaluate the given nodes"""
+    def eval(
+        self,
+        nodes: Union[float, np.ndarray],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Union[float, np.ndarray]:
+        """Evaluate the given nodes
+
+        If ``workers`` or ``executor`` are given and the knots, the nodes
+        and the weights are floats, the nodes are split in chunks and
+        evaluated in many processes, exchanging the coefficients, the nodes
+        and the results by shared memory
+        """
         evaluator = self[:, self.degree]
-        return evaluator(nodes)
+        return evaluator(nodes, workers, executor)
 
 
 class Function(IndexableFunction):
@@ -6,26 +6,88 @@ Most of these functions works only with integers, floats and tuples.
 
 from __future__ import annotations
 
+import atexit
 import math
+import os
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
 from copy import deepcopy
 from fractions import Fraction
-from typing import Optional, Tuple, Union
+from itertools import count
+from typing import Any, Hashable, Optional, Tuple, Union
 
 import numpy as np
 
 
 class ImmutableKnotVector(tuple):
+    """
+    Tuple of sorted knots which computes once, at construction,
+    the degree, the number of points, the limits, the unique knots,
+    their multiplicities and the span of each segment [knots[z], knots[z+1]].
+    The queries of spans and multiplicities are made by bisection
+
+    Equal knotvectors, with the same types of knots, are interned:
+    they give the same instance while it's in a bounded pool, without
+    validating again. Each instance stores its hash and has a unique
+    ``token``, used as key of the caches of derived data
+    """
+
+    __tolerance = 1e-9  # Knots closer than it are the same
+    __pool = OrderedDict()
+    __poolsize = 1024
+    __tokens = count()
+
     @staticmethod
-    def __get_unique(vector: Tuple[float]):
-        unique = []
-        for node in vector:
-            for knot in unique:
-                if abs(node - knot) < 1e-6:
-                    break
-            else:
-                unique.append(node)
-        unique.sort()
-        return tuple(unique)
+    def __get_unique(vector: Tuple[float], degree: int) -> Tuple[Tuple]:
+        """
+        Groups the sorted knots by one sweep: a knot belongs to the
+        group of the previous one if its distance to the first knot of
+        the group is lower than the tolerance. Gives the groups which
+        touch the interval [umin, umax], as (knots, mults, spans), such each
+        multiplicity is the size of its group and sum(mults) is the
+        number of knots inside these groups. The span of the segment
+        [knots[z], knots[z+1]] is the last index of the group z
+        """
+        tolerance = ImmutableKnotVector.__tolerance
+        npts = len(vector) - degree - 1
+        starts = [0]
+        for i, knot in enumerate(vector):
+            if not knot - vector[starts[-1]] < tolerance:
+                starts.append(i)
+        starts.append(len(vector))
+        knots, mults, spans = [], [], []
+        for start, stop in zip(starts[:-1], starts[1:]):
+            if degree < stop and start <= npts:
+                index = npts if npts < stop else max(start, degree)
+                knots.append(vector[index])
+                mults.append(stop - start)
+                spans.append(stop - 1)
+        return tuple(knots), tuple(mults), tuple(spans[:-1])
+
+    @staticmethod
+    def __find_degree(vector: Tuple[float]) -> int:
+        """
+        The degree is the number of repeated knots at the beginning
+        """
+        degree = 0
+        while vector[degree] == vector[degree + 1]:
+            degree += 1
+        return degree
+
+    @staticmethod
+    def __valid_mults(vector: Tuple[float], degree: int) -> bool:
+        """
+        Verifies if the inner knots have multiplicities at most degree+1
+        and if both extremities have the same multiplicity
+        """
+        npts = len(vector) - degree - 1
+        counts = {}  # Multiplicities by one sweep, since it's sorted
+        for knot in vector:
+            counts[knot] = counts.get(knot, 0) + 1
+        for knot in vector[degree : npts + 1]:
+            if counts[knot] > degree + 1:
+                return False
+        return counts[vector[degree]] == counts[vector[npts]]
 
     @staticmethod
     def __is_valid(vector: Tuple[float], degree: Union[int, None]):
@@ -41,20 +103,36 @@ class ImmutableKnotVector(tuple):
             if not vector[i] <= vector[i + 1]:
                 return False
         if degree is None:
-            degree = 0
-            while vector[degree] == vector[degree + 1]:
-                degree += 1
+            degree = ImmutableKnotVector.__find_degree(vector)
         npts = lenght - degree - 1
         if not degree < npts:
             return False
-        knots = ImmutableKnotVector.__get_unique(vector[degree : npts + 1])
-        for knot in knots:
-            mult = vector.count(knot)
-            if mult > degree + 1:
-                return False
-        if vector.count(vector[degree]) != vector.count(vector[npts]):
-            return False
-        return True
+        return ImmutableKnotVector.__valid_mults(vector, degree)
+
+    @classmethod
+    def __pool_get(cls, key: Tuple) -> Union[ImmutableKnotVector, None]:
+        """
+        Gives the interned instance of the key, or None if it's not in
+        the pool. Unhashable knots, like arrays, are not interned
+        """
+        try:
+            instance = cls.__pool[key]
+        except (TypeError, KeyError):
+            return None
+        cls.__pool.move_to_end(key)
+        return instance
+
+    @classmethod
+    def __pool_set(cls, key: Tuple, instance: ImmutableKnotVector):
+        """
+        Interns the instance, removing the least recently used ones
+        """
+        try:
+            cls.__pool[key] = instance
+        except TypeError:  # Unhashable knots are not interned
+            return
+        while len(cls.__pool) > cls.__poolsize:
+            cls.__pool.popitem(last=False)
 
     def __new__(cls, knotvector: Tuple[float], degree: Optional[int] = None):
         if isinstance(knotvector, ImmutableKnotVector):
@@ -63,17 +141,39 @@ class ImmutableKnotVector(tuple):
             knotvector = tuple(knotvector)
         except TypeError:
             raise ValueError
+        key = (knotvector, tuple(map(type, knotvector)), degree)
+        instance = cls.__pool_get(key)
+        if instance is not None:
+            return instance
         if not cls.__is_valid(knotvector, degree):
             raise ValueError("Invalid knot vector")
         if degree is None:
-            degree = 0
-            while knotvector[degree] == knotvector[degree + 1]:
-                degree += 1
+            degree = cls.__find_degree(knotvector)
+        npts = len(knotvector) - degree - 1
         instance = super(ImmutableKnotVector, cls).__new__(cls, tuple(knotvector))
         instance._ImmutableKnotVector__degree = degree
-        instance._ImmutableKnotVector__npts = len(knotvector) - degree - 1
+        instance._ImmutableKnotVector__npts = npts
+        instance._ImmutableKnotVector__limits = (knotvector[degree], knotvector[npts])
+        knots, mults, spans = cls.__get_unique(knotvector, degree)
+        instance._ImmutableKnotVector__knots = knots
+        instance._ImmutableKnotVector__mults = mults
+        instance._ImmutableKnotVector__spans = spans
+        instance._ImmutableKnotVector__hash = tuple.__hash__(instance)
+        instance._ImmutableKnotVector__token = next(cls.__tokens)
+        cls.__pool_set(key, instance)
         return instance
 
+    def __hash__(self) -> int:
+        return self.__hash
+
+    @property
+    def token(self) -> int:
+        """
+        Unique number of this instance, never reused by another one.
+        Equal knotvectors share it while they are interned
+        """
+        return self.__token
+
     def __add__(self, nodes: Tuple[float]) -> ImmutableKnotVector:
         return self.__class__(sorted(list(self) + list(nodes)))
 
@@ -84,42 +184,74 @@ class ImmutableKnotVector(tuple):
         return self.__class__(lista)
 
     def __or__(self, other: ImmutableKnotVector) -> ImmutableKnotVector:
-        other = ImmutableKnotVector(other)
-        if self.limits != other.limits:
-            raise ValueError
-        all_knots = list(self.knots) + list(other.knots)
-        all_knots = ImmutableKnotVector.__get_unique(all_knots)
-        all_mults = [0] * len(all_knots)
-        for vector in [self, other]:
-            for knot in vector:
-                index = all_knots.index(knot)
-                mult = vector.mult(knot)
-                if mult > all_mults[index]:
-                    all_mults[index] = mult
-        final_vector = []
-        for knot, mult in zip(all_knots, all_mults):
-            final_vector += [knot] * mult
-        final_vector = tuple(sorted(final_vector))
-        return ImmutableKnotVector(final_vector)
+        return self.union(other)
 
     def __and__(self, other: ImmutableKnotVector) -> ImmutableKnotVector:
+        return self.intersection(other)
+
+    def __runs(self, tolerance: float) -> Tuple[Tuple]:
+        """
+        Groups the consecutive knots whose distance to the first
+        of the group is at most tolerance, giving (values, mults)
+        """
+        values, mults = [], []
+        for knot in self:
+            if values and knot - values[-1] <= tolerance:
+                mults[-1] += 1
+            else:
+                values.append(knot)
+                mults.append(1)
+        return values, mults
+
+    def __merge(
+        self, other: ImmutableKnotVector, union: bool, tolerance: float
+    ) -> ImmutableKnotVector:
+        """
+        Merges two sorted knotvectors by one sweep. Two knots are
+        the same if their distance is at most tolerance, then it keeps
+        the maximum (union) or the minimum (intersection) multiplicity
+        """
         other = ImmutableKnotVector(other)
         if self.limits != other.limits:
             raise ValueError
-        all_knots = tuple(sorted(set(self.knots) & set(other.knots)))
-        all_mults = [float("inf")] * len(all_knots)
-        for vector in [self, other]:
-            for knot in vector:
-                if knot not in all_knots:
-                    continue
-                index = all_knots.index(knot)
-                mult = vector.mult(knot)
-                if mult < all_mults[index]:
-                    all_mults[index] = mult
-        final_vector = []
-        for knot, mult in zip(all_knots, all_mults):
-            final_vector += [knot] * mult
-        return ImmutableKnotVector(sorted(final_vector))
+        knotsa, multsa = self.__runs(tolerance)
+        knotsb, multsb = other.__runs(tolerance)
+        vector = []
+        i, j = 0, 0
+        while i < len(knotsa) or j < len(knotsb):
+            if j == len(knotsb) or (
+                i < len(knotsa) and knotsa[i] < knotsb[j] - tolerance
+            ):
+                if union:
+                    vector += [knotsa[i]] * multsa[i]
+                i += 1
+            elif i == len(knotsa) or knotsb[j] < knotsa[i] - tolerance:
+                if union:
+                    vector += [knotsb[j]] * multsb[j]
+                j += 1
+            else:
+                mult = max(multsa[i], multsb[j]) if union else min(multsa[i], multsb[j])
+                vector += [knotsa[i]] * mult
+                i, j = i + 1, j + 1
+        return self.__class__(vector)
+
+    def union(
+        self, other: ImmutableKnotVector, tolerance: float = 1e-9
+    ) -> ImmutableKnotVector:
+        """
+        Returns the smallest knotvector which contains both knotvectors,
+        same as ``self | other``. Knots closer than tolerance are the same
+        """
+        return self.__merge(other, True, tolerance)
+
+    def intersection(
+        self, other: ImmutableKnotVector, tolerance: float = 1e-9
+    ) -> ImmutableKnotVector:
+        """
+        Returns the biggest knotvector contained by both knotvectors,
+        same as ``self & other``. Knots closer than tolerance are the same
+        """
+        return self.__merge(other, False, tolerance)
 
     @property
     def degree(self) -> int:
@@ -131,29 +263,56 @@ class ImmutableKnotVector(tuple):
 
     @property
     def knots(self) -> Tuple[float]:
-        vector = self[self.degree : self.npts + 1]
-        return ImmutableKnotVector.__get_unique(vector)
+        return self.__knots
+
+    @property
+    def mults(self) -> Tuple[int]:
+        """
+        The multiplicity of each knot of ``knots``
+        """
+        return self.__mults
+
+    @property
+    def spans(self) -> Tuple[int]:
+        """
+        The span of each segment [knots[z], knots[z+1]]
+        """
+        return self.__spans
 
     @property
     def limits(self) -> Tuple[float]:
-        return (self[self.degree], self[self.npts])
+        return self.__limits
 
     def __span_single(self, node: float) -> int:
         if node == self[self.npts]:  # Special case
             return self.npts - 1
-        low, high = self.degree, self.npts + 1  # Do binary search
-        mid = (low + high) // 2
-        while True:
-            if node < self[mid]:
-                high = mid
-            else:
-                low = mid
-            mid = (low + high) // 2
-            if self[mid] <= node < self[mid + 1]:
-                return mid
+        return bisect_right(self, node, self.degree, self.npts + 1) - 1
+
+    def __span_sorted(self, nodes: Tuple[float]) -> Tuple[int]:
+        """
+        Finds the spans of sorted nodes by one sweep over the knots.
+        Only the first and the last nodes are verified
+        """
+        if len(nodes) == 0:
+            return tuple()
+        umin, umax = self.limits
+        if not (umin <= nodes[0] and nodes[-1] <= umax):
+            raise ValueError
+        npts = self.npts
+        spans = [npts - 1] * len(nodes)
+        index = self.degree
+        for j, node in enumerate(nodes):
+            if node == umax:  # Special case, all the next nodes are umax
+                break
+            while self[index + 1] <= node:
+                index += 1
+            spans[j] = index
+        return tuple(spans)
 
     def __mult_single(self, node: Tuple[float]) -> Tuple[int]:
-        return sum(abs(node - knot) < 1e-9 for knot in self)
+        tolerance = self.__tolerance
+        left = bisect_right(self, node - tolerance)
+        return max(0, bisect_left(self, node + tolerance, left) - left)
 
     def __valid_single(self, node: float) -> bool:
         try:
@@ -165,7 +324,16 @@ class ImmutableKnotVector(tuple):
             return False
         return True
 
-    def span(self, nodes: Union[float, Tuple[float]]) -> Union[int, Tuple[int]]:
+    def span(
+        self, nodes: Union[float, Tuple[float]], assume_sorted: bool = False
+    ) -> Union[int, Tuple[int]]:
+        if assume_sorted and not isinstance(nodes, str):
+            try:
+                nodes = tuple(nodes)
+            except TypeError:
+                pass
+            else:
+                return self.__span_sorted(nodes)
         if not self.valid(nodes):
             raise ValueError
         try:
@@ -274,6 +442,78 @@ class Math:
         return numerator // denominator
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """
+    Bounded dictionary that discards the least recently used item
+    when it's full. It also counts the hits and misses of ``get``.
+    The stored values must be immutable, since the same instance
+    is returned for every hit.
+
+    Example
+    ------------
+    >>> cache = LRUCache(2)
+    >>> cache["a"] = 1
+    >>> cache.get("a")
+    1
+    >>> cache.get("b") is None
+    True
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.__items = OrderedDict()
+        self.maxsize = maxsize
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__items
+
+    def __setitem__(self, key: Hashable, value: Any):
+        if self.maxsize == 0:
+            return
+        self.__items[key] = value
+        self.__items.move_to_end(key)
+        while len(self.__items) > self.maxsize:
+            self.__items.popitem(last=False)
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        assert isinstance(value, int)
+        assert value >= 0
+        self.__maxsize = value
+        while len(self.__items) > value:
+            self.__items.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self.__items[key]
+        except KeyError:
+            self.__misses += 1
+            return default
+        self.__items.move_to_end(key)
+        self.__hits += 1
+        return value
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.__hits, self.__misses, self.maxsize, len(self))
+
+    def clear(self):
+        self.__items.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
 def number_type(number: Union[int, float, Fraction]):
     """
     Returns the type of a number, if it's a integer, a float, fraction
@@ -303,6 +543,46 @@ def number_type(number: Union[int, float, Fraction]):
         return float
 
 
+def is_float(*arrays: Tuple[float]) -> bool:
+    """
+    Tells if the given arrays of numbers can be treated as float64 arrays.
+    It's true only when all the values are python/numpy integers or floats
+    and at least one of them is a float:
+        [int, int, int] -> False
+        [int, float, int] -> True
+        [Fraction, float, int] -> False
+        [CustomFloat, float] -> False
+    """
+    hasfloat = False
+    for numbers in arrays:
+        if isinstance(numbers, np.ndarray) and numbers.dtype.kind in "iuf":
+            hasfloat |= numbers.dtype.kind == "f"
+            continue
+        for number in numbers:
+            if isinstance(number, (float, np.floating)):
+                hasfloat = True
+            elif not isinstance(number, (int, np.integer)):
+                return False
+    return hasfloat
+
+
+def is_exact(*arrays: Tuple[float]) -> bool:
+    """
+    Tells if the given arrays of numbers have only python/numpy
+    integers and Fractions, which allows exact integer arithmetic:
+        [int, int, int] -> True
+        [int, Fraction, int] -> True
+        [Fraction, float, int] -> False
+    """
+    for numbers in arrays:
+        if isinstance(numbers, np.ndarray) and numbers.dtype.kind in "iu":
+            continue
+        for number in numbers:
+            if not isinstance(number, (int, np.integer, Fraction)):
+                return False
+    return True
+
+
 def find_roots(
     knotvector: ImmutableKnotVector, ctrlvalues: Tuple[float]
 ) -> Tuple[float]:
@@ -329,14 +609,10 @@ def find_roots(
         nodes = [start + (end - start) * node for node in nodes0to1]
         manynodes += nodes
     manynodes = tuple(sorted(manynodes + list(knots)))
-    matrixeval = eval_spline_nodes(knotvector, manynodes, degree)
-    manyvalues = np.dot(np.transpose(matrixeval), ctrlvalues)
-    manyvalues = tuple(manyvalues)
-    while 0 in manyvalues:
-        index = manyvalues.index(0)
-        manyvalues.pop(index)
-        manynodes.pop(index)
-    # return tuple(sorted(manynodes))
+    spans, values = eval_spline_banded(knotvector, manynodes, degree)
+    manyvalues = banded_dot(spans, values, ctrlvalues)
+    # The sampled nodes with exact zero values are roots
+    zeros = [node for node, value in zip(manynodes, manyvalues) if value == 0]
 
     # Bissection algorithm
     lefts = []  # a
@@ -353,7 +629,7 @@ def find_roots(
             frigh.append(bval)
     nintervs = len(lefts)
     if nintervs == 0:
-        return tuple()
+        return tuple(sorted(set(zeros)))
     lefts = np.array(lefts, dtype="float64")
     righs = np.array(righs, dtype="float64")
     fleft = np.array(fleft, dtype="float64")
@@ -376,7 +652,7 @@ def find_roots(
                 lefts[i] = mednodes[i]
                 fleft[i] = medval
     roots = (lefts + righs) / 2
-    filtered_roots = []
+    filtered_roots = sorted(set(zeros))
     for root in roots:
         for filtroot in filtered_roots:
             if abs(root - filtroot) < tolerance:
@@ -410,37 +686,258 @@ def binom(n: int, i: int):
     return int(prod)
 
 
+def banded_todense(
+    spans: Tuple[int], values: Tuple[Tuple[float]], ncols: int
+) -> np.ndarray:
+    """
+    Converts the compact banded representation into a dense matrix.
+    The line j has only the values at the columns
+        spans[j] - width + 1, ..., spans[j]
+    which width = values.shape[1], such
+        M_{j, spans[j] - width + 1 + y} = values[j, y]
+    M.shape = (len(spans), ncols)
+    """
+    values = np.array(values)
+    spans = np.array(spans, dtype="int64")
+    nlines, width = values.shape
+    dtype = "float64" if values.dtype.kind == "f" else "object"
+    result = np.zeros((nlines, ncols), dtype=dtype)
+    columns = spans[:, np.newaxis] + np.arange(1 - width, 1)
+    result[np.arange(nlines)[:, np.newaxis], columns] = values
+    return result
+
+
+def banded_dot(
+    spans: Tuple[int], values: Tuple[Tuple[float]], points: Tuple[Any]
+) -> np.ndarray:
+    """
+    Computes the product [M] @ [P] without building the dense matrix [M]
+    given by its compact banded representation (see ``banded_todense``)
+        result_j = sum_y values[j, y] * P_{spans[j] - width + 1 + y}
+    The cost is O(len(spans) * width) instead of O(len(spans) * len(points))
+    """
+    values = np.array(values)
+    spans = np.array(spans, dtype="int64")
+    points = np.asarray(points)
+    nlines, width = values.shape
+    indexs = spans[:, np.newaxis] + np.arange(1 - width, 1)
+    shape = (nlines,) + (1,) * (points.ndim - 1)
+    result = values[:, 0].reshape(shape) * points[indexs[:, 0]]
+    for y in range(1, width):
+        result += values[:, y].reshape(shape) * points[indexs[:, y]]
+    return result
+
+
+def banded_gram(
+    banda: Tuple[np.ndarray],
+    bandb: Tuple[np.ndarray],
+    shape: Tuple[int],
+    weights: Optional[Tuple[float]] = None,
+) -> np.ndarray:
+    """
+    Given two matrices [A] and [B] with the same number of lines,
+    in the compact banded representation (spans, values),
+    computes the matrix [A]^T @ diag(weights) @ [B] of given shape
+        result.shape = (ncolsA, ncolsB)
+    The cost is O(nlines * widthA * widthB)
+    """
+    spansa, valuesa = banda
+    spansb, valuesb = bandb
+    assert len(spansa) == len(spansb)
+    if weights is not None:
+        valuesa = valuesa * np.array(weights)[:, np.newaxis]
+    widtha, widthb = valuesa.shape[1], valuesb.shape[1]
+    indexsa = spansa[:, np.newaxis] + np.arange(1 - widtha, 1)
+    indexsb = spansb[:, np.newaxis] + np.arange(1 - widthb, 1)
+    floats = valuesa.dtype.kind == "f" and valuesb.dtype.kind == "f"
+    result = np.zeros(shape, dtype="float64" if floats else "object")
+    for y in range(widtha):
+        for z in range(widthb):
+            indexs = (indexsa[:, y], indexsb[:, z])
+            np.add.at(result, indexs, valuesa[:, y] * valuesb[:, z])
+    return result
+
+
+def span_segments(
+    knotvector: ImmutableKnotVector,
+    nodes: Tuple[float],
+    assume_sorted: bool = False,
+    check: bool = True,
+) -> Tuple[np.ndarray]:
+    """
+    Finds the segment [knots[z], knots[z+1]] of each node, and its span.
+    A node between knots closer than the tolerance, which are the
+    same knot, is placed in the segment before them
+    If not ``check``, the nodes are not verified: it's only one
+    bisection over the knotvector by node
+        spans.shape = segments.shape = (len(nodes), )
+    """
+    spans = np.array(knotvector.spans, dtype="int64")
+    if check:
+        nodespans = knotvector.span(nodes, assume_sorted)
+    else:  # The node umax gives the span npts, placed in the last segment
+        lower, upper = knotvector.degree, knotvector.npts + 1
+        nodespans = [bisect_right(knotvector, node, lower, upper) for node in nodes]
+        nodespans = np.array(nodespans, dtype="int64") - 1
+    nodespans = np.array(nodespans, dtype="int64").reshape(-1)
+    segments = np.searchsorted(spans, nodespans, side="right") - 1
+    segments = np.clip(segments, 0, len(spans) - 1)
+    return spans[segments], segments
+
+
+def eval_spline_banded(
+    knotvector: ImmutableKnotVector,
+    nodes: Tuple[float],
+    degree: int,
+    assume_sorted: bool = False,
+    check: bool = True,
+) -> Tuple[np.ndarray]:
+    """
+    Returns the compact representation of the matrix M of which
+    M_{ij} = N_{i,degree}(node_j), made by the pair (spans, values)
+        spans.shape = (len(nodes), )
+        values.shape = (len(nodes), degree + 1)
+        N_{i,degree}(node_j) = values[j, i - spans[j] + degree]
+    All the other basis functions are zero at node_j.
+
+    If the knots and the nodes are plain floats, it uses the
+    vectorized ``eval_spline_banded_float`` and values is a float64 array
+    If ``assume_sorted``, the spans are found by one sweep over the knots
+    If not ``check``, the knotvector must be an ImmutableKnotVector and
+    the verifications of the inputs are skipped: the nodes are placed by
+    bisection only, see ``span_segments``
+    """
+    if check:
+        knotvector = ImmutableKnotVector(knotvector)
+        assert isinstance(nodes, (tuple, list, np.ndarray))
+        maxdegree = knotvector.degree
+        assert isinstance(degree, int)
+        assert 0 <= degree
+        assert degree <= maxdegree
+
+    # The integer tables are cached: they avoid walking the exact knots
+    if is_exact(nodes) and BasisFunction.speval_integers(knotvector, degree):
+        return eval_spline_banded_exact(knotvector, nodes, degree, assume_sorted, check)
+    if is_float(knotvector, nodes):
+        return eval_spline_banded_float(knotvector, nodes, degree, check)
+    knots = knotvector.knots
+    spans, segments = span_segments(knotvector, nodes, assume_sorted, check)
+    matrix3d = BasisFunction.speval_matrix(knotvector, degree)
+    values = np.empty((len(nodes), degree + 1), dtype="object")
+    for j, (node, ind) in enumerate(zip(nodes, segments)):
+        shifnode = node - knots[ind]
+        shifnode /= knots[ind + 1] - knots[ind]
+        for y, coefs in enumerate(matrix3d[ind]):
+            values[j, y] = BasisFunction.horner_method(coefs, shifnode)
+    return spans, values
+
+
+def eval_spline_banded_float(
+    knotvector: ImmutableKnotVector,
+    nodes: Tuple[float],
+    degree: int,
+    check: bool = True,
+) -> Tuple[np.ndarray]:
+    """
+    Vectorized version of ``eval_spline_banded`` for float64 knots and nodes.
+    Finds all the segments at once by ``np.searchsorted`` and then
+    uses horner's method over all the nodes at the same time.
+    """
+    knotvector = ImmutableKnotVector(knotvector)
+    nodes = np.asarray(nodes, dtype="float64").reshape(-1)
+    knots = np.array(knotvector.knots, dtype="float64")
+    if check and (np.any(nodes < knots[0]) or np.any(knots[-1] < nodes)):
+        raise ValueError("Nodes outside the knotvector limits")
+    spans = knotvector.spans
+    spans = np.array(spans, dtype="int64")
+    matrix3d = BasisFunction.speval_matrix(knotvector, degree)
+    matrix3d = np.array(matrix3d, dtype="float64")
+
+    segments = np.searchsorted(knots, nodes, side="right") - 1
+    segments = np.clip(segments, 0, len(knots) - 2)  # Special case umax
+    lefts = knots[segments]
+    shifnodes = (nodes - lefts) / (knots[segments + 1] - lefts)
+    values = matrix3d[segments, :, degree]
+    for k in range(degree - 1, -1, -1):
+        values *= shifnodes[:, np.newaxis]
+        values += matrix3d[segments, :, k]
+    return spans[segments], values
+
+
+def eval_spline_banded_exact(
+    knotvector: ImmutableKnotVector,
+    nodes: Tuple[Union[int, Fraction]],
+    degree: int,
+    assume_sorted: bool = False,
+    check: bool = True,
+) -> Tuple[np.ndarray]:
+    """
+    Version of ``eval_spline_banded`` for integer and Fraction knots
+    and nodes. The coefficients of each segment have a common denominator
+    (see ``BasisFunction.speval_integers``), then if t = p/q
+        sum_k c_k/D * t^k = (sum_k c_k * p^k * q^(degree-k)) / (D * q^degree)
+    The horner's method is made only with python integers,
+    creating one Fraction by value at the end.
+    """
+    knots = knotvector.knots
+    denoms, numers = BasisFunction.speval_integers(knotvector, degree)
+    spans, segments = span_segments(knotvector, nodes, assume_sorted, check)
+    numnodes = np.empty(len(nodes), dtype="object")
+    dennodes = np.empty(len(nodes), dtype="object")
+    for j, (node, z) in enumerate(zip(nodes, segments)):
+        shifnode = Fraction(node - knots[z]) / (knots[z + 1] - knots[z])
+        numnodes[j] = shifnode.numerator
+        dennodes[j] = shifnode.denominator
+    numnodes = numnodes[:, np.newaxis]
+    powers = np.ones(len(nodes), dtype="object")
+    table = numers[segments]
+    result = table[:, :, degree]
+    for k in range(degree - 1, -1, -1):
+        powers *= dennodes
+        result = result * numnodes + table[:, :, k] * powers[:, np.newaxis]
+    powers *= denoms[segments]
+    values = np.empty((len(nodes), degree + 1), dtype="object")
+    for j, (numbs, denom) in enumerate(zip(result, powers)):
+        values[j] = [Fraction(numb, denom) for numb in numbs]
+    return spans, values
+
+
+def eval_rational_banded(
+    knotvector: ImmutableKnotVector,
+    weights: Tuple[float],
+    nodes: Tuple[float],
+    degree: int,
+) -> Tuple[np.ndarray]:
+    """
+    Same as ``eval_spline_banded``, but for rational basis functions
+        R_{i,degree}(node_j) = values[j, i - spans[j] + degree]
+    Only the degree+1 weights of each node are used
+    """
+    assert isinstance(weights, (tuple, list, np.ndarray))
+    spans, values = eval_spline_banded(knotvector, nodes, degree)
+    dtype = "float64" if values.dtype.kind == "f" else "object"
+    weights = np.array(weights, dtype=dtype)
+    indexs = spans[:, np.newaxis] + np.arange(-degree, 1)
+    values = values * weights[indexs]
+    denoms = np.sum(values, axis=1)
+    values /= denoms[:, np.newaxis]
+    return spans, values
+
+
 def eval_spline_nodes(
     knotvector: ImmutableKnotVector, nodes: Tuple[float], degree: int
 ) -> Tuple[Tuple[float]]:
     """
     Returns a matrix M of which M_{ij} = N_{i,degree}(node_j)
     M.shape = (npts, len(nodes))
+
+    It's the dense version of ``eval_spline_banded``.
+    If the knots and the nodes are plain floats, returns a float64 array
     """
     knotvector = ImmutableKnotVector(knotvector)
-    assert isinstance(nodes, (tuple, list))
-    maxdegree = knotvector.degree
-    assert isinstance(degree, int)
-    assert 0 <= degree
-    assert degree <= maxdegree
-
-    npts = knotvector.npts
-    knots = knotvector.knots
-    spans = knotvector.span(knots)
-    result = np.zeros((npts, len(nodes)), dtype="object")
-    matrix3d = BasisFunction.speval_matrix(knotvector, degree)
-    matrix3d = np.array(matrix3d)
-    for j, node in enumerate(nodes):
-        span = knotvector.span(node)
-        ind = spans.index(span)
-        shifnode = node - knots[ind]
-        shifnode /= knots[ind + 1] - knots[ind]
-        for y in range(degree + 1):
-            i = y + span - degree
-            coefs = matrix3d[ind, y]
-            value = BasisFunction.horner_method(coefs, shifnode)
-            result[i, j] = value
-    return totuple(result)
+    spans, values = eval_spline_banded(knotvector, nodes, degree)
+    result = banded_todense(spans, values, knotvector.npts).T
+    return result if values.dtype.kind == "f" else totuple(result)
 
 
 def eval_rational_nodes(
@@ -450,25 +947,415 @@ def eval_rational_nodes(
     degree: int,
 ) -> Tuple[Tuple[float]]:
     """
-    Returns a matrix M of which M_{ij} = N_{i,p}(node_j)
+    Returns a matrix M of which M_{ij} = R_{i,p}(node_j)
     M.shape = (len(weights), len(nodes))
+
+    It's the dense version of ``eval_rational_banded``.
+    If the knots and the nodes are plain floats, returns a float64 array
+    """
+    knotvector = ImmutableKnotVector(knotvector)
+    degree = knotvector.degree if (degree is None) else degree
+    assert len(weights) == knotvector.npts
+    spans, values = eval_rational_banded(knotvector, weights, nodes, degree)
+    result = banded_todense(spans, values, knotvector.npts).T
+    return result if values.dtype.kind == "f" else totuple(result)
+
+
+def piecewise_coefficients(
+    knotvector: ImmutableKnotVector,
+    points: Tuple[Any],
+    degree: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Returns the coefficients of the polynomials which describe the
+    spline curve of given control points at each interval
+    [knots[z], knots[z+1]], in the local parameter t in [0, 1]
+        C(u) = sum_k coefs[z, k] * t^k
+        t = (u - knots[z]) / (knots[z+1] - knots[z])
+    coefs.shape = (len(knots) - 1, degree + 1, *pointshape)
+    If degree is lower than knotvector's degree, then
+    only the last (npts - knotvector.degree + degree) points are used
+    """
+    knotvector = ImmutableKnotVector(knotvector)
+    assert len(points) == knotvector.npts
+    degree = knotvector.degree if degree is None else degree
+    assert 0 <= degree <= knotvector.degree
+    spans = knotvector.spans
+    matrix3d = np.array(BasisFunction.speval_matrix(knotvector, degree))
+    coefs = [banded_dot(spans, matrix3d[:, :, k], points) for k in range(degree + 1)]
+    return np.stack(coefs, axis=1)
+
+
+def locate_nodes(
+    knotvector: ImmutableKnotVector, nodes: Tuple[float]
+) -> Tuple[np.ndarray]:
+    """
+    Finds the interval [knots[z], knots[z+1]] of each node, and
+    returns the triplet (segments, shifnodes, lengths) such
+        knots = knotvector.knots
+        lengths[j] = knots[segments[j]+1] - knots[segments[j]]
+        node[j] = knots[segments[j]] + shifnodes[j] * lengths[j]
+    """
+    knotvector = ImmutableKnotVector(knotvector)
+    knots = knotvector.knots
+    if is_float(knotvector, nodes):
+        knots = np.array(knots, dtype="float64")
+        nodes = np.array(nodes, dtype="float64").reshape(-1)
+        if np.any(nodes < knots[0]) or np.any(knots[-1] < nodes):
+            raise ValueError("Nodes outside the knotvector limits")
+        return locate_float(knots, nodes)
+    segments = {span: z for z, span in enumerate(knotvector.spans)}
+    segments = [segments[span] for span in knotvector.span(nodes)]
+    shifnodes = np.empty(len(nodes), dtype="object")
+    lengths = np.empty(len(nodes), dtype="object")
+    for j, (node, ind) in enumerate(zip(nodes, segments)):
+        lengths[j] = knots[ind + 1] - knots[ind]
+        shifnode = node - knots[ind]
+        shifnode /= lengths[j]
+        shifnodes[j] = shifnode
+    return np.array(segments, dtype="int64"), shifnodes, lengths
+
+
+def locate_float(knots: np.ndarray, nodes: np.ndarray) -> Tuple[np.ndarray]:
+    """
+    Version of ``locate_nodes`` which receives the float64 arrays
+    of the knots and of the nodes, without verifying the nodes
+    """
+    segments = np.searchsorted(knots, nodes, side="right") - 1
+    segments = np.clip(segments, 0, len(knots) - 2)  # Special case umax
+    lefts = knots[segments]
+    lengths = knots[segments + 1] - lefts
+    return segments, (nodes - lefts) / lengths, lengths
+
+
+def piecewise_horner(
+    coefs: np.ndarray,
+    location: Tuple[np.ndarray],
+    derivative: int = 0,
+) -> np.ndarray:
+    """
+    Evaluates the derivative of given order of the piecewise polynomial
+    of coefficients ``coefs`` (see ``piecewise_coefficients``) at
+    the nodes described by location (see ``locate_nodes``)
+        d^m C/du^m = (1/length)^m * sum_{k>=m} k!/(k-m)! * coefs[z, k] * t^(k-m)
+        result.shape = (len(nodes), *pointshape)
+    """
+    assert isinstance(derivative, int)
+    assert derivative >= 0
+    segments, shifnodes, lengths = location
+    shape = (len(segments),) + (1,) * (coefs.ndim - 2)
+    shifnodes = shifnodes.reshape(shape)
+    degree = coefs.shape[1] - 1
+    if derivative > degree:
+        return 0 * coefs[segments, 0]
+    factors = [Math.factorial(derivative)]  # k!/(k-m)! for k = m, ..., degree
+    for k in range(derivative + 1, degree + 1):
+        factors.append(factors[-1] * k // (k - derivative))
+    result = factors[-1] * coefs[segments, degree]
+    for k in range(degree - 1, derivative - 1, -1):
+        result = result * shifnodes + factors[k - derivative] * coefs[segments, k]
+    if derivative:
+        result = result / lengths.reshape(shape) ** derivative
+    return result
+
+
+def eval_piecewise(
+    knotvector: ImmutableKnotVector,
+    coefs: np.ndarray,
+    nodes: Tuple[float],
+    derivative: int = 0,
+) -> np.ndarray:
+    """
+    Evaluates at the nodes the piecewise polynomial given by the
+    coefficients computed by ``piecewise_coefficients``.
+    Each node needs only the search of its interval and
+    one horner's method step for each degree
+        result.shape = (len(nodes), *pointshape)
+    """
+    knotvector = ImmutableKnotVector(knotvector)
+    assert len(coefs) == len(knotvector.knots) - 1
+    location = locate_nodes(knotvector, nodes)
+    return piecewise_horner(coefs, location, derivative)
+
+
+def forward_differences(
+    coefs: np.ndarray,
+    starts: Tuple[float],
+    steps: Tuple[float],
+    counts: Tuple[int],
+    anchor: int = 64,
+) -> np.ndarray:
+    """
+    Evaluates the piecewise polynomial of coefficients ``coefs``
+    (see ``piecewise_coefficients``) at equally spaced nodes:
+    at the segment z, there are counts[z] nodes with local parameters
+        t = starts[z] + i * steps[z],   i = 0, ..., counts[z]-1
+    The result is cut in blocks of ``anchor`` nodes. The table of
+    forward differences is computed at the first node of each block
+    from the derivatives, avoiding the cancellation of subtracting
+    near values and limiting the accumulation of floating-point errors
+        Delta^k P(t) = sum_{j=k}^{p} k! * S(j, k) * h^j/j! * P^(j)(t)
+    with S the Stirling numbers of second kind. Stepping the table
+    i times gives Newton's forward formula
+        P(t + i * h) = sum_{k=0}^{p} binom(i, k) * Delta^k P(t)
+    which steps all the blocks together by one matrix product.
+    The few blocks which cross the end of a segment are evaluated
+    by horner's method.
+        result.shape = (sum(counts), *pointshape)
+    """
+    assert isinstance(anchor, int) and anchor > 0
+    coefs = np.array(coefs, dtype="float64")
+    starts = np.array(starts, dtype="float64")
+    steps = np.array(steps, dtype="float64")
+    counts = np.array(counts, dtype="int64")
+    nsegs, degree = coefs.shape[0], coefs.shape[1] - 1
+    assert starts.shape == steps.shape == counts.shape == (nsegs,)
+    ends = np.cumsum(counts)
+    firsts = ends - counts
+    result = np.empty((np.sum(counts),) + coefs.shape[2:], dtype="float64")
+
+    # Blocks [begin, begin + anchor) of the result
+    nblocks = len(result) // anchor
+    begins = anchor * np.arange(nblocks)
+    segments = np.searchsorted(ends, begins, side="right")
+    lasts = np.searchsorted(ends, begins + anchor - 1, side="right")
+    shifnodes = starts[segments] + (begins - firsts[segments]) * steps[segments]
+    location = (segments, shifnodes, np.ones(nblocks, dtype="float64"))
+    table = forward_table(coefs, location, steps[segments])
+    binoms = np.ones((anchor, degree + 1), dtype="float64")
+    for k in range(1, degree + 1):  # binoms[i, k] = binom(i, k)
+        binoms[:, k] = binoms[:, k - 1] * (np.arange(anchor) - k + 1) / k
+    width = int(np.prod(coefs.shape[2:]))
+    values = result[: nblocks * anchor].reshape((nblocks, anchor, width))
+    np.matmul(binoms, table.reshape((nblocks, degree + 1, width)), out=values)
+
+    # Nodes of the blocks over two segments and after the last block
+    crosses = begins[segments != lasts, np.newaxis] + np.arange(anchor)
+    tail = np.arange(nblocks * anchor, len(result))
+    indexs = np.concatenate((crosses.reshape(-1), tail))
+    segments = np.searchsorted(ends, indexs, side="right")
+    shifnodes = starts[segments] + (indexs - firsts[segments]) * steps[segments]
+    location = (segments, shifnodes, np.ones(len(indexs), dtype="float64"))
+    result[indexs] = piecewise_horner(coefs, location)
+    return result
+
+
+def forward_table(
+    coefs: np.ndarray, location: Tuple[np.ndarray], steps: np.ndarray
+) -> np.ndarray:
+    """
+    Computes the tables of forward differences used by
+    ``forward_differences``, at the nodes given by location
+    (see ``locate_nodes``) with the local steps ``steps``
+        table[j, k] = Delta^k P(node_j),   with h = steps[j]
+        table.shape = (len(nodes), degree + 1, *pointshape)
     """
+    degree = coefs.shape[1] - 1
+    segments = location[0]
+    stirling = np.zeros((degree + 1, degree + 1), dtype="int64")
+    stirling[0, 0] = 1
+    for j in range(1, degree + 1):
+        for k in range(1, j + 1):
+            stirling[j, k] = k * stirling[j - 1, k] + stirling[j - 1, k - 1]
+    shape = (len(segments),) + (1,) * (coefs.ndim - 2)
+    taylor = [
+        piecewise_horner(coefs, location, j)
+        * (steps**j / Math.factorial(j)).reshape(shape)
+        for j in range(degree + 1)
+    ]
+    table = np.empty((len(segments), degree + 1) + coefs.shape[2:], dtype="float64")
+    for k in range(degree + 1):  # table[:, k] = k-th forward difference
+        table[:, k] = sum(
+            Math.factorial(k) * int(stirling[j, k]) * taylor[j]
+            for j in range(k, degree + 1)
+        )
+    return table
+
+
+def bezier_flat_params(
+    points: Tuple[Any],
+    weights: Optional[Tuple[float]],
+    tolerance: float,
+    maxdepth: int = 32,
+) -> Tuple[float]:
+    """
+    Subdivides recursively a bezier curve at the middle by de Casteljau's
+    algorithm, until the control points of each piece are at a distance
+    lower than the tolerance from the chord between its extremities.
+    Since each piece lies inside the convex hull of its control points,
+    the polyline made by the chords is at most at tolerance of the curve.
+    Rational curves are subdivided in homogeneous coordinates.
+    Raises ValueError if a piece of depth ``maxdepth`` is still not flat,
+    like when the tolerance is below the floating-point precision.
+
+    Returns the sorted parameters t in [0, 1] of the extremities of pieces
+        (0, t_1, ..., t_{k-1}, 1)
+    """
+    points = np.array(points, dtype="float64")
+    points = points.reshape((len(points), -1))
+    if weights is None:
+        weights = np.ones(len(points), dtype="float64")
+    weights = np.array(weights, dtype="float64").reshape((-1, 1))
+    homogeneous = np.concatenate((weights * points, weights), axis=1)
+
+    params = []
+    stack = [(0.0, 1.0, homogeneous, 0)]
+    while stack:
+        tmin, tmax, ctrlpts, depth = stack.pop()
+        projected = ctrlpts[:, :-1] / ctrlpts[:, -1:]
+        start, chord = projected[0], projected[-1] - projected[0]
+        diffs = projected[1:-1] - start
+        length2 = np.inner(chord, chord)
+        if length2 > 0:
+            coefs = np.clip(np.dot(diffs, chord) / length2, 0, 1)
+            diffs = diffs - np.outer(coefs, chord)
+        distance = np.max(np.linalg.norm(diffs, axis=1), initial=0)
+        if distance <= tolerance:
+            params.append(tmin)
+            continue
+        if depth == maxdepth:
+            error_msg = f"Tolerance {tolerance} not reached "
+            error_msg += f"after {maxdepth} subdivisions: distance {distance}"
+            raise ValueError(error_msg)
+        lefts, righs = [ctrlpts[0]], [ctrlpts[-1]]
+        while len(ctrlpts) > 1:  # de Casteljau at t = 1/2
+            ctrlpts = (ctrlpts[:-1] + ctrlpts[1:]) / 2
+            lefts.append(ctrlpts[0])
+            righs.append(ctrlpts[-1])
+        tmid = (tmin + tmax) / 2
+        stack.append((tmid, tmax, np.array(righs[::-1]), depth + 1))
+        stack.append((tmin, tmid, np.array(lefts), depth + 1))
+    params.append(1.0)
+    return tuple(params)
+
+
+_PROCESS_POOLS = {}  # Pools of parallel_piecewise, by (pid, workers)
+
+
+def _process_pool(workers: int) -> Any:
+    """
+    Gives the pool of ``workers`` processes used by ``parallel_piecewise``.
+    The pool is created at the first call and reused by the next ones
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    key = (os.getpid(), workers)  # A forked process cannot use the parent's pool
+    if key not in _PROCESS_POOLS:
+        _PROCESS_POOLS[key] = ProcessPoolExecutor(max_workers=workers)
+    return _PROCESS_POOLS[key]
+
+
+@atexit.register
+def _shutdown_pools():
+    """
+    Closes the pools of ``_process_pool`` while the interpreter is alive
+    """
+    for pool in _PROCESS_POOLS.values():
+        pool.shutdown()
+    _PROCESS_POOLS.clear()
+
+
+def _parallel_chunk(
+    names: Tuple[str],
+    shapes: Tuple[Tuple[int]],
+    start: int,
+    stop: int,
+):
+    """
+    Task of ``parallel_piecewise``: evaluates the nodes[start:stop]
+    reading the knots, the coefficients and the nodes, and writing
+    the result directly in the shared memory blocks
+    """
+    from multiprocessing import shared_memory
+
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    arrays = None
+    try:
+        arrays = [
+            np.ndarray(shape, dtype="float64", buffer=block.buf)
+            for shape, block in zip(shapes, blocks)
+        ]
+        knots, nodes, result, numerator = arrays[:4]
+        location = locate_float(knots, nodes[start:stop])
+        values = piecewise_horner(numerator, location)
+        if len(arrays) > 4:
+            denoms = piecewise_horner(arrays[4], location)
+            values /= denoms.reshape((-1,) + (1,) * (values.ndim - 1))
+        result[start:stop] = values
+    finally:
+        # Releases the buffers before closing
+        arrays = knots = nodes = result = numerator = location = None
+        for block in blocks:
+            block.close()
+
+
+def parallel_piecewise(
+    knotvector: ImmutableKnotVector,
+    numerator: np.ndarray,
+    denominator: Optional[np.ndarray],
+    nodes: Tuple[float],
+    workers: Optional[int] = None,
+    executor: Optional[Any] = None,
+) -> np.ndarray:
+    """
+    Evaluates the piecewise polynomial numerator/denominator
+    (see ``piecewise_coefficients``) at the nodes using many processes.
+    The knots, the coefficients, the nodes and the result are placed
+    in shared memory blocks, such each task carries only the names
+    of the blocks and its chunk limits: nothing else is pickled.
+
+    The nodes are split in ``4 * workers`` chunks, and ``workers`` is
+    the number of CPUs if not given.
+    If ``executor`` is not given, like ``ProcessPoolExecutor``, it uses
+    a pool of ``workers`` processes kept between the calls.
+    It works only with float64 knots, nodes and coefficients
+        result.shape = (len(nodes), *pointshape)
+    """
+    from multiprocessing import shared_memory
+
     knotvector = ImmutableKnotVector(knotvector)
-    assert isinstance(weights, (tuple, list))
-    assert isinstance(nodes, (tuple, list))
-    maxdegree = knotvector.degree
-    degree = maxdegree if (degree is None) else degree
-    assert isinstance(degree, int)
-    assert 0 <= degree
-    assert degree <= maxdegree
-
-    rationalvals = eval_spline_nodes(knotvector, nodes, degree)
-    rationalvals = np.array(rationalvals)
-    for j, node in enumerate(nodes):
-        denom = np.inner(rationalvals[:, j], weights)
-        for i, weight in enumerate(weights):
-            rationalvals[i, j] *= weight / denom
-    return totuple(rationalvals)
+    knots = np.array(knotvector.knots, dtype="float64")
+    nodes = np.asarray(nodes, dtype="float64").reshape(-1)
+    if np.any(nodes < knots[0]) or np.any(knots[-1] < nodes):
+        raise ValueError("Nodes outside the knotvector limits")
+    numerator = np.asarray(numerator, dtype="float64")
+    arrays = [knots, nodes, None, numerator]  # None is the result
+    if denominator is not None:
+        arrays.append(np.asarray(denominator, dtype="float64"))
+    shapes = [array.shape for array in arrays[:2]]
+    shapes += [nodes.shape + numerator.shape[2:]]
+    shapes += [array.shape for array in arrays[3:]]
+    if len(nodes) == 0:
+        return np.zeros(shapes[2], dtype="float64")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    assert isinstance(workers, int) and workers > 0
+    executor = _process_pool(workers) if executor is None else executor
+    nchunks = min(len(nodes), 4 * workers)
+    limits = [len(nodes) * i // nchunks for i in range(nchunks + 1)]
+
+    blocks = []
+    try:
+        for array, shape in zip(arrays, shapes):
+            size = max(1, 8 * int(np.prod(shape)))
+            blocks.append(shared_memory.SharedMemory(create=True, size=size))
+            if array is not None:
+                buffer = blocks[-1].buf
+                np.ndarray(shape, dtype="float64", buffer=buffer)[:] = array
+        names = tuple(block.name for block in blocks)
+        futures = [
+            executor.submit(_parallel_chunk, names, shapes, start, stop)
+            for start, stop in zip(limits[:-1], limits[1:])
+        ]
+        for future in futures:
+            future.result()
+        buffer = blocks[2].buf
+        result = np.array(np.ndarray(shapes[2], dtype="float64", buffer=buffer))
+    finally:
+        buffer = None  # Releases the buffers before closing
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return result
 
 
 class Linalg:
@@ -629,10 +1516,14 @@ class LeastSquare:
         degree = knotvector.degree
         assert len(nodes) >= npts
         if weights is None:
-            funcvals = eval_spline_nodes(knotvector, nodes, degree)
+            banded = eval_spline_banded(knotvector, nodes, degree)
         else:
-            funcvals = eval_rational_nodes(knotvector, weights, nodes, degree)
-        return Linalg.lstsq(np.transpose(funcvals))
+            banded = eval_rational_banded(knotvector, weights, nodes, degree)
+        matrix = banded_todense(banded[0], banded[1], npts)
+        if len(nodes) == npts:
+            return Linalg.lstsq(matrix)
+        gram = banded_gram(banded, banded, (npts, npts))
+        return Linalg.solve(gram, matrix.T)
 
     @staticmethod
     def spline2spline(
@@ -718,18 +1609,17 @@ class LeastSquare:
         for start, end in zip(allknots[:-1], allknots[1:]):
             nodes = start + (end - start) * nodes0to1
             # Integral of the functions in the interval [a, b]
-            Fvalues = eval_rational_nodes(
+            spans, values = eval_rational_banded(
                 oldknotvector, oldweights, tuple(nodes), olddegree
             )
-            Gvalues = eval_rational_nodes(
+            Fband = (spans, np.array(values, dtype=numbtype))
+            spans, values = eval_rational_banded(
                 newknotvector, newweights, tuple(nodes), newdegree
             )
-            Fvalues = np.array(Fvalues, dtype=numbtype)
-            Gvalues = np.array(Gvalues, dtype=numbtype)
-            for k, integ in enumerate(integrator):
-                FF += integ * np.tensordot(Fvalues[:, k], Fvalues[:, k], axes=0)
-                GF += integ * np.tensordot(Gvalues[:, k], Fvalues[:, k], axes=0)
-                GG += integ * np.tensordot(Gvalues[:, k], Gvalues[:, k], axes=0)
+            Gband = (spans, np.array(values, dtype=numbtype))
+            FF += banded_gram(Fband, Fband, FF.shape, integrator)
+            GF += banded_gram(Gband, Fband, GF.shape, integrator)
+            GG += banded_gram(Gband, Gband, GG.shape, integrator)
 
         GGinv = Linalg.invert(GG)
         if fit_nodes is None:
@@ -755,6 +1645,29 @@ class LeastSquare:
 
 
 class BasisFunction:
+    __cache = LRUCache(256)
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """
+        Returns the statistics of the cache used by ``speval_matrix``
+        """
+        return BasisFunction.__cache.info()
+
+    @staticmethod
+    def cache_clear():
+        """
+        Removes all the stored coefficient tables and resets statistics
+        """
+        BasisFunction.__cache.clear()
+
+    @staticmethod
+    def cache_resize(maxsize: int):
+        """
+        Changes the maximum number of coefficient tables kept in memory
+        """
+        BasisFunction.__cache.maxsize = maxsize
+
     @staticmethod
     def horner_method(coefs: Tuple[float], value: float) -> float:
         """
@@ -789,14 +1702,64 @@ class BasisFunction:
         which
             - m is the number of segments: len(knots)-1
             - j is the requested degree
+
+        The tables are kept in a LRU cache, keyed by the ``token`` of the
+        knotvector, which depends on the type of each knot, and the degree.
+        Use ``cache_info`` and ``cache_clear`` to inspect and reset it.
         """
         knotvector = ImmutableKnotVector(knotvector)
         assert isinstance(reqdegree, int)
         assert 0 <= reqdegree
         maxdegree = knotvector.degree
         assert reqdegree <= maxdegree
+        key = (knotvector.token, reqdegree)
+        matrix = BasisFunction.__cache.get(key)
+        if matrix is None:
+            matrix = BasisFunction.__speval_matrix(knotvector, reqdegree)
+            matrix = tuple(totuple(matrix2d) for matrix2d in matrix)
+            BasisFunction.__cache[key] = matrix
+        return matrix
+
+    @staticmethod
+    def speval_integers(knotvector: ImmutableKnotVector, reqdegree: int):
+        """
+        Returns the coefficients of ``speval_matrix`` with a common
+        denominator for each segment, the pair (denoms, numers) such
+            matrix[z][y][k] = numers[z, y, k] / denoms[z]
+        made by python integers, stored in read-only object arrays.
+        Returns None if some coefficient is not an integer or a Fraction.
+        It shares the cache of ``speval_matrix``
+        """
+        knotvector = ImmutableKnotVector(knotvector)
+        key = (knotvector.token, reqdegree, int)
+        if key in BasisFunction.__cache:
+            return BasisFunction.__cache.get(key)
+        matrix = BasisFunction.speval_matrix(knotvector, reqdegree)
+        matrix = np.array(matrix, dtype="object")
+        result = None
+        if is_exact(matrix.flatten()):
+            denoms = np.empty(len(matrix), dtype="object")
+            numers = np.empty(matrix.shape, dtype="object")
+            for z, matrix2d in enumerate(matrix):
+                coefs = [Fraction(coef) for coef in matrix2d.flatten()]
+                denoms[z] = Math.lcm(*(coef.denominator for coef in coefs))
+                numbs = [
+                    coef.numerator * denoms[z] // coef.denominator for coef in coefs
+                ]
+                numers[z] = np.reshape(np.array(numbs, dtype="object"), matrix2d.shape)
+            denoms.setflags(write=False)
+            numers.setflags(write=False)
+            result = (denoms, numers)
+        BasisFunction.__cache[key] = result
+        return result
+
+    @staticmethod
+    def __speval_matrix(knotvector: ImmutableKnotVector, reqdegree: int):
+        """
+        Private method of speval_matrix, without caching
+        """
         knots = knotvector.knots
-        spans = knotvector.span(knots)
+        spans = knotvector.spans
         j = reqdegree
 
         ninter = len(knots) - 1
@@ -807,10 +1770,12 @@ class BasisFunction:
             return matrix
         matrix_less1 = BasisFunction.speval_matrix(knotvector, j - 1)
         matrix_less1 = np.array(matrix_less1).tolist()
+        exact = number_type(knotvector) is Fraction  # Avoids int / int = float
         for y in range(j):
-            for z, sz in enumerate(spans[:-1]):
+            for z, sz in enumerate(spans):
                 i = y + sz - j + 1
                 denom = knotvector[i + j] - knotvector[i]
+                denom = Fraction(denom) if exact else denom
                 for k in range(j):
                     matrix_less1[z][y][k] /= denom
 
@@ -823,7 +1788,212 @@ class BasisFunction:
                     matrix[z][y][k + 1] += b1 * matrix_less1[z][y][k]
                     matrix[z][y + 1][k] += a0 * matrix_less1[z][y][k]
                     matrix[z][y + 1][k + 1] += a1 * matrix_less1[z][y][k]
-        return totuple(matrix)
+        return matrix
+
+
+class SparseMatrix:
+    """
+    Immutable matrix in the compressed sparse row format (CSR), with
+    float64 or exact (object) values. The line i has only the values
+        M[i, indexs[k]] = values[k]  for pointers[i] <= k < pointers[i+1]
+    It supports
+        * ``M @ P``: the product with an array P of shape (ncols, ...)
+        * ``M @ N``: the composition with another SparseMatrix
+        * ``M.T``: the transpose
+        * ``M[a:b]``: the SparseMatrix with the lines from a to b
+    with costs O(nnz), the number of stored values.
+    Like a nested tuple, ``np.array(M)``, ``len(M)``, ``M[i]`` and the
+    iteration give the dense matrix and its lines.
+
+    Example
+    ------------
+    >>> matrix = SparseMatrix.from_dense([(1, 0, 0), (0, 2, 3)])
+    >>> matrix.nnz
+    3
+    >>> matrix @ np.array([1, 1, 1])
+    array([1, 5], dtype=object)
+    >>> matrix.T.shape
+    (3, 2)
+    """
+
+    def __init__(
+        self,
+        pointers: Tuple[int],
+        indexs: Tuple[int],
+        values: Tuple[float],
+        shape: Tuple[int],
+    ):
+        pointers = np.array(pointers, dtype="int64")
+        indexs = np.array(indexs, dtype="int64")
+        values = np.array(values)
+        dtype = "float64" if values.dtype.kind == "f" else "object"
+        values = values.astype(dtype)
+        nlines, ncols = map(int, shape)
+        assert pointers.shape == (nlines + 1,)
+        assert pointers[0] == 0 and np.all(pointers[:-1] <= pointers[1:])
+        assert indexs.shape == values.shape == (pointers[-1],)
+        assert np.all((0 <= indexs) & (indexs < ncols))
+        for array in (pointers, indexs, values):
+            array.setflags(write=False)
+        self.__pointers = pointers
+        self.__indexs = indexs
+        self.__values = values
+        self.__shape = (nlines, ncols)
+
+    def __repr__(self) -> str:
+        return f"SparseMatrix of shape {self.shape} with {self.nnz} values"
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(self.shape[0]):
+            yield self[i]
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.shape[0])
+            assert step == 1
+            stop = max(start, stop)
+            first, last = self.__pointers[start], self.__pointers[stop]
+            pointers = self.__pointers[start : stop + 1] - first
+            indexs = self.__indexs[first:last]
+            values = self.__values[first:last]
+            return self.__class__(
+                pointers, indexs, values, (stop - start, self.shape[1])
+            )
+        index = int(index)
+        if index < 0:
+            index += self.shape[0]
+        if not 0 <= index < self.shape[0]:
+            raise IndexError(f"Line index out of range for shape {self.shape}")
+        line = np.zeros(self.shape[1], dtype=self.dtype)
+        first, last = self.__pointers[index], self.__pointers[index + 1]
+        line[self.__indexs[first:last]] = self.__values[first:last]
+        return tuple(line.tolist())
+
+    def __array__(self, dtype: Optional[type] = None, copy: Optional[bool] = None):
+        matrix = self.todense()
+        return matrix if dtype is None else matrix.astype(dtype)
+
+    def __matmul__(self, other: Union[SparseMatrix, np.ndarray]):
+        if isinstance(other, SparseMatrix):
+            return self.__compose(other)
+        points = np.asarray(other)
+        assert points.shape[0] == self.shape[1]
+        shape = (-1,) + (1,) * (points.ndim - 1)
+        products = self.__values.reshape(shape) * points[self.__indexs]
+        result = np.zeros((self.shape[0],) + points.shape[1:], dtype=products.dtype)
+        firsts = self.__pointers[:-1]
+        nonempty = firsts < self.__pointers[1:]
+        if len(products):
+            result[nonempty] = np.add.reduceat(products, firsts[nonempty], axis=0)
+        return result
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return self.__shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        The number of stored values
+        """
+        return len(self.__values)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__values.dtype
+
+    @property
+    def T(self) -> SparseMatrix:
+        """
+        The transpose matrix
+        """
+        shape = (self.shape[1], self.shape[0])
+        lines = self.__lines()
+        return SparseMatrix.__from_triplets(self.__indexs, lines, self.__values, shape)
+
+    def __lines(self) -> np.ndarray:
+        """
+        The line of each stored value
+        """
+        counts = np.diff(self.__pointers)
+        return np.repeat(np.arange(self.shape[0]), counts)
+
+    def __compose(self, other: SparseMatrix) -> SparseMatrix:
+        """
+        Computes self @ other, by multiplying each value M[i, j] by
+        the values of the line j of other, then summing by position
+        """
+        assert self.shape[1] == other.shape[0]
+        opointers, oindexs, ovalues = other.__pointers, other.__indexs, other.__values
+        counts = np.diff(opointers)[self.__indexs]
+        cumsum = np.cumsum(counts)
+        positions = np.arange(cumsum[-1] if len(cumsum) else 0)
+        positions -= np.repeat(cumsum - counts, counts)
+        positions += np.repeat(opointers[:-1][self.__indexs], counts)
+        lines = np.repeat(self.__lines(), counts)
+        values = np.repeat(self.__values, counts) * ovalues[positions]
+        shape = (self.shape[0], other.shape[1])
+        return SparseMatrix.__from_triplets(lines, oindexs[positions], values, shape)
+
+    @staticmethod
+    def __from_triplets(
+        lines: np.ndarray, columns: np.ndarray, values: np.ndarray, shape: Tuple[int]
+    ) -> SparseMatrix:
+        """
+        Builds the matrix from the triplets M[lines[k], columns[k]] = values[k]
+        in any order. Repeated positions are summed and zeros are discarded
+        """
+        order = np.lexsort((columns, lines))
+        lines, columns, values = lines[order], columns[order], values[order]
+        if len(values):
+            news = np.ones(len(values), dtype="bool")
+            news[1:] = (lines[1:] != lines[:-1]) | (columns[1:] != columns[:-1])
+            firsts = np.flatnonzero(news)
+            values = np.add.reduceat(values, firsts)
+            lines, columns = lines[firsts], columns[firsts]
+        nonzero = np.array(values != 0, dtype="bool")
+        lines, columns, values = lines[nonzero], columns[nonzero], values[nonzero]
+        pointers = np.zeros(shape[0] + 1, dtype="int64")
+        pointers[1:] = np.cumsum(np.bincount(lines, minlength=shape[0]))
+        return SparseMatrix(pointers, columns, values, shape)
+
+    @staticmethod
+    def from_banded(
+        spans: Tuple[int], values: Tuple[Tuple[float]], ncols: int
+    ) -> SparseMatrix:
+        """
+        Converts the compact banded representation (spans, values),
+        see ``banded_todense``, into a SparseMatrix
+        """
+        values = np.array(values)
+        spans = np.array(spans, dtype="int64")
+        nlines, width = values.shape
+        lines = np.repeat(np.arange(nlines), width)
+        columns = (spans[:, np.newaxis] + np.arange(1 - width, 1)).ravel()
+        values = values.ravel()
+        return SparseMatrix.__from_triplets(lines, columns, values, (nlines, ncols))
+
+    @staticmethod
+    def from_dense(matrix: Tuple[Tuple[float]]) -> SparseMatrix:
+        """
+        Converts a dense matrix, like a nested tuple, into a SparseMatrix
+        """
+        matrix = np.array(matrix)
+        assert matrix.ndim == 2
+        lines, columns = np.nonzero(np.array(matrix != 0, dtype="bool"))
+        values = matrix[lines, columns]
+        return SparseMatrix.__from_triplets(lines, columns, values, matrix.shape)
+
+    def todense(self) -> np.ndarray:
+        """
+        Gives the dense matrix as a numpy array
+        """
+        matrix = np.zeros(self.shape, dtype=self.dtype)
+        matrix[self.__lines(), self.__indexs] = self.__values
+        return matrix
 
 
 class Operations:
@@ -835,7 +2005,29 @@ class Operations:
     * degree decrease
     """
 
-    def split_curve(knotvector: ImmutableKnotVector, nodes: Tuple[float]):
+    __cache = LRUCache(256)
+
+    def cache_info() -> CacheInfo:
+        """
+        Returns the statistics of the cache used by ``matrix_transformation``
+        """
+        return Operations.__cache.info()
+
+    def cache_clear():
+        """
+        Removes all the stored transformation matrices and resets statistics
+        """
+        Operations.__cache.clear()
+
+    def cache_resize(maxsize: int):
+        """
+        Changes the maximum number of transformation matrices kept in memory
+        """
+        Operations.__cache.maxsize = maxsize
+
+    def split_curve(
+        knotvector: ImmutableKnotVector, nodes: Tuple[float]
+    ) -> Tuple[SparseMatrix]:
         """
         Breaks curves in the nodes
 
@@ -849,7 +2041,7 @@ class Operations:
             - nodes: The places to split the curves
 
         # OUTPUT
-            - matrices: (m+1) transformation matrix
+            - matrices: (m+1) transformation SparseMatrix
 
         # Cautions:
             - If the extremities are in nodes, they are ignored
@@ -946,7 +2138,120 @@ class Operations:
             knotvector = knotvector + [node]
         return totuple(matrix)
 
-    def knot_insert(knotvector: ImmutableKnotVector, nodes: Tuple[float]) -> "Matrix2D":
+    def knot_insert_banded(
+        knotvector: ImmutableKnotVector, nodes: Tuple[float]
+    ) -> Tuple[np.ndarray]:
+        """
+        Inserts all the nodes at once by the Oslo algorithm, and returns
+        the matrix of transformation T of control points in the compact
+        form (spans, values), see ``banded_todense``
+            T[j, i] = values[j, i - spans[j] + degree]
+            values.shape = (newnpts, degree + 1)
+
+        Let t be the old knotvector and tau the new one. For each new
+        point j, mu is the index such t[mu] <= tau[j] < t[mu+1], then
+            T[j, mu-degree:mu+1] = R_1(tau[j+1]) @ ... @ R_p(tau[j+p])
+        with R_k(x) a matrix of shape (k, k+1) with two values by line
+            R_k(x)[r, r] = (t[i+k] - x) / (t[i+k] - t[i])
+            R_k(x)[r, r+1] = (x - t[i]) / (t[i+k] - t[i])
+            i = mu - k + 1 + r
+        It costs O(newnpts * degree^2) operations, made over all the
+        lines at once. It's exact for Fractions
+
+        # Caution:
+            - Nodes in extremities are not considered
+        """
+        knotvector = ImmutableKnotVector(knotvector)
+        assert isinstance(nodes, (tuple, list))
+        for node in nodes:
+            float(node)
+            assert knotvector[0] <= node
+            assert node <= knotvector[-1]
+        extremities = (knotvector[0], knotvector[-1])
+        nodes = tuple(node for node in nodes if node not in extremities)
+        newvector = knotvector + nodes if len(nodes) else knotvector
+        degree, oldnpts = knotvector.degree, knotvector.npts
+        newnpts = newvector.npts
+
+        floating = is_float(knotvector, nodes) or number_type(newvector) is int
+        dtype = "float64" if floating else "object"
+        oldknots = np.array(knotvector, dtype=dtype)
+        newknots = np.array(newvector, dtype=dtype)
+        if number_type(newvector) is Fraction:  # Avoids int / int = float
+            oldknots = np.array(tuple(map(Fraction, oldknots)), dtype=dtype)
+            newknots = np.array(tuple(map(Fraction, newknots)), dtype=dtype)
+        spans = [
+            bisect_right(knotvector, newvector[j], degree, oldnpts) - 1
+            for j in range(newnpts)
+        ]
+        spans = np.array(spans, dtype="int64")
+        values = np.ones((newnpts, 1), dtype=dtype)
+        for k in range(1, degree + 1):
+            nodesk = newknots[np.arange(newnpts) + k, np.newaxis]
+            indexs = spans[:, np.newaxis] + np.arange(1 - k, 1)
+            lefts, righs = oldknots[indexs], oldknots[indexs + k]
+            alphas = (nodesk - lefts) / (righs - lefts)
+            newvalues = np.zeros((newnpts, k + 1), dtype=dtype)
+            newvalues[:, :-1] += values * (1 - alphas)
+            newvalues[:, 1:] += values * alphas
+            values = newvalues
+        return spans, values
+
+    def knot_refine(
+        knotvector: ImmutableKnotVector, ctrlpoints: np.ndarray, nodes: Tuple[float]
+    ) -> np.ndarray:
+        """
+        Inserts the nodes and returns directly the new control points,
+        without building the transformation matrix. It's the
+        algorithm A5.4 of the NURBS book, which keeps the control points
+        that don't change and updates only degree points by new node.
+        For rational curves, gives the homogeneous control points.
+            ctrlpoints.shape = (npts, *pointshape)
+            result.shape = (npts + len(nodes), *pointshape)
+
+        # Caution:
+            - The nodes must be inside [umin, umax]
+        """
+        knotvector = ImmutableKnotVector(knotvector)
+        ctrlpoints = np.asarray(ctrlpoints)
+        assert len(ctrlpoints) == knotvector.npts
+        nodes = tuple(sorted(nodes))
+        if len(nodes) == 0:
+            return ctrlpoints.copy()
+        degree, npts = knotvector.degree, knotvector.npts
+        oldvector = tuple(knotvector)
+        lastnode = len(nodes) - 1
+        spana = knotvector.span(nodes[0])
+        spanb = knotvector.span(nodes[-1]) + 1
+        newpoints = np.empty((npts + len(nodes),) + ctrlpoints.shape[1:])
+        newpoints[: spana - degree + 1] = ctrlpoints[: spana - degree + 1]
+        newpoints[spanb + lastnode :] = ctrlpoints[spanb - 1 :]
+        newvector = list(oldvector[: spana + 1])
+        newvector += [None] * (len(nodes) + spanb + degree - spana - 1)
+        newvector += oldvector[spanb + degree :]
+        i, k = spanb + degree - 1, spanb + degree + lastnode
+        for node in nodes[::-1]:
+            while node <= oldvector[i] and i > spana:
+                newpoints[k - degree - 1] = ctrlpoints[i - degree - 1]
+                newvector[k] = oldvector[i]
+                k, i = k - 1, i - 1
+            newpoints[k - degree - 1] = newpoints[k - degree]
+            for ell in range(1, degree + 1):
+                ind = k - degree + ell
+                alpha = newvector[k + ell] - node
+                if alpha == 0:
+                    newpoints[ind - 1] = newpoints[ind]
+                    continue
+                alpha /= newvector[k + ell] - oldvector[i - degree + ell]
+                newpoints[ind - 1] *= alpha
+                newpoints[ind - 1] += (1 - alpha) * newpoints[ind]
+            newvector[k] = node
+            k -= 1
+        return newpoints
+
+    def knot_insert(
+        knotvector: ImmutableKnotVector, nodes: Tuple[float]
+    ) -> SparseMatrix:
         """
         Given the knotvector and a node to be inserted, this function
         returns a matrix of transformation T of control points
@@ -958,28 +2263,135 @@ class Operations:
         This function returns T such
             [Q] = [T] @ [P]
 
+        It's the SparseMatrix version of ``knot_insert_banded``
+
         # Caution:
             - Nodes in extremities are not considered
         """
+        knotvector = ImmutableKnotVector(knotvector)
+        spans, values = Operations.knot_insert_banded(knotvector, nodes)
+        return SparseMatrix.from_banded(spans, values, knotvector.npts)
 
+    def bezier_extraction(knotvector: ImmutableKnotVector) -> Tuple[np.ndarray]:
+        """
+        Gives, for each segment [knots[e], knots[e+1]], the extraction
+        matrix C_e of shape (p+1, p+1) which maps the degree+1 control
+        points of the spline over the segment into the control points
+        of the bezier curve of the same segment
+            Q_e = C_e @ P[connectivity[e]]
+            connectivity[e] = (spans[e] - p, ..., spans[e])
+        It's the transpose of the operator of Borden et al. (2011),
+        which writes the splines in the Bernstein basis B(u):
+            N_e(u) = C_e^T @ B(u)
+        All the matrices are computed by one knot insertion,
+        see ``knot_insert_banded``, which costs O(npts * p^2)
+            operators.shape = (nelems, p+1, p+1)
+            connectivity.shape = (nelems, p+1)
+        """
         knotvector = ImmutableKnotVector(knotvector)
-        assert isinstance(nodes, (tuple, list))
-        for node in nodes:
-            float(node)
-            assert knotvector[0] <= node
-            assert node <= knotvector[-1]
-        nodes = tuple(nodes)
-        setnodes = tuple(sorted(set(nodes) - set([knotvector[0], knotvector[-1]])))
-        oldnpts = knotvector.npts
-        matrix = np.eye(oldnpts, dtype="object")
-        if len(nodes) == 0:
-            return totuple(matrix)
-        for node in setnodes:
-            times = nodes.count(node)
-            incmatrix = Operations.one_knot_insert(knotvector, node, times)
-            matrix = incmatrix @ matrix
-            knotvector = knotvector + times * [node]
-        return totuple(matrix)
+        degree = knotvector.degree
+        knots, mults = knotvector.knots, knotvector.mults
+        nodes = []
+        for knot, mult in zip(knots[1:-1], mults[1:-1]):
+            nodes += max(0, degree - mult) * [knot]
+        spans, values = Operations.knot_insert_banded(knotvector, nodes)
+
+        # Discontinuous knots don't share the bezier point
+        jumps = [int(mult > degree) for mult in mults[1:-1]]
+        nelems = len(knots) - 1
+        starts = degree * np.arange(nelems) + np.cumsum([0] + jumps)
+        elemspans = np.array(knotvector.spans, dtype="int64")
+        lines = starts[:, np.newaxis] + np.arange(degree + 1)
+        shifts = spans[lines] - elemspans[:, np.newaxis]
+        columns = shifts[:, :, np.newaxis] + np.arange(degree + 1)
+        elems, rows, ys = np.nonzero(columns >= 0)
+        operators = np.zeros((nelems, degree + 1, degree + 1), dtype=values.dtype)
+        operators[elems, rows, columns[elems, rows, ys]] = values[
+            lines[elems, rows], ys
+        ]
+        connectivity = elemspans[:, np.newaxis] + np.arange(-degree, 1)
+        return operators, connectivity
+
+    def knot_remove_local(
+        knotvector: Tuple[float],
+        ctrlpoints: np.ndarray,
+        node: float,
+        times: int,
+        tolerance: float,
+    ) -> Tuple[int, np.ndarray, float]:
+        """
+        Tries to remove the node ``times`` times from the knotvector,
+        changing only the degree+1 control points affected by it.
+        It's the algorithm A5.8 of the NURBS book (Tiller): each removal
+        is accepted only if the two ways to compute the new control
+        points are at a distance at most ``tolerance``, which is also
+        a bound of the deviation of the curve. It stops at the first
+        removal not accepted.
+            ctrlpoints.shape = (npts, ndim)
+            newpoints.shape = (npts - removed, ndim)
+        Returns the triplet (removed, newpoints, error) with the
+        greatest distance of the accepted removals.
+        The knotvector is not validated, it can be any sorted sequence,
+        to allow many removals without building new knotvectors
+        """
+        assert isinstance(times, int) and times >= 0
+        vector = knotvector
+        points = np.array(ctrlpoints, dtype="float64")
+        npts = len(points)
+        degree = len(vector) - npts - 1
+        span = bisect_right(vector, node) - 1
+        mult = span + 1 - bisect_left(vector, node)
+        assert 0 < mult and degree < span < npts
+        first, last = span - degree, span - mult
+        temp = np.empty((2 * degree + 2,) + points.shape[1:], dtype="float64")
+        removed, error = 0, 0
+        for removed in range(min(times, mult)):
+            offset = first - 1
+            temp[0] = points[offset]
+            temp[last + 1 - offset] = points[last + 1]
+            i, j = first, last
+            ii, jj = 1, last - offset
+            while j - i > removed:
+                alphai = (node - vector[i]) / (
+                    vector[i + degree + 1 + removed] - vector[i]
+                )
+                alphaj = (node - vector[j - removed]) / (
+                    vector[j + degree + 1] - vector[j - removed]
+                )
+                temp[ii] = (points[i] - (1 - alphai) * temp[ii - 1]) / alphai
+                temp[jj] = (points[j] - alphaj * temp[jj + 1]) / (1 - alphaj)
+                i, ii, j, jj = i + 1, ii + 1, j - 1, jj - 1
+            if j - i < removed:
+                distance = np.linalg.norm(temp[ii - 1] - temp[jj + 1])
+            else:
+                alphai = (node - vector[i]) / (
+                    vector[i + degree + 1 + removed] - vector[i]
+                )
+                guess = alphai * temp[ii + removed + 1] + (1 - alphai) * temp[ii - 1]
+                distance = np.linalg.norm(points[i] - guess)
+            if distance > tolerance:
+                break
+            error = max(error, distance)
+            i, j = first, last
+            while j - i > removed:
+                points[i] = temp[i - offset]
+                points[j] = temp[j - offset]
+                i, j = i + 1, j - 1
+            first, last = first - 1, last + 1
+        else:
+            removed = min(times, mult)
+        if removed == 0:
+            return 0, points, 0
+        j = (2 * span - mult - degree) // 2  # First point out
+        i = j
+        for k in range(1, removed):
+            if k % 2 == 1:
+                i += 1
+            else:
+                j -= 1
+        points = np.concatenate((points[:j], points[i + 1 :]))
+        assert len(points) == npts - removed
+        return removed, points, error
 
     def knot_remove(knotvector: ImmutableKnotVector, nodes: Tuple[float]) -> "Matrix2D":
         """ """
@@ -1030,49 +2442,181 @@ class Operations:
             knotvector = knotvector + knotvector.limits
         return totuple(matrix)
 
-    def degree_increase(knotvector: ImmutableKnotVector, times: int) -> "Matrix2D":
+    def degree_increase_banded(
+        knotvector: ImmutableKnotVector, times: int
+    ) -> Tuple[np.ndarray]:
         """
-        Given a curve A(u) associated with control points P, we want
-        to do a degree elevation
+        Gives the matrix of transformation T of control points of the
+        degree elevation in the compact form (spans, values), see
+        ``banded_todense``. Each new point depends on degree+1 old points
+            T[j, i] = values[j, i - spans[j] + degree]
+            values.shape = (newnpts, degree + 1)
+
+        Let tau be the new knotvector, with each knot repeated times more.
+        By the blossoming, the new point Q_j is given by the blossom F of
+        degree (p+t), which is the average of the blossom f of degree p
+            Q_j = F(tau[j+1], ..., tau[j+p+t])
+            F(u_1, ..., u_{p+t}) = sum_{|S| = p} f(u_S) / binom(p+t, p)
+        with f computed by de Boor's algorithm in a span inside the
+        support of Q_j. The sum over the subsets S is made by
+            D_{k}^{r} = D_{k-1}^{r} + A_r(u_k) @ D_{k-1}^{r-1}
+        with A_r(u) the r-th step of de Boor's algorithm.
+        It costs O(newnpts * (p+t) * p^3) operations, made over all the
+        lines at once. It's exact for Fractions
         """
         knotvector = ImmutableKnotVector(knotvector)
         assert isinstance(times, int)
         assert times >= 0
-        degree = knotvector.degree
-        npts = knotvector.npts
-        if times == 0:
-            return totuple(np.eye(npts, dtype="object"))
-        if degree + 1 == npts:
-            return Operations.degree_increase_bezier(knotvector, times)
-        nodes = knotvector.knots
-        newvectors = knotvector.split(nodes)
-        matrices = Operations.split_curve(knotvector, nodes)
-
-        bigmatrix = []
-        for splitedvector, splitedmatrix in zip(newvectors, matrices):
-            splitedmatrix = np.array(splitedmatrix)
-            elevatedmatrix = Operations.degree_increase_bezier(splitedvector, times)
-            newmatrix = elevatedmatrix @ splitedmatrix
-            for linemat in newmatrix:
-                bigmatrix.append(linemat)
-        bigmatrix = np.array(bigmatrix)
-
-        insertednodes = []
-        for node in nodes:
-            mult = knotvector.mult(node)
-            insertednodes += (degree + 1 - mult) * [node]
-        bigvector = knotvector + insertednodes
-        incbigvector = bigvector + times * nodes
-        removematrix = Operations.knot_remove(incbigvector, insertednodes)
+        degree, npts = knotvector.degree, knotvector.npts
+        newvector = knotvector + times * knotvector.knots
+        newdegree, newnpts = degree + times, newvector.npts
+
+        floating = is_float(knotvector) or number_type(knotvector) is int
+        dtype = "float64" if floating else "object"
+        oldknots = np.array(knotvector, dtype=dtype)
+        newknots = np.array(newvector, dtype=dtype)
+        if number_type(newvector) is Fraction:  # Avoids int / int = float
+            oldknots = np.array(tuple(map(Fraction, oldknots)), dtype=dtype)
+            newknots = np.array(tuple(map(Fraction, newknots)), dtype=dtype)
+        spans = [
+            bisect_right(knotvector, newvector[j], degree, npts) - 1
+            for j in range(newnpts)
+        ]
+        spans = np.clip(spans, degree, npts - 1)
+
+        identity = np.eye(degree + 1, dtype="int64").astype(dtype)
+        coefs = [np.tile(identity, (newnpts, 1, 1))]
+        for r in range(1, degree + 1):
+            coefs.append(np.zeros((newnpts, degree + 1 - r, degree + 1), dtype))
+        for k in range(1, newdegree + 1):
+            nodesk = newknots[np.arange(newnpts) + k, np.newaxis]
+            for r in range(min(k, degree), 0, -1):
+                indexs = spans[:, np.newaxis] + np.arange(r - degree, 1)
+                lefts = oldknots[indexs]
+                righs = oldknots[indexs + degree + 1 - r]
+                alphas = ((nodesk - lefts) / (righs - lefts))[:, :, np.newaxis]
+                coefs[r] += (1 - alphas) * coefs[r - 1][:, :-1]
+                coefs[r] += alphas * coefs[r - 1][:, 1:]
+        denominator = Math.comb(newdegree, degree)
+        if number_type(newvector) is Fraction:
+            denominator = Fraction(denominator)
+        values = coefs[degree][:, 0] / denominator
+        return spans, values
+
+    def degree_increase(knotvector: ImmutableKnotVector, times: int) -> SparseMatrix:
+        """
+        Given a curve A(u) associated with control points P, we want
+        to do a degree elevation, with the new knotvector having
+        each knot repeated ``times`` more.
+
+        It's the SparseMatrix version of ``degree_increase_banded``
+        """
+        knotvector = ImmutableKnotVector(knotvector)
+        spans, values = Operations.degree_increase_banded(knotvector, times)
+        return SparseMatrix.from_banded(spans, values, knotvector.npts)
 
-        bigmatrix = np.array(bigmatrix)
-        removematrix = np.array(removematrix)
-        finalmatrix = removematrix @ bigmatrix
-        return totuple(finalmatrix)
+    def degree_decrease_bezier(ctrlpoints: np.ndarray) -> Tuple[np.ndarray]:
+        """
+        Reduces by one the degree of many bezier curves at once, by the
+        forward and backward recurrences of the NURBS book
+            R_i = (p * P_i - i * R_{i-1}) / (p - i)  for i <= r
+            R_i = (p * P_{i+1} - (p-i-1) * R_{i+1}) / (i + 1)  for i > r
+        with r = (p-1)//2, taking the average of both at r if p is odd.
+        Let Q be the control points of the reduced curve elevated back,
+        by the convex hull property the error is at most max_i |P_i - Q_i|
+            ctrlpoints.shape = (ncurves, p+1, ndim)
+            newpoints.shape = (ncurves, p, ndim)
+            errors.shape = (ncurves, )
+        """
+        points = np.array(ctrlpoints, dtype="float64")
+        ncurves, degree = points.shape[0], points.shape[1] - 1
+        assert degree > 0
+        middle = (degree - 1) // 2
+        newpoints = np.empty((ncurves, degree) + points.shape[2:])
+        newpoints[:, 0] = points[:, 0]
+        for i in range(1, middle + 1):
+            newpoints[:, i] = degree * points[:, i] - i * newpoints[:, i - 1]
+            newpoints[:, i] /= degree - i
+        backward = points[:, degree]
+        for i in range(degree - 1, middle - degree % 2, -1):
+            if i < degree - 1:
+                backward = degree * points[:, i + 1] - (degree - i - 1) * backward
+                backward /= i + 1
+            if i > middle:
+                newpoints[:, i] = backward
+            else:
+                newpoints[:, i] = (newpoints[:, i] + backward) / 2
+
+        shape = (1, degree - 1) + (1,) * (points.ndim - 2)
+        alphas = np.arange(1, degree).reshape(shape) / degree
+        elevated = np.empty(points.shape)
+        elevated[:, 0] = newpoints[:, 0]
+        elevated[:, 1:degree] = alphas * newpoints[:, :-1]
+        elevated[:, 1:degree] += (1 - alphas) * newpoints[:, 1:]
+        elevated[:, degree] = newpoints[:, degree - 1]
+        differences = (points - elevated).reshape((ncurves, degree + 1, -1))
+        errors = np.max(np.linalg.norm(differences, axis=2), axis=1)
+        return newpoints, errors
+
+    def degree_decrease_local(
+        knotvector: ImmutableKnotVector, ctrlpoints: np.ndarray, tolerance: float
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Reduces by one the degree of a clamped spline of degree p >= 2
+        with interior multiplicities at most p. It breaks the curve into
+        bezier segments, reduces each one (``degree_decrease_bezier``)
+        and removes the inserted knots (``knot_remove_local``).
+        The new knotvector is the old one with each knot once less.
+        The returned error is the sum of the error of the bezier reduction
+        and of the knot removals, a bound of the deviation of the curve.
+        If it's bigger than the tolerance, it stops and gives None:
+            ctrlpoints.shape = (npts, ndim)
+            newpoints.shape = (npts - nknots, ndim)
+        Returns the pair (newpoints, error)
+        """
+        knotvector = ImmutableKnotVector(knotvector)
+        points = np.array(ctrlpoints, dtype="float64")
+        assert len(points) == knotvector.npts
+        degree = knotvector.degree
+        knots, mults = knotvector.knots[1:-1], knotvector.mults[1:-1]
+        assert degree > 1
+        assert knotvector.mults[0] == degree + 1 == knotvector.mults[-1]
+        assert all(mult <= degree for mult in mults)
+
+        nodes = []
+        for knot, mult in zip(knots, mults):
+            nodes += (degree - mult) * [knot]
+        points = Operations.knot_refine(knotvector, points, nodes)
+        indexs = degree * np.arange(len(knots) + 1)[:, np.newaxis]
+        indexs = indexs + np.arange(degree + 1)
+        newpoints, errors = Operations.degree_decrease_bezier(points[indexs])
+        error = np.max(errors)
+        if error > tolerance:
+            return None, error
+
+        # Bezier segments of degree p-1 share their extremities
+        lastpoint = newpoints[-1, -1:]
+        newpoints = newpoints[:, :-1].reshape((-1,) + points.shape[1:])
+        newpoints = np.concatenate((newpoints, lastpoint))
+        vector = [knotvector[0]] * degree
+        for knot in knots:
+            vector += [knot] * (degree - 1)
+        vector += [knotvector[-1]] * degree
+        for knot, mult in zip(knots, mults):
+            times = degree - mult
+            removed, newpoints, distance = Operations.knot_remove_local(
+                vector, newpoints, knot, times, tolerance - error
+            )
+            error += removed * distance
+            if removed < times:
+                return None, tolerance + distance
+            for _ in range(removed):
+                vector.remove(knot)
+        return newpoints, error
 
     def matrix_transformation(
         knotvectora: ImmutableKnotVector, knotvectorb: ImmutableKnotVector
-    ):
+    ) -> SparseMatrix:
         """
         Given two curve A(u) and B(u), associated with controlpoints P and Q
         this function returns the transformation matrix T such
@@ -1080,6 +2624,10 @@ class Operations:
         It's only possible when the knotvectorb is a transformation of knotvectora
         by using knot_insertion and degree_increase
 
+        The matrices are kept in a LRU cache, keyed by the ``token`` of
+        both knotvectors. Use ``cache_info`` and ``cache_clear`` to inspect
+        and reset it.
+
         # Caution
             - We suppose the limits of vectors are the same
             - We suppose degreeB >= degreeA
@@ -1087,7 +2635,21 @@ class Operations:
         knotvectora = ImmutableKnotVector(knotvectora)
         knotvectorb = ImmutableKnotVector(knotvectorb)
         assert knotvectora.limits == knotvectorb.limits
-
+        key = (knotvectora.token, knotvectorb.token)
+        matrix = Operations.__cache.get(key)
+        if matrix is None:
+            matrix = Operations.__matrix_transformation(knotvectora, knotvectorb)
+            Operations.__cache[key] = matrix
+        return matrix
+
+    def __matrix_transformation(
+        knotvectora: ImmutableKnotVector, knotvectorb: ImmutableKnotVector
+    ) -> SparseMatrix:
+        """
+        Private and not cached method of ``matrix_transformation``.
+        Elevates the degree and then inserts the missing knots,
+        composing both sparse matrices
+        """
         degreea = knotvectora.degree
         degreeb = knotvectorb.degree
         knotsa = knotvectora.knots
@@ -1100,9 +2662,7 @@ class Operations:
             times = knotvectorb.mult(knot) - knotvectora.mult(knot)
             nodes2ins += times * [knot]
         matrix_knotins = Operations.knot_insert(knotvectora, nodes2ins)
-
-        finalresult = np.array(matrix_knotins) @ matrix_deginc
-        return totuple(finalresult)
+        return matrix_knotins @ matrix_deginc
 
 
 class MathOperations:
@@ -1149,7 +2709,7 @@ class MathOperations:
     @staticmethod
     def add_spline_curve(
         knotvectora: Tuple[float], knotvectorb: Tuple[float]
-    ) -> Tuple["Matrix2D"]:
+    ) -> Tuple[SparseMatrix]:
         """
         Given two spline curves, A(u) and B(u), such
             A(u) = sum_{i=0}^{n} N_i(u) * P_i
@@ -1180,7 +2740,7 @@ class MathOperations:
         knotvectorc = knotvectora | knotvectorb
         matrixa = Operations.matrix_transformation(knotvectora, knotvectorc)
         matrixb = Operations.matrix_transformation(knotvectorb, knotvectorc)
-        return totuple(matrixa), totuple(matrixb)
+        return matrixa, matrixb
 
     @staticmethod
     def mul_spline_curve(
@@ -12,7 +12,7 @@ from typing import Optional, Tuple, Union
 import numpy as np
 
 from compmec.nurbs.__classes__ import Intface_KnotVector
-from compmec.nurbs.heavy import ImmutableKnotVector
+from compmec.nurbs.heavy import ImmutableKnotVector, Operations
 
 
 class KnotVector(Intface_KnotVector):
@@ -427,14 +427,22 @@ class KnotVector(Intface_KnotVector):
         self.internal -= nodes
         return self
 
-    def span(self, nodes: Union[float, Tuple[float]]) -> Union[int, Tuple[int]]:
+    def span(
+        self, nodes: Union[float, Tuple[float]], assume_sorted: bool = False
+    ) -> Union[int, Tuple[int]]:
         """Finds the index position of a ``node`` such
         ``knotvector[span] <= node < knotvector[span+1]``
 
         If ``nodes`` is a vector of numbers, it returns a vector of indexs
 
+        If ``assume_sorted`` is ``True``, the nodes must be in increasing
+        order: all the spans are found by one sweep over the knotvector
+        and only the first and the last nodes are verified
+
         :param nodes: A node to compute the span, or a list of nodes
         :type nodes: float | tuple[float]
+        :param assume_sorted: If the nodes are sorted, defaults to ``False``
+        :type assume_sorted: bool(, optional)
         :raises TypeError: If ``nodes`` is not a list of numbers
         :raises ValueError: If at least one node is outside ``[umin, umax]``
         :return: The index of the node
@@ -454,8 +462,10 @@ class KnotVector(Intface_KnotVector):
         2
         >>> knotvector.span([0, 0.5, 1, 1.5, 2])
         (1, 1, 2, 2, 2)
+        >>> knotvector.span([0, 0.5, 1, 1.5, 2], assume_sorted=True)
+        (1, 1, 2, 2, 2)
         """
-        return self.internal.span(nodes)
+        return self.internal.span(nodes, assume_sorted)
 
     def mult(self, nodes: Union[float, Tuple[float]]) -> Union[int, Tuple[int]]:
         """Counts how many times a node is inside the knotvector
@@ -528,6 +538,35 @@ class KnotVector(Intface_KnotVector):
         vectors = self.internal.split(nodes)
         return tuple(map(self.__class__, vectors))
 
+    def bezier_extraction(self) -> Tuple[np.ndarray]:
+        """Gives the bezier extraction operators of each segment
+
+        For the segment ``e`` between ``knots[e]`` and ``knots[e+1]``,
+        ``operators[e]`` maps the ``degree+1`` control points of indexs
+        ``connectivity[e]`` into the control points of the bezier curve
+        of this segment, the same given by ``Curve.split``
+
+        :return: The pair ``(operators, connectivity)`` of shapes
+            ``(nelems, degree+1, degree+1)`` and ``(nelems, degree+1)``
+        :rtype: tuple[numpy.ndarray]
+
+        Example use
+        -----------
+
+        >>> from compmec.nurbs import KnotVector
+        >>> knotvector = KnotVector([0, 0, 0, 1, 2, 2, 2])
+        >>> operators, connectivity = knotvector.bezier_extraction()
+        >>> operators[0]
+        array([[1. , 0. , 0. ],
+               [0. , 1. , 0. ],
+               [0. , 0.5, 0.5]])
+        >>> connectivity
+        array([[0, 1, 2],
+               [1, 2, 3]])
+
+        """
+        return Operations.bezier_extraction(self.internal)
+
 
 class GeneratorKnotVector:
     """
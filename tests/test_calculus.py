@@ -212,6 +212,53 @@ class TestNumericalDeriv:
                         dnumer /= 2 * deltau
                         assert np.abs(dcurve(node) - dnumer) < 1e-6
 
+    @pytest.mark.order(7)
+    @pytest.mark.dependency(
+        depends=[
+            "TestNumericalDeriv::test_begin",
+            "TestNumericalDeriv::test_spline",
+            "TestNumericalDeriv::test_rationalspline",
+        ]
+    )
+    def test_curve_derivatives(self):
+        for degree in range(0, 4):
+            for npts in range(degree + 1, degree + 3):
+                vector = GeneratorKnotVector.uniform(degree, npts, Fraction)
+                usample = [Fraction(i, 8) for i in range(9)]
+                curve = Curve(vector)
+                curve.ctrlpoints = [Fraction(i * i - 3, 5) for i in range(npts)]
+                curves = [curve, Derivate(curve)]
+                curves.append(Derivate(curves[1]))
+                tests = curve.derivatives(usample, 2)
+                assert len(tests) == 3
+                for testvals, dcurve in zip(tests, curves):
+                    for test, good in zip(testvals, dcurve(usample)):
+                        assert abs(test - good) < 1e-9
+
+                curve.weights = [Fraction(i % 3 + 1) for i in range(npts)]
+                dcurve = Derivate(curve)
+                tests = curve.derivatives(usample, 1)
+                for test, good in zip(tests[0], curve(usample)):
+                    assert test == good
+                for test, good in zip(tests[1], dcurve(usample)):
+                    assert abs(test - good) < 1e-9
+
+                deltau = 1e-6
+                node = float(usample[3])
+                tests = curve.derivatives(node, 2)
+                lefts = curve.derivatives(node - deltau, 1)
+                righs = curve.derivatives(node + deltau, 1)
+                assert abs(tests[1] - dcurve(node)) < 1e-9
+                assert abs(tests[2] - (righs[1] - lefts[1]) / (2 * deltau)) < 1e-6
+
+        curve = Curve(GeneratorKnotVector.uniform(2, 4, Fraction), [1, 2, 0, 1])
+        assert curve.derivatives(Fraction(1, 3), 0) == (curve(Fraction(1, 3)),)
+        assert curve.derivatives(Fraction(1, 3), 5)[3:] == (0, 0, 0)
+        with pytest.raises(ValueError):
+            curve.derivatives(Fraction(1, 3), -1)
+        with pytest.raises(ValueError):
+            curve.derivatives(2, 1)
+
     @pytest.mark.order(7)
     @pytest.mark.dependency(
         depends=[
@@ -220,6 +267,7 @@ class TestNumericalDeriv:
             "TestNumericalDeriv::test_spline",
             "TestNumericalDeriv::test_rationalbezier",
             "TestNumericalDeriv::test_rationalspline",
+            "TestNumericalDeriv::test_curve_derivatives",
         ]
     )
     def test_end(self):
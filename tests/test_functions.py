@@ -772,6 +772,34 @@ class TestOthers:
         assert type(bezier[0](0.5)) is float
         assert type(bezier[1](0.5)) is float
 
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(20)
+    @pytest.mark.dependency(depends=["TestRational::test_creation"])
+    def test_parallel(self):
+        from concurrent.futures import ProcessPoolExecutor
+        from fractions import Fraction as frac
+
+        vector = GeneratorKnotVector.uniform(3, 7, float)
+        function = Function(vector)
+        nodes = np.linspace(0, 1, 129)
+        goodmatrix = np.array(function(nodes))
+        testmatrix = function(nodes, workers=2)
+        np.testing.assert_allclose(testmatrix, goodmatrix, atol=1e-12)
+        assert type(testmatrix[0][0]) is float
+        assert function([], workers=2) == function([])
+
+        function.weights = np.random.uniform(1, 2, function.npts)
+        with ProcessPoolExecutor(2) as executor:
+            for i, j in [(slice(None), 3), (slice(2, 5), 2), (3, 1)]:
+                goodmatrix = np.array(function[i, j](nodes))
+                testmatrix = function[i, j](nodes, executor=executor)
+                np.testing.assert_allclose(testmatrix, goodmatrix, atol=1e-12)
+
+        vector = GeneratorKnotVector.uniform(2, 4, frac)
+        function = Function(vector)  # Not floats: evaluated as usual
+        nodes = [frac(i, 8) for i in range(9)]
+        assert function(nodes, workers=2) == function(nodes)
+
     @pytest.mark.order(3)
     @pytest.mark.dependency(
         depends=[
@@ -779,6 +807,7 @@ class TestOthers:
             "TestOthers::test_specific_cases",
             "TestOthers::test_fail_getitem_index",
             "TestOthers::test_fractions",
+            "TestOthers::test_parallel",
         ]
     )
     def test_end(self):
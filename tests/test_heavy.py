@@ -4,7 +4,26 @@ from fractions import Fraction
 import numpy as np
 import pytest
 
-from compmec.nurbs.heavy import IntegratorArray, LeastSquare, Linalg, Math, NodeSample
+from compmec.nurbs.heavy import (
+    BasisFunction,
+    ImmutableKnotVector,
+    IntegratorArray,
+    LeastSquare,
+    Linalg,
+    LRUCache,
+    Math,
+    MathOperations,
+    NodeSample,
+    Operations,
+    SparseMatrix,
+    banded_dot,
+    banded_gram,
+    banded_todense,
+    eval_spline_banded,
+    eval_spline_nodes,
+    span_segments,
+)
+from compmec.nurbs.knotspace import GeneratorKnotVector
 
 
 @pytest.mark.order(1)
@@ -835,6 +854,407 @@ class TestLeastSquare:
         pass
 
 
+class TestCache:
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["test_begin"])
+    def test_begin(self):
+        pass
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestCache::test_begin"])
+    def test_lrucache(self):
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1
+        cache["c"] = 3  # Discards "b", the least recently used
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        info = cache.info()
+        assert info.hits == 2
+        assert info.misses == 1
+        assert info.maxsize == 2
+        assert info.currsize == 2
+        cache.maxsize = 1
+        assert len(cache) == 1
+        assert "c" in cache
+        cache.clear()
+        assert cache.info() == (0, 0, 1, 0)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(
+        depends=["TestCache::test_begin", "TestCache::test_lrucache"]
+    )
+    def test_speval_matrix(self):
+        BasisFunction.cache_clear()
+        vector = (0, 0, 0, 1, 2, 2, 2)
+        first = BasisFunction.speval_matrix(vector, 2)
+        assert BasisFunction.cache_info().hits == 0
+        second = BasisFunction.speval_matrix(vector, 2)
+        assert second is first
+        assert BasisFunction.cache_info().hits > 0
+        # Same values, but different types must not share the table
+        vector = (0, 0, 0, Fraction(1), 2, 2, 2)
+        third = BasisFunction.speval_matrix(vector, 2)
+        assert third is not first
+        np.testing.assert_allclose(np.array(third, dtype="float64"), first)
+        BasisFunction.cache_clear()
+        assert BasisFunction.cache_info().currsize == 0
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestCache::test_begin"])
+    def test_interning(self):
+        first = ImmutableKnotVector([0, 0, 0, 1, 2, 2, 2])
+        second = ImmutableKnotVector((0, 0, 0, 1, 2, 2, 2))
+        assert second is first
+        assert second.token == first.token
+        assert hash(first) == hash((0, 0, 0, 1, 2, 2, 2))
+        assert ImmutableKnotVector(first) is first
+        # Same values, but different types are different instances
+        third = ImmutableKnotVector([0, 0, 0, Fraction(1), 2, 2, 2])
+        assert third == first
+        assert third is not first
+        assert third.token != first.token
+        assert isinstance(third[3], Fraction)
+        with pytest.raises(ValueError):
+            ImmutableKnotVector([0, 0, 0, 1, 0, 2, 2])
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(
+        depends=["TestCache::test_begin", "TestCache::test_interning"]
+    )
+    def test_matrix_transformation(self):
+        Operations.cache_clear()
+        vectora = (0, 0, 0, 1, 2, 2, 2)
+        vectorb = (0, 0, 0, 0, 1, 1, Fraction(3, 2), 2, 2, 2, 2)
+        first = Operations.matrix_transformation(vectora, vectorb)
+        assert Operations.cache_info().hits == 0
+        assert Operations.matrix_transformation(vectora, vectorb) is first
+        assert Operations.cache_info() == (1, 1, 256, 1)
+        matrixa, matrixb = MathOperations.add_spline_curve(vectora, vectora)
+        assert matrixa is matrixb
+        assert len(matrixa) == len(matrixa[0]) == 4
+        # Same values, but different types must not share the matrix
+        vectora = (0, 0, 0, Fraction(1), 2, 2, 2)
+        second = Operations.matrix_transformation(vectora, vectorb)
+        assert second is not first
+        np.testing.assert_allclose(
+            np.array(second, dtype="float64"), np.array(first, dtype="float64")
+        )
+        Operations.cache_resize(1)
+        assert Operations.cache_info().currsize == 1
+        Operations.cache_resize(256)
+        Operations.cache_clear()
+        assert Operations.cache_info() == (0, 0, 256, 0)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(
+        depends=[
+            "TestCache::test_begin",
+            "TestCache::test_lrucache",
+            "TestCache::test_speval_matrix",
+            "TestCache::test_interning",
+            "TestCache::test_matrix_transformation",
+        ]
+    )
+    def test_end(self):
+        pass
+
+
+class TestEvalSplineNodes:
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["test_begin"])
+    def test_begin(self):
+        pass
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestEvalSplineNodes::test_begin"])
+    def test_float_matches_fraction(self):
+        for degree in range(0, 5):
+            for npts in range(degree + 1, degree + 6):
+                weights = np.random.randint(1, 5, npts - degree)
+                vector = [Fraction(0)] * degree + [Fraction(0)]
+                for weight in weights:
+                    vector.append(vector[-1] + Fraction(int(weight)))
+                vector += [vector[-1]] * degree
+                umax = vector[-1]
+                fracnodes = tuple(Fraction(i, 16) * umax for i in range(17))
+                floatvector = tuple(map(float, vector))
+                floatnodes = tuple(map(float, fracnodes))
+                for reqdegree in range(degree + 1):
+                    good = eval_spline_nodes(vector, fracnodes, reqdegree)
+                    test = eval_spline_nodes(floatvector, floatnodes, reqdegree)
+                    assert isinstance(test, np.ndarray)
+                    assert test.dtype == "float64"
+                    good = np.array(good, dtype="float64")
+                    np.testing.assert_allclose(test, good, atol=1e-12)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestEvalSplineNodes::test_begin"])
+    def test_fraction_stays_exact(self):
+        vector = (0, 0, 0, Fraction(1, 2), 1, 1, 1)
+        nodes = (Fraction(0), Fraction(1, 4), Fraction(3, 4), Fraction(1))
+        matrix = eval_spline_nodes(vector, nodes, 2)
+        for line in matrix:
+            for value in line:
+                assert not isinstance(value, float)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestEvalSplineNodes::test_begin"])
+    def test_fails(self):
+        vector = (0.0, 0.0, 0.5, 1.0, 1.0)
+        with pytest.raises(ValueError):
+            eval_spline_nodes(vector, (-0.5, 0.5), 1)
+        with pytest.raises(ValueError):
+            eval_spline_nodes(vector, (0.5, 1.5), 1)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestEvalSplineNodes::test_begin"])
+    def test_banded(self):
+        vector = (0, 0, 0, Fraction(1, 3), Fraction(1, 2), 1, 1, 1)
+        nodes = tuple(Fraction(i, 8) for i in range(9))
+        npts, nnodes = 5, len(nodes)
+        for knots, points in [
+            (vector, nodes),
+            (tuple(map(float, vector)), tuple(map(float, nodes))),
+        ]:
+            spans, values = eval_spline_banded(knots, points, 2)
+            assert values.shape == (nnodes, 3)
+            dense = banded_todense(spans, values, npts)
+            good = eval_spline_nodes(knots, points, 2)
+            assert np.all(dense.T == np.array(good))
+
+            ctrlpoints = np.arange(2 * npts).reshape((npts, 2))
+            test = banded_dot(spans, values, ctrlpoints)
+            assert np.all(test == np.dot(dense, ctrlpoints))
+
+            weights = tuple(range(1, nnodes + 1))
+            test = banded_gram((spans, values), (spans, values), (npts, npts), weights)
+            good = np.array(np.dot(dense.T * weights, dense), dtype="float64")
+            np.testing.assert_allclose(np.array(test, dtype="float64"), good)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestEvalSplineNodes::test_begin"])
+    def test_exact_integers(self):
+        vector = (0, 0, 0, 0, Fraction(1, 3), Fraction(3, 7), 1, 2, 2, 2, 2)
+        nodes = tuple(Fraction(i, 11) for i in range(23))
+        knots = sorted(set(vector))
+        spans = list(range(3, 7))
+        for degree in range(4):
+            denoms, numers = BasisFunction.speval_integers(vector, degree)
+            matrix3d = BasisFunction.speval_matrix(vector, degree)
+            for z, matrix2d in enumerate(matrix3d):
+                for y, line in enumerate(matrix2d):
+                    for k, coef in enumerate(line):
+                        assert coef == Fraction(numers[z, y, k], denoms[z])
+            with pytest.raises(ValueError):
+                numers[0, 0, 0] = 1
+            with pytest.raises(ValueError):
+                denoms[0] = 1
+
+            nodespans, values = eval_spline_banded(vector, nodes, degree)
+            for node, span, line in zip(nodes, nodespans, values):
+                z = spans.index(span)
+                shifnode = (node - knots[z]) / (knots[z + 1] - knots[z])
+                for y, value in enumerate(line):
+                    coefs = matrix3d[z][y]
+                    assert isinstance(value, Fraction)
+                    assert value == BasisFunction.horner_method(coefs, shifnode)
+
+        floatvector = (0, 0, 0.5, 1, 1)
+        assert BasisFunction.speval_integers(floatvector, 1) is None
+
+        vector = ImmutableKnotVector(vector)
+        nodes += tuple(vector.knots)
+        spans, segments = span_segments(vector, nodes)
+        testspans, testsegs = span_segments(vector, nodes, check=False)
+        np.testing.assert_equal(testspans, spans)
+        np.testing.assert_equal(testsegs, segments)
+        with pytest.raises(ValueError):
+            span_segments(vector, (Fraction(5, 2),))
+        spans, segments = span_segments(vector, (Fraction(5, 2),), check=False)
+        assert tuple(segments) == (len(vector.knots) - 2,)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(
+        depends=[
+            "TestEvalSplineNodes::test_begin",
+            "TestEvalSplineNodes::test_exact_integers",
+            "TestEvalSplineNodes::test_float_matches_fraction",
+            "TestEvalSplineNodes::test_fraction_stays_exact",
+            "TestEvalSplineNodes::test_fails",
+            "TestEvalSplineNodes::test_banded",
+        ]
+    )
+    def test_end(self):
+        pass
+
+
+class TestOperations:
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(depends=["TestEvalSplineNodes::test_end"])
+    def test_begin(self):
+        pass
+
+    @pytest.mark.order(1)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOperations::test_begin"])
+    def test_knot_insert_banded(self):
+        vector = (0, 0, 0, 0, Fraction(1, 3), Fraction(1, 2), 1, 1, 1, 1)
+        nodes = [Fraction(1, 5), Fraction(1, 3), Fraction(1, 2), Fraction(1, 2)]
+        nodes += [Fraction(3, 4), Fraction(3, 4), Fraction(3, 4), 0, 1]
+        newvector = sorted(vector + tuple(nodes[:-2]))
+        spans, values = Operations.knot_insert_banded(vector, nodes)
+        assert values.shape == (len(newvector) - 4, 4)
+        matrix = banded_todense(spans, values, len(vector) - 4)
+        assert np.all(matrix == np.array(Operations.knot_insert(vector, nodes)))
+        usample = tuple(Fraction(i, 12) for i in range(13))
+        oldmatrix = np.array(eval_spline_nodes(vector, usample, 3)).T
+        newmatrix = np.array(eval_spline_nodes(newvector, usample, 3)).T
+        assert np.all(np.dot(newmatrix, matrix) == oldmatrix)
+
+        degree, npts = 3, 1000
+        vector = GeneratorKnotVector.uniform(degree, npts, float)
+        nodes = list(np.random.uniform(0, 1, 200))
+        spans, values = Operations.knot_insert_banded(vector, nodes)
+        assert values.shape == (npts + 200, degree + 1)
+        np.testing.assert_allclose(np.sum(values, axis=1), 1)
+        newvector = tuple(sorted(tuple(vector) + tuple(nodes)))
+        usample = np.linspace(0, 1, 33)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        oldvals = banded_dot(*eval_spline_banded(vector, usample, degree), ctrlpoints)
+        newpoints = banded_dot(spans, values, ctrlpoints)
+        newbanded = eval_spline_banded(newvector, usample, degree)
+        np.testing.assert_allclose(banded_dot(*newbanded, newpoints), oldvals)
+
+    @pytest.mark.order(1)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOperations::test_begin"])
+    def test_degree_increase_banded(self):
+        vector = (0, 0, 0, Fraction(1, 3), Fraction(1, 2), Fraction(1, 2), 1, 1, 1)
+        usample = tuple(Fraction(i, 12) for i in range(13))
+        oldmatrix = np.array(eval_spline_nodes(vector, usample, 2)).T
+        for times in range(4):
+            spans, values = Operations.degree_increase_banded(vector, times)
+            newvector = ImmutableKnotVector(vector)
+            newvector += times * newvector.knots
+            assert values.shape == (newvector.npts, 3)
+            matrix = banded_todense(spans, values, len(vector) - 3)
+            assert np.all(matrix == np.array(Operations.degree_increase(vector, times)))
+            newmatrix = eval_spline_nodes(newvector, usample, 2 + times)
+            newmatrix = np.array(newmatrix).T
+            assert np.all(np.dot(newmatrix, matrix) == oldmatrix)
+
+        degree, npts, times = 3, 1000, 2
+        vector = GeneratorKnotVector.uniform(degree, npts, float)
+        spans, values = Operations.degree_increase_banded(vector, times)
+        np.testing.assert_allclose(np.sum(values, axis=1), 1)
+        newvector = vector + times * vector.knots
+        usample = np.linspace(0, 1, 33)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        oldvals = banded_dot(*eval_spline_banded(vector, usample, degree), ctrlpoints)
+        newpoints = banded_dot(spans, values, ctrlpoints)
+        newbanded = eval_spline_banded(newvector, usample, degree + times)
+        np.testing.assert_allclose(banded_dot(*newbanded, newpoints), oldvals)
+
+    @pytest.mark.order(1)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOperations::test_begin",
+            "TestOperations::test_degree_increase_banded",
+        ]
+    )
+    def test_degree_decrease_local(self):
+        ctrlpoints = [
+            [(0, 0), (2, 2), (4, 2), (6, 0)],
+            [(0, 0), (1, 1), (2, 0), (3, 0)],
+        ]
+        newpoints, errors = Operations.degree_decrease_bezier(ctrlpoints)
+        assert newpoints.shape == (2, 3, 2)
+        np.testing.assert_allclose(newpoints[0], [(0, 0), (3, 3), (6, 0)])
+        np.testing.assert_allclose(errors, [0, 0.5])
+
+        degree, npts = 3, 200
+        vector = GeneratorKnotVector.uniform(degree, npts, float)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        newpoints, error = Operations.degree_decrease_local(vector, ctrlpoints, 1e-9)
+        assert newpoints is None and error > 1e-9
+        spans, values = Operations.degree_increase_banded(vector, 1)
+        points = banded_dot(spans, values, ctrlpoints)
+        newvector = vector + vector.knots
+        newpoints, error = Operations.degree_decrease_local(newvector, points, 1e-9)
+        assert error <= 1e-9
+        np.testing.assert_allclose(newpoints, ctrlpoints)
+
+        vector = GeneratorKnotVector.random(degree, 8, float)
+        ctrlpoints = np.random.uniform(-1, 1, (8, 2))
+        newpoints, error = Operations.degree_decrease_local(vector, ctrlpoints, 1e3)
+        usample = np.linspace(*vector.limits, 257)
+        oldvals = banded_dot(*eval_spline_banded(vector, usample, degree), ctrlpoints)
+        newvector = vector - vector.knots
+        newbanded = eval_spline_banded(newvector, usample, degree - 1)
+        difference = banded_dot(*newbanded, newpoints) - oldvals
+        assert np.max(np.linalg.norm(difference, axis=1)) <= error
+
+    @pytest.mark.order(1)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOperations::test_knot_insert_banded"])
+    def test_sparse_matrix(self):
+        dense = ((1, 0, Fraction(1, 2)), (0, 0, 0), (0, 2, -1), (3, 0, 0))
+        matrix = SparseMatrix.from_dense(dense)
+        assert matrix.shape == (4, 3)
+        assert matrix.nnz == 5
+        assert matrix.dtype == "object"
+        assert tuple(matrix) == dense
+        assert matrix[1] == (0, 0, 0)
+        assert matrix[-1] == dense[-1]
+        assert matrix[-4] == dense[0]
+        with pytest.raises(IndexError):
+            matrix[4]
+        with pytest.raises(IndexError):
+            matrix[-5]
+        assert np.all(np.array(matrix.T) == np.array(dense).T)
+        assert np.all(np.array(matrix[1:3]) == np.array(dense[1:3]))
+        points = np.array([(1, 2), (3, 4), (Fraction(5), 6)])
+        assert np.all(matrix @ points == np.dot(dense, points))
+        assert np.all(np.array(matrix.T @ matrix) == np.dot(np.transpose(dense), dense))
+        with pytest.raises(AssertionError):
+            matrix @ np.ones(4)
+
+        # Compose float matrices of knot insertion, with O(npts * p) values
+        degree, npts = 3, 2000
+        vector = GeneratorKnotVector.uniform(degree, npts, float)
+        nodes = list(np.random.uniform(0, 1, 100))
+        first = Operations.knot_insert(vector, nodes[:50])
+        assert isinstance(first, SparseMatrix)
+        assert first[-1] == tuple(np.array(first)[-1])
+        assert first.dtype == "float64"
+        assert first.nnz <= (npts + 50) * (degree + 1)
+        second = Operations.knot_insert(sorted(list(vector) + nodes[:50]), nodes[50:])
+        composed = second @ first
+        assert composed.shape == (npts + 100, npts)
+        assert composed.nnz <= (npts + 100) * (degree + 1)
+        direct = Operations.knot_insert(vector, nodes)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        np.testing.assert_allclose(composed @ ctrlpoints, direct @ ctrlpoints)
+        np.testing.assert_allclose(second @ (first @ ctrlpoints), direct @ ctrlpoints)
+
+    @pytest.mark.order(1)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOperations::test_begin",
+            "TestOperations::test_knot_insert_banded",
+            "TestOperations::test_degree_increase_banded",
+            "TestOperations::test_degree_decrease_local",
+            "TestOperations::test_sparse_matrix",
+        ]
+    )
+    def test_end(self):
+        pass
+
+
 @pytest.mark.order(1)
 @pytest.mark.dependency(
     depends=[
@@ -843,6 +1263,9 @@ class TestLeastSquare:
         "TestNodeSample::test_end",
         "TestUnidimentionIntegral::test_end",
         "TestLeastSquare::test_end",
+        "TestCache::test_end",
+        "TestEvalSplineNodes::test_end",
+        "TestOperations::test_end",
     ]
 )
 def test_end():
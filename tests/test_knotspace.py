@@ -196,6 +196,27 @@ def test_findspans_array():
     np.testing.assert_equal(suposedspans, correctspans)
 
 
+@pytest.mark.order(2)
+@pytest.mark.timeout(2)
+@pytest.mark.dependency(depends=["test_findspans_array"])
+def test_findspans_sorted():
+    U = KnotVector([0, 0, 0.2, 0.4, 0.5, 0.6, 0.8, 1, 1])
+    array = np.linspace(0, 1, 11)  # (0, 0.1, 0.2, ..., 0.9, 1.0)
+    suposedspans = U.span(array, assume_sorted=True)
+    correctspans = [1, 1, 2, 2, 3, 4, 5, 5, 6, 6, 6]
+    np.testing.assert_equal(suposedspans, correctspans)
+    assert U.span(0.5, assume_sorted=True) == 4
+    assert U.span([], assume_sorted=True) == tuple()
+
+    U = KnotVector([0, 0, 0, 1, 1, 3, 4, 4, 4])
+    array = sorted(np.random.randint(0, 17, 100) / 4)
+    assert U.span(array, assume_sorted=True) == U.span(array)
+    with pytest.raises(ValueError):
+        U.span([-1, 0, 1], assume_sorted=True)
+    with pytest.raises(ValueError):
+        U.span([0, 1, 5], assume_sorted=True)
+
+
 @pytest.mark.order(2)
 @pytest.mark.timeout(2)
 @pytest.mark.dependency(depends=["test_findmult_single"])
@@ -209,6 +230,45 @@ def test_findmult_array():
     np.testing.assert_equal(suposedmults, correctmults)
 
 
+@pytest.mark.order(2)
+@pytest.mark.timeout(4)
+@pytest.mark.dependency(depends=["test_findmult_array", "test_findspans_sorted"])
+def test_large_knotvector():
+    from compmec.nurbs.heavy import ImmutableKnotVector
+
+    vector = ImmutableKnotVector([0, 0, 0, 1, 1, 2, 3, 3, 3])
+    assert vector.knots == (0, 1, 2, 3)
+    assert vector.mults == (3, 2, 1, 3)
+    assert vector.spans == (2, 4, 5)
+    assert vector.limits == (0, 3)
+
+    # Near duplicated knots are distinct, and knots agree with mults
+    vector = ImmutableKnotVector([0, 0, 0, 0.5, 0.5 + 5e-7, 1, 1, 1])
+    assert vector.knots == (0, 0.5, 0.5 + 5e-7, 1)
+    assert vector.mults == (3, 1, 1, 3)
+    assert vector.mult(vector.knots) == vector.mults
+    assert vector.spans == (2, 3, 4)
+    vector = ImmutableKnotVector([0, 0, 0, 0.5, 0.5 + 1e-12, 1, 1, 1])
+    assert vector.knots == (0, 0.5, 1)
+    assert vector.mults == (3, 2, 3)
+    assert vector.mult(vector.knots) == vector.mults
+
+    degree, npts = 3, 50000
+    inner = np.sort(np.random.uniform(0, 1, npts - degree - 1))
+    vector = [0.0] * (degree + 1) + list(inner) + [1.0] * (degree + 1)
+    vector = ImmutableKnotVector(vector)
+    assert vector.npts == npts
+    assert len(vector.knots) == len(vector.spans) + 1
+    assert vector.mults[0] == vector.mults[-1] == degree + 1
+    assert sum(vector.mults) == len(vector)
+    nodes = np.random.uniform(0, 1, 1000)
+    spans = vector.span(nodes)
+    assert spans == tuple(vector.span(node) for node in nodes)
+    assert vector.span(np.sort(nodes), assume_sorted=True) == tuple(sorted(spans))
+    knots = vector.knots[::97]
+    assert vector.mult(knots) == vector.mults[::97]
+
+
 @pytest.mark.order(2)
 @pytest.mark.timeout(4)
 @pytest.mark.dependency(depends=["test_ValuesDegree", "test_ValuesNumberPoints"])
@@ -854,6 +914,35 @@ def test_or_and():
         U1 & U2
 
 
+@pytest.mark.order(2)
+@pytest.mark.timeout(4)
+@pytest.mark.dependency(depends=["test_or_and"])
+def test_or_and_large():
+    from compmec.nurbs.heavy import ImmutableKnotVector
+
+    U1 = ImmutableKnotVector([0, 0, 0, 0.5, 0.5, 1, 1, 1])
+    U2 = ImmutableKnotVector([0, 0, 0, 0.5 + 1e-12, 1, 1, 1])
+    assert U1 | U2 == U1
+    assert U1 & U2 == (0, 0, 0, 0.5, 1, 1, 1)
+    assert len(U1.union(U2, tolerance=0)) == 9
+    assert U1.intersection(U2, tolerance=0) == (0, 0, 0, 1, 1, 1)
+
+    degree, nknots = 3, 10000
+    extremes = [0] * (degree + 1), [1] * (degree + 1)
+    vectors = []
+    for _ in range(2):
+        knots = np.random.choice(range(1, 3 * nknots), nknots, replace=False)
+        knots = np.repeat(np.sort(knots), np.random.randint(1, degree + 1, nknots))
+        vectors.append(extremes[0] + list(knots / (3 * nknots)) + extremes[1])
+    U1, U2 = KnotVector(vectors[0]), KnotVector(vectors[1])
+    union, inter = U1 | U2, U1 & U2
+    for knot in union.knots:
+        assert union.mult(knot) == max(U1.mult(knot), U2.mult(knot))
+    for knot in inter.knots:
+        assert inter.mult(knot) == min(U1.mult(knot), U2.mult(knot))
+    assert len(inter) == sum(map(min, zip(U1.mult(union.knots), U2.mult(union.knots))))
+
+
 @pytest.mark.order(2)
 @pytest.mark.timeout(4)
 @pytest.mark.dependency(
@@ -925,12 +1014,15 @@ def test_fractions():
         "test_findspans_single",
         "test_findmult_single",
         "test_findspans_array",
+        "test_findspans_sorted",
         "test_findmult_array",
+        "test_large_knotvector",
         "TestGenerator::test_end",
         "test_compare_knotvectors_fail",
         "test_insert_knot_remove",
         "test_degree_change",
         "test_or_and",
+        "test_or_and_large",
         "test_others",
         "test_fractions",
     ]
@@ -253,6 +253,10 @@ class TestCircle:
         for point in points:
             dist2 = sum(point**2)
             assert abs(dist2 - 1) < 1e-9
+        compiled = curve.compile()
+        assert np.all(compiled(nodes_sample) == np.array(points))
+        curve.weights = [1, 2, 1]
+        assert curve.compile() is not compiled
 
     @pytest.mark.order(6)
     @pytest.mark.timeout(1)
@@ -315,6 +319,46 @@ class TestCircle:
             dist2 = sum(point**2)
             assert abs(dist2 - 1) < 1e-9
 
+    @pytest.mark.order(6)
+    @pytest.mark.timeout(1)
+    @pytest.mark.dependency(depends=["TestCircle::test_full_circle"])
+    def test_homogeneous(self):
+        knotvector = GeneratorKnotVector.uniform(3, 9, frac)
+        curve = Curve(knotvector)
+        curve.ctrlpoints = [np.array((i, i**2 - 3)) for i in range(9)]
+        curve.weights = [frac(i % 4 + 1, 2) for i in range(9)]
+        numer, denom = curve.fraction()
+        nodes_sample = [frac(i, 32) for i in range(33)]
+        points = curve(nodes_sample)
+        for node, point in zip(nodes_sample, points):
+            assert np.all(point == numer(node) / denom(node))
+
+        nodes_sample = np.linspace(0, 1, 33)
+        points = curve(nodes_sample)
+        goods = np.array(numer(nodes_sample), dtype="float64")
+        goods /= np.array(denom(nodes_sample), dtype="float64")[:, None]
+        np.testing.assert_allclose(np.array(points, dtype="float64"), goods)
+
+    @pytest.mark.order(6)
+    @pytest.mark.timeout(1)
+    @pytest.mark.dependency(depends=["TestCircle::test_homogeneous"])
+    def test_tuple_ctrlpoints(self):
+        ctrlpoints = [(0.0, 1.0), (1.0, 1.0), (1.0, 0.0)]
+        curve = Curve([0, 0, 0, 1, 1, 1.0], ctrlpoints, [1, 2**-0.5, 1])
+        nodes_sample = np.linspace(0, 1, 9)
+        points = np.array(curve(nodes_sample), dtype="float64")
+        np.testing.assert_allclose(np.linalg.norm(points, axis=1), 1)
+        np.testing.assert_allclose(curve.eval([0.5])[0], (2**-0.5, 2**-0.5))
+        compiled = np.array(curve.compile()(nodes_sample), dtype="float64")
+        np.testing.assert_allclose(compiled, points)
+        numer, denom = curve.fraction()
+        goods = np.array(numer(nodes_sample), dtype="float64")
+        goods /= np.array(denom(nodes_sample), dtype="float64")[:, None]
+        np.testing.assert_allclose(goods, points)
+        curve.knot_insert([0.3, 0.3])
+        newpoints = np.array(curve(nodes_sample), dtype="float64")
+        np.testing.assert_allclose(newpoints, points)
+
     @pytest.mark.order(6)
     @pytest.mark.dependency(
         depends=[
@@ -323,6 +367,8 @@ class TestCircle:
             "TestCircle::test_quarter_circle_symmetric",
             "TestCircle::test_half_circle",
             "TestCircle::test_full_circle",
+            "TestCircle::test_homogeneous",
+            "TestCircle::test_tuple_ctrlpoints",
         ]
     )
     def test_end(self):
@@ -3,7 +3,8 @@ from copy import copy
 import numpy as np
 import pytest
 
-from compmec.nurbs.curves import Curve
+from compmec.nurbs import heavy
+from compmec.nurbs.curves import Curve, CurveBatch
 from compmec.nurbs.knotspace import GeneratorKnotVector, KnotVector
 
 
@@ -553,6 +554,91 @@ class TestKnotOperations:
 
             assert curve == Curve(knotvector, ctrlpoints)
 
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(15)
+    @pytest.mark.dependency(
+        depends=[
+            "TestKnotOperations::test_begin",
+            "TestKnotOperations::test_insert_known_case",
+        ]
+    )
+    def test_insert_many_random(self):
+        from fractions import Fraction as frac
+
+        usample = np.linspace(0, 1, 33)
+        for degree in range(0, 5):
+            npts = degree + 50
+            knotvector = GeneratorKnotVector.random(degree, npts, float)
+            knotvector.scale(1 / knotvector[-1])
+            nodes = tuple(np.random.uniform(0, 1, 30))
+            ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+            curve = Curve(knotvector, ctrlpoints)
+            goodvals = curve(usample)
+            matrix = heavy.Operations.knot_insert(knotvector, nodes)
+            curve.knot_insert(nodes)
+            assert curve.npts == npts + 30
+            np.testing.assert_allclose(curve(usample), goodvals, atol=1e-12)
+            np.testing.assert_allclose(curve.ctrlpoints, np.dot(matrix, ctrlpoints))
+
+            weights = np.random.uniform(1, 2, npts)
+            curve = Curve(knotvector, ctrlpoints[:, 0], weights)
+            goodvals = curve(usample)
+            curve.knot_insert(nodes)
+            np.testing.assert_allclose(curve(usample), goodvals, atol=1e-12)
+            np.testing.assert_allclose(curve.weights, np.dot(matrix, weights))
+
+        knotvector = (0, 0, 0, frac(1, 2), 1, 1, 1)
+        ctrlpoints = [frac(1), frac(2), frac(-1), frac(3)]
+        curve = Curve(knotvector, ctrlpoints)
+        curve.knot_insert([frac(1, 4), frac(3, 4)])
+        for point in curve.ctrlpoints:
+            assert isinstance(point, frac)
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(15)
+    @pytest.mark.dependency(
+        depends=[
+            "TestKnotOperations::test_begin",
+            "TestKnotOperations::test_insert_many_random",
+        ]
+    )
+    def test_remove_local(self):
+        degree, npts = 3, 100
+        knotvector = GeneratorKnotVector.uniform(degree, npts, float)
+        umin, umax = knotvector.limits
+        usample = np.linspace(umin, umax, 129)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        weights = np.random.uniform(1, 2, npts)
+        curve = Curve(knotvector, ctrlpoints, weights)
+        goodvals = curve(usample)
+        curve.knot_insert(np.random.uniform(umin, umax, 500))
+        curve.knot_clean()
+        assert curve.knotvector == knotvector
+        np.testing.assert_allclose(curve(usample), goodvals, atol=1e-9)
+
+        vector = tuple(knotvector)
+        node = knotvector.knots[7]
+        removed, points, error = heavy.Operations.knot_remove_local(
+            vector, ctrlpoints, node, 1, 1e-9
+        )
+        assert removed == 0 and error == 0
+        np.testing.assert_equal(points, ctrlpoints)
+        removed, points, error = heavy.Operations.knot_remove_local(
+            vector, ctrlpoints, node, 1, 1e9
+        )
+        assert removed == 1 and points.shape == (npts - 1, 2)
+        curve = Curve(knotvector, ctrlpoints)
+        newcurve = Curve(KnotVector(vector) - [node], points)
+        difference = np.array(curve(usample)) - newcurve(usample)
+        deviation = np.linalg.norm(difference, axis=1)
+        assert np.max(deviation) <= error + 1e-9
+
+        with pytest.raises(ValueError):
+            curve.knot_remove([node])
+        curve = Curve(knotvector, ctrlpoints, weights)
+        with pytest.raises(ValueError, match="with tolerance 0.001$"):
+            curve.knot_remove([node], 1e-3)
+
     @pytest.mark.order(5)
     @pytest.mark.timeout(15)
     @pytest.mark.dependency(
@@ -635,6 +721,8 @@ class TestKnotOperations:
             "TestKnotOperations::test_knotclean",
             "TestKnotOperations::test_knotclean_random",
             "TestKnotOperations::test_somefails",
+            "TestKnotOperations::test_insert_many_random",
+            "TestKnotOperations::test_remove_local",
         ]
     )
     def test_end(self):
@@ -816,6 +904,70 @@ class TestSplitUnite:
         with pytest.raises(ValueError):
             curve1 | curve0
 
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(15)
+    @pytest.mark.dependency(
+        depends=[
+            "TestSplitUnite::test_begin",
+            "TestSplitUnite::test_splitrand_matchboundary",
+        ]
+    )
+    def test_bezier_extraction(self):
+        from fractions import Fraction as frac
+
+        vectors = [
+            (0, 0, 0, 0.2, 0.5, 0.5, 1, 1, 1),
+            (0, 0, 0, 0, 0.5, 0.5, 0.5, 0.5, 1, 1, 1, 1),
+            (0, 0.25, 0.5, 1),
+            (0, 0, 0, 1, 1, 1),
+        ]
+        for vector in vectors:
+            knotvector = KnotVector(vector)
+            ctrlpoints = np.random.uniform(-1, 1, (knotvector.npts, 2))
+            beziers = Curve(knotvector, ctrlpoints).split()
+            operators, connectivity = knotvector.bezier_extraction()
+            assert len(operators) == len(connectivity) == len(beziers)
+            for operator, indexs, bezier in zip(operators, connectivity, beziers):
+                points = operator @ ctrlpoints[indexs]
+                np.testing.assert_allclose(points, bezier.ctrlpoints)
+
+        # Near coincident knots: distinct above the tolerance of 1e-9
+        vectors = [
+            (0, 0, 0, 0.5, 0.5 + 5e-7, 1, 1, 1),
+            (0, 0, 0, 0.5, 0.5 + 1e-12, 1, 1, 1),
+            (0, 0, 0, 0, 0.5, 0.5 + 1e-12, 0.5 + 2e-12, 1, 1, 1, 1),
+        ]
+        nelems = [3, 2, 2]
+        usample = np.linspace(0, 1, 9)
+        for vector, nelem in zip(vectors, nelems):
+            knotvector = KnotVector(vector)
+            degree, knots = knotvector.degree, knotvector.knots
+            operators, connectivity = knotvector.bezier_extraction()
+            assert len(operators) == len(connectivity) == nelem
+            assert sum(knotvector.internal.mults) == len(vector)
+            ctrlpoints = np.random.uniform(-1, 1, (knotvector.npts, 2))
+            curve = Curve(knotvector, ctrlpoints)
+            for z, (operator, indexs) in enumerate(zip(operators, connectivity)):
+                bezier = Curve([0] * (degree + 1) + [1] * (degree + 1))
+                bezier.ctrlpoints = operator @ ctrlpoints[indexs]
+                nodes = knots[z] + usample * (knots[z + 1] - knots[z])
+                np.testing.assert_allclose(
+                    bezier(usample), curve(nodes), atol=1e-9, rtol=0
+                )
+        half, tiny = frac(1, 2), frac(1, 10**12)
+        knotvector = KnotVector([0, 0, 0, half, half + tiny, 1, 1, 1])
+        curve = Curve(knotvector, [frac(i**2) for i in range(5)])
+        for node in (half, half + tiny / 2, half + tiny):
+            assert type(curve(node)) is frac
+            assert abs(curve(node) - 4) < 1e-9
+
+        degree, npts = 3, 10000
+        knotvector = GeneratorKnotVector.uniform(degree, npts, float)
+        operators, connectivity = knotvector.bezier_extraction()
+        assert operators.shape == (npts - degree, degree + 1, degree + 1)
+        assert connectivity.shape == (npts - degree, degree + 1)
+        np.testing.assert_allclose(np.sum(operators, axis=2), 1)
+
     @pytest.mark.order(5)
     @pytest.mark.dependency(
         depends=[
@@ -827,6 +979,7 @@ class TestSplitUnite:
             "TestSplitUnite::test_split_knowncase2",
             "TestSplitUnite::test_unite_knowncase",
             "TestSplitUnite::test_somefails",
+            "TestSplitUnite::test_bezier_extraction",
         ]
     )
     def test_end(self):
@@ -881,6 +1034,47 @@ class TestDegreeOperations:
             assert curve.degree == degree
             np.testing.assert_allclose(curve.ctrlpoints, ctrlpoints)
 
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestDegreeOperations::test_begin"])
+    def test_increase_large(self):
+        degree, npts, times = 3, 2000, 2
+        knotvector = GeneratorKnotVector.uniform(degree, npts, float)
+        usample = np.linspace(*knotvector.limits, 129)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        weights = np.random.uniform(1, 2, npts)
+        curve = Curve(knotvector, ctrlpoints, weights)
+        goodvals = curve(usample)
+        curve.degree_increase(times)
+        assert curve.degree == degree + times
+        assert curve.npts == npts + times * (npts - degree)
+        np.testing.assert_allclose(curve(usample), goodvals)
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestDegreeOperations::test_begin",
+            "TestDegreeOperations::test_increase_large",
+        ]
+    )
+    def test_decrease_large(self):
+        degree, npts = 3, 1000
+        knotvector = GeneratorKnotVector.uniform(degree, npts, float)
+        usample = np.linspace(*knotvector.limits, 129)
+        ctrlpoints = np.random.uniform(-1, 1, (npts, 2))
+        weights = np.random.uniform(1, 2, npts)
+        curve = Curve(knotvector, ctrlpoints, weights)
+        goodvals = curve(usample)
+        curve.degree_increase(2)
+        curve.degree_clean()
+        assert curve.degree == degree
+        assert curve.knotvector == knotvector
+        np.testing.assert_allclose(curve(usample), goodvals)
+        np.testing.assert_allclose(curve.weights, weights)
+        with pytest.raises(ValueError):
+            curve.degree_decrease(1)
+
     @pytest.mark.order(5)
     @pytest.mark.timeout(10)
     @pytest.mark.dependency(
@@ -906,6 +1100,8 @@ class TestDegreeOperations:
         depends=[
             "TestDegreeOperations::test_begin",
             "TestDegreeOperations::test_clean",
+            "TestDegreeOperations::test_increase_large",
+            "TestDegreeOperations::test_decrease_large",
             "TestDegreeOperations::test_fails",
         ]
     )
@@ -978,6 +1174,7 @@ class TestOthers:
         goodvalues = curve(usample)
         for value in goodvalues:
             assert type(value) is frac
+        assert curve.eval(usample, assume_sorted=True) == goodvalues
 
         ninserts = 5
         for i in range(ninserts):
@@ -1004,6 +1201,278 @@ class TestOthers:
         newcurve = num / den
         assert curve == newcurve
 
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOthers::test_begin"])
+    def test_compile(self):
+        from fractions import Fraction as frac
+
+        knotvector = GeneratorKnotVector.random(3, 9)
+        curve = Curve(knotvector)
+        curve.ctrlpoints = np.random.uniform(-1, 1, (curve.npts, 2))
+        usample = np.linspace(knotvector[0], knotvector[-1], 33)
+        evaluator = curve.compile()
+        assert curve.compile() is evaluator
+        np.testing.assert_allclose(evaluator(usample), curve(usample))
+        np.testing.assert_allclose(evaluator(usample[5]), curve(usample[5]))
+
+        curve.knot_insert([usample[5]])  # Changes the knotvector
+        assert curve.compile() is not evaluator
+        evaluator = curve.compile()
+        curve.ctrlpoints = np.random.uniform(-1, 1, (curve.npts, 2))
+        assert curve.compile() is not evaluator
+        np.testing.assert_allclose(curve.compile()(usample), curve(usample))
+
+        knotvector = GeneratorKnotVector.uniform(2, 5, frac)
+        curve = Curve(knotvector, [frac(i**2, 7) for i in range(5)])
+        usample = [frac(i, 16) for i in range(17)]
+        for test, good in zip(curve.compile()(usample), curve(usample)):
+            assert type(test) is frac
+            assert test == good
+
+        with pytest.raises(ValueError):
+            curve.compile()(frac(-1, 2))
+        with pytest.raises(ValueError):
+            Curve(knotvector).compile()
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOthers::test_compile"])
+    def test_iter_eval(self, tmp_path):
+        knotvector = GeneratorKnotVector.uniform(3, 7, float)
+        curve = Curve(knotvector)
+        curve.ctrlpoints = np.random.uniform(-1, 1, (curve.npts, 3))
+        usample = np.linspace(0, 1, 1001)
+        goodvals = np.array(curve(usample))
+
+        chunks = list(curve.iter_eval(usample, chunk_size=100))
+        assert len(chunks) == 11
+        assert chunks[-1].shape == (1, 3)
+        np.testing.assert_allclose(np.concatenate(chunks), goodvals)
+
+        generator = (node for node in usample)
+        chunks = list(curve.iter_eval(generator, chunk_size=300))
+        np.testing.assert_allclose(np.concatenate(chunks), goodvals)
+
+        memmap = np.memmap(tmp_path / "nodes.dat", "float64", "w+", shape=(1001,))
+        memmap[:] = usample
+        out = np.empty((1001, 3))
+        assert curve.eval(memmap, out=out) is out
+        np.testing.assert_allclose(out, goodvals)
+
+        out = np.empty((1001, 3))
+        generator = (node for node in usample)
+        assert curve.eval(generator, out=out) is out
+        np.testing.assert_allclose(out, goodvals)
+        out = np.empty((1001, 3))
+        curve.eval(usample, out=out, assume_sorted=True, check=False)
+        np.testing.assert_allclose(out, goodvals)
+
+        with pytest.raises(ValueError):
+            curve.eval(usample, out=np.empty((10, 3)))
+        with pytest.raises(ValueError):
+            curve.eval(iter(usample), out=np.empty((1002, 3)))
+        with pytest.raises(ValueError):
+            curve.eval([0.5, 1.5], out=np.empty((2, 3)))
+        with pytest.raises(ValueError):
+            list(curve.iter_eval(usample, chunk_size=0))
+        with pytest.raises(ValueError):
+            list(curve.iter_eval([0.5, 1.5]))
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOthers::test_begin"])
+    def test_unchecked(self):
+        from fractions import Fraction as frac
+
+        knotvector = GeneratorKnotVector.random(2, 6)
+        curve = Curve(knotvector, np.random.uniform(-1, 1, (6, 2)))
+        usample = np.linspace(knotvector[0], knotvector[-1], 17)
+        goodvals = curve.eval(usample)
+        testvals = curve.eval(usample, check=False)
+        np.testing.assert_allclose(testvals, goodvals)
+        test = curve.eval(usample[3], check=False)
+        np.testing.assert_allclose(test, goodvals[3])
+
+        knotvector = GeneratorKnotVector.uniform(2, 6, frac)
+        curve = Curve(knotvector, [frac(i, 3) for i in range(6)])
+        curve.weights = [1, 2, 1, 2, 1, 2]
+        usample = [frac(i, 8) for i in range(9)]
+        assert curve.eval(usample, check=False) == curve.eval(usample)
+        # The exact nodes are not verified: no error outside [umin, umax]
+        with pytest.raises(ValueError):
+            curve.eval([frac(1, 2), frac(3, 2)])
+        curve.eval([frac(1, 2), frac(3, 2)], check=False)
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(20)
+    @pytest.mark.dependency(depends=["TestOthers::test_compile"])
+    def test_parallel(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        knotvector = GeneratorKnotVector.uniform(3, 9, float)
+        curve = Curve(knotvector, np.random.uniform(-1, 1, (9, 2)))
+        usample = np.linspace(0, 1, 257)
+        goodvals = np.array(curve(usample))
+        testvals = curve.eval(usample, workers=2)
+        np.testing.assert_allclose(testvals, goodvals, atol=1e-12)
+        out = np.empty((257, 2))
+        assert curve.eval(usample, out=out, workers=2) is out
+        np.testing.assert_allclose(out, goodvals, atol=1e-12)
+        np.testing.assert_allclose(curve.eval(0.5, workers=2), curve(0.5))
+        assert curve.eval([], workers=2) == curve.eval([]) == ()
+
+        curve.weights = np.random.uniform(1, 2, 9)
+        goodvals = np.array(curve(usample))
+        with ProcessPoolExecutor(2) as executor:
+            testvals = curve.eval(usample, executor=executor)
+        np.testing.assert_allclose(testvals, goodvals, atol=1e-12)
+        with pytest.raises(ValueError):
+            curve.eval([0.5, 1.5], workers=2)
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(20)
+    @pytest.mark.dependency(depends=["TestOthers::test_parallel"])
+    def test_parallel_tasks(self):
+        """The tasks carry only the names of the shared memory blocks
+        and the chunk limits, never the knots nor the coefficients"""
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+
+        from compmec.nurbs import heavy
+
+        class RecordExecutor:
+            def __init__(self, executor):
+                self.executor = executor
+                self.tasks = []
+
+            def submit(self, function, *args):
+                self.tasks.append(args)
+                return self.executor.submit(function, *args)
+
+        knotvector = GeneratorKnotVector.uniform(3, 500, float)
+        curve = Curve(knotvector, np.random.uniform(-1, 1, (500, 3)))
+        curve.weights = np.random.uniform(1, 2, 500)
+        usample = np.linspace(0, 1, 1025)
+        goodvals = np.array(curve(usample))
+        with ProcessPoolExecutor(2) as executor:
+            recorder = RecordExecutor(executor)
+            testvals = curve.eval(usample, workers=3, executor=recorder)
+        np.testing.assert_allclose(testvals, goodvals, atol=1e-12)
+        assert len(recorder.tasks) == 12  # 4 * workers
+        for task in recorder.tasks:
+            assert len(pickle.dumps(task)) < 500
+
+        curve.eval(usample, workers=2)
+        pool = heavy._process_pool(2)
+        testvals = curve.eval(usample, workers=2)
+        assert heavy._process_pool(2) is pool
+        np.testing.assert_allclose(testvals, goodvals, atol=1e-12)
+
+    @pytest.mark.order(5)
+    @pytest.mark.dependency(depends=["TestOthers::test_compile"])
+    def test_eval_grid(self):
+        from fractions import Fraction as frac
+
+        for degree in range(6):
+            npts = degree + 4
+            knotvector = GeneratorKnotVector.random(degree, npts, float)
+            curve = Curve(knotvector, np.random.uniform(-1, 1, (npts, 2)))
+            umin, umax = curve.knotvector.limits
+            for nsample in (1, 2, 7, 1000):
+                usample = np.linspace(umin, umax, nsample)
+                goodvals = np.array(curve(usample))
+                testvals = curve.eval_grid(umin, umax, nsample)
+                np.testing.assert_allclose(testvals, goodvals, atol=1e-12)
+            nodes, points = curve.eval_uniform(100)
+            assert len(nodes) == 100 * (len(curve.knots) - 1) + 1
+            np.testing.assert_allclose(points, curve(nodes), atol=1e-12)
+
+        knotvector = GeneratorKnotVector.uniform(3, 7, frac)
+        curve = Curve(knotvector, np.random.uniform(-1, 1, 7))
+        curve.weights = np.random.uniform(1, 2, 7)
+        usample = np.linspace(0.2, 0.7, 51)
+        np.testing.assert_allclose(curve.eval_grid(0.2, 0.7, 51), curve(usample))
+        usample = np.linspace(0.7, 0.1, 61)  # Decreasing nodes
+        np.testing.assert_allclose(curve.eval_grid(0.7, 0.1, 61), curve(usample))
+        compiled = curve.compile()
+        np.testing.assert_allclose(compiled.eval_grid(0.7, 0.1, 61), curve(usample))
+        np.testing.assert_allclose(curve.eval_grid(0.5, 0.5, 3), curve([0.5] * 3))
+        with pytest.raises(ValueError):
+            curve.eval_grid(0, 2, 5)
+        with pytest.raises(ValueError):
+            curve.eval_uniform(0)
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(20)
+    @pytest.mark.dependency(depends=["TestOthers::test_eval_grid"])
+    def test_eval_grid_speed(self):
+        """The forward differences must beat the horner's method
+        of ``CompiledCurve.eval`` over the same nodes"""
+        import time
+
+        def best_time(function, *args):
+            times = []
+            for _ in range(5):
+                start = time.perf_counter()
+                function(*args)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        usample = np.linspace(0, 1, 200000)
+        for npts in (4, 40):  # One bezier segment and 37 spans
+            knotvector = GeneratorKnotVector.uniform(3, npts, float)
+            curve = Curve(knotvector, np.random.uniform(-1, 1, (npts, 3)))
+            compiled = curve.compile()
+            np.testing.assert_allclose(
+                compiled.eval_grid(0, 1, 200000), compiled.eval(usample), atol=1e-12
+            )
+            gridtime = best_time(compiled.eval_grid, 0, 1, 200000)
+            evaltime = best_time(compiled.eval, usample)
+            assert 3 * gridtime < evaltime
+
+    @pytest.mark.order(5)
+    @pytest.mark.dependency(depends=["TestOthers::test_begin"])
+    def test_tessellate(self):
+        def deviation(curve, points):
+            usample = np.linspace(0, 1, 1025)
+            curvepts = np.array(curve(usample))
+            distances = np.full(len(usample), np.inf)
+            for pta, ptb in zip(points[:-1], points[1:]):
+                diffs, chord = curvepts - pta, ptb - pta
+                coefs = np.clip(np.dot(diffs, chord) / np.inner(chord, chord), 0, 1)
+                norms = np.linalg.norm(diffs - np.outer(coefs, chord), axis=1)
+                distances = np.minimum(distances, norms)
+            return np.max(distances)
+
+        knotvector = GeneratorKnotVector.uniform(1, 5)
+        ctrlpoints = np.random.uniform(-1, 1, (5, 2))
+        curve = Curve(knotvector, ctrlpoints)
+        nodes, points = curve.tessellate(1e-6)
+        assert nodes == tuple(curve.knots)
+        np.testing.assert_allclose(points, ctrlpoints)
+
+        knotvector = GeneratorKnotVector.uniform(3, 7, float)
+        curve = Curve(knotvector, np.random.uniform(-1, 1, (7, 2)))
+        for tolerance in (1e-1, 1e-2, 1e-3):
+            nodes, points = curve.tessellate(tolerance)
+            assert nodes[0] == 0 and nodes[-1] == 1
+            assert np.all(np.diff(nodes) > 0)
+            np.testing.assert_allclose(points, curve(nodes))
+            assert deviation(curve, np.array(points)) <= tolerance
+
+        curve.weights = np.random.uniform(1, 3, 7)
+        nodes, points = curve.tessellate(1e-3)
+        np.testing.assert_allclose(points, curve(nodes))
+        assert deviation(curve, np.array(points)) <= 1e-3
+
+        with pytest.raises(ValueError):
+            curve.tessellate(0)
+        with pytest.raises(ValueError):
+            Curve(knotvector).tessellate(1e-3)
+        with pytest.raises(ValueError, match="not reached after 32 subdivisions"):
+            curve.tessellate(1e-300)  # Below the floating-point precision
+
     @pytest.mark.order(5)
     @pytest.mark.dependency(
         depends=[
@@ -1011,6 +1480,115 @@ class TestOthers:
             "TestOthers::test_others",
             "TestOthers::test_fractions",
             "TestOthers::test_fraction_function",
+            "TestOthers::test_compile",
+            "TestOthers::test_iter_eval",
+            "TestOthers::test_unchecked",
+            "TestOthers::test_parallel",
+            "TestOthers::test_parallel_tasks",
+            "TestOthers::test_tessellate",
+            "TestOthers::test_eval_grid",
+            "TestOthers::test_eval_grid_speed",
+        ]
+    )
+    def test_end(self):
+        pass
+
+
+class TestCurveBatch:
+    @pytest.mark.order(5)
+    @pytest.mark.dependency(depends=["test_begin", "TestCallShape::test_end"])
+    def test_begin(self):
+        pass
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestCurveBatch::test_begin"])
+    def test_eval(self):
+        knotvector = GeneratorKnotVector.uniform(3, 8, float)
+        ctrlpoints = np.random.uniform(-1, 1, (5, 8, 2))
+        batch = CurveBatch(knotvector, ctrlpoints)
+        assert len(batch) == 5
+        assert batch.degree == 3
+        assert batch.npts == 8
+        usample = np.linspace(0, 1, 17)
+        result = batch(usample)
+        assert result.shape == (5, 17, 2)
+        for i, curve in enumerate(batch):
+            np.testing.assert_allclose(result[i], curve(usample))
+        np.testing.assert_allclose(batch(0.5), result[:, 8])
+
+        weights = np.random.uniform(1, 2, 8)
+        batch.weights = weights
+        result = batch(usample)
+        for i in range(len(batch)):
+            curve = Curve(knotvector, ctrlpoints[i], weights)
+            np.testing.assert_allclose(result[i], curve(usample))
+
+        curves = [Curve(knotvector, points, weights) for points in ctrlpoints]
+        batch = CurveBatch.stack(curves)
+        np.testing.assert_allclose(batch(usample), result)
+
+        # Same weights as Curve: all negative weights are valid
+        curves = [Curve(knotvector, points, -weights) for points in ctrlpoints]
+        batch = CurveBatch.stack(curves)
+        np.testing.assert_allclose(batch(usample), result)
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestCurveBatch::test_eval"])
+    def test_operations(self):
+        knotvector = GeneratorKnotVector.uniform(2, 6, float)
+        ctrlpoints = np.random.uniform(-1, 1, (4, 6, 3))
+        usample = np.linspace(0, 1, 17)
+        for weights in (None, np.random.uniform(1, 2, 6)):
+            batch = CurveBatch(knotvector, ctrlpoints, weights)
+            goodvals = batch(usample)
+            batch.knot_insert([0.3, 0.7])
+            assert batch.npts == 8
+            np.testing.assert_allclose(batch(usample), goodvals)
+            batch.degree_increase(1)
+            assert batch.degree == 3
+            np.testing.assert_allclose(batch(usample), goodvals)
+            for i, curve in enumerate(batch):
+                good = Curve(knotvector, ctrlpoints[i], weights)
+                good.knot_insert([0.3, 0.7])
+                good.degree_increase(1)
+                assert curve == good
+
+    @pytest.mark.order(5)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestCurveBatch::test_begin"])
+    def test_fails(self):
+        knotvector = GeneratorKnotVector.uniform(2, 4, float)
+        with pytest.raises(ValueError):
+            CurveBatch(knotvector, np.zeros((3, 5)))
+        with pytest.raises(ValueError):
+            CurveBatch(knotvector, np.zeros(4))
+        with pytest.raises(ValueError):
+            CurveBatch(knotvector, np.zeros((3, 4)), [1, 1, 1])
+        with pytest.raises(ValueError):
+            CurveBatch(knotvector, np.zeros((3, 4)), [1, -1, 1, 1])
+        with pytest.raises(ValueError):  # Same verification as Curve
+            Curve(knotvector, [1, 2, 3, 4]).weights = [1, -1, 1, 1]
+        with pytest.raises(ValueError):
+            CurveBatch.stack([])
+        curvea = Curve(knotvector, [1, 2, 3, 4])
+        curveb = Curve(GeneratorKnotVector.uniform(1, 4, float), [1, 2, 3, 4])
+        with pytest.raises(ValueError):
+            CurveBatch.stack([curvea, curveb])
+        batch = CurveBatch(knotvector, np.zeros((3, 4)))
+        with pytest.raises(ValueError):
+            batch(1.5)
+        with pytest.raises(ValueError):
+            batch.degree_increase(0)
+
+    @pytest.mark.order(5)
+    @pytest.mark.dependency(
+        depends=[
+            "TestCurveBatch::test_begin",
+            "TestCurveBatch::test_eval",
+            "TestCurveBatch::test_operations",
+            "TestCurveBatch::test_fails",
         ]
     )
     def test_end(self):
@@ -1028,6 +1606,7 @@ class TestOthers:
         "TestDegreeOperations::test_end",
         "TestSumSubtract::test_end",
         "TestOthers::test_end",
+        "TestCurveBatch::test_end",
     ]
 )
 def test_end():